@@ -0,0 +1,325 @@
+"""
+Numeric kernels for arbitrage evaluation.
+
+All kernels work on flat float64 arrays laid out by selection, with groups
+(event_id + market) described by ``group_start``/``group_len`` offsets into
+those arrays. Callers pass the odds' reciprocals (implied probabilities)
+alongside the odds, computed once per request and shared between kernels.
+When Numba is installed the kernels are JIT-compiled (and cached to disk so
+short-lived workers skip recompilation); otherwise an equivalent NumPy
+implementation is used.
+"""
+from __future__ import annotations
+
+import os
+import threading
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = prange = None
+
+# Below this many groups thread fan-out costs more than it saves
+ARB_PARALLEL_MIN_GROUPS = int(os.getenv("ARB_PARALLEL_MIN_GROUPS", "2048"))
+
+_parallel_lock = threading.Lock()
+
+# Per-thread scratch buffers reused across requests (FastAPI runs sync
+# endpoints on a fixed threadpool). Requests larger than the cap get fresh
+# arrays so one huge batch doesn't pin memory in every worker thread.
+ARENA_MAX_ELEMENTS = int(os.getenv("ARB_ARENA_MAX_ELEMENTS", str(1 << 20)))
+
+_arena = threading.local()
+
+# float32 carries ~7 significant digits; widen the prefilter cut by this much
+# so rounding can never drop a group the float64 pass would keep
+_F32_PREFILTER_MARGIN = 1e-4
+
+
+def _buffer(name: str, size: int) -> np.ndarray:
+    """Thread-local float64 scratch array of ``size`` elements, grown by doubling."""
+    if size > ARENA_MAX_ELEMENTS:
+        return np.empty(size, dtype=np.float64)
+    buf = getattr(_arena, name, None)
+    if buf is None or buf.size < size:
+        buf = np.empty(min(max(size * 2, 64), ARENA_MAX_ELEMENTS), dtype=np.float64)
+        setattr(_arena, name, buf)
+    return buf[:size]
+
+
+def _compute_arb_numpy(
+    odds: np.ndarray,
+    inv_odds: np.ndarray,
+    group_start: np.ndarray,
+    group_len: np.ndarray,
+    total_stake: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    implied = np.add.reduceat(inv_odds, group_start)
+    profit_pct = np.where(implied < 1.0, (1.0 / implied - 1.0) * 100, 0.0)
+
+    total_cents = np.rint(total_stake * 100)
+    raw_cents = np.repeat(total_cents / implied, group_len) * inv_odds
+    cents = np.floor(raw_cents)
+
+    # Largest remainder: hand the cents lost to flooring to the legs with the
+    # biggest fractional parts (first leg wins ties)
+    group_ids = np.repeat(np.arange(len(group_start)), group_len)
+    shortfall = total_cents - np.add.reduceat(cents, group_start)
+    order = np.lexsort((cents - raw_cents, group_ids))
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order)) - np.repeat(group_start, group_len)
+    cents += rank < shortfall[group_ids]
+
+    stakes = cents / 100
+    payouts = stakes * odds
+    return implied, profit_pct, stakes, payouts
+
+
+def _compute_ev_numpy(
+    offered: np.ndarray,
+    row_selection: np.ndarray,
+    inv_best: np.ndarray,
+    group_start: np.ndarray,
+    group_len: np.ndarray,
+    min_ev_pct: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    implied = np.add.reduceat(inv_best, group_start)
+    sel_prob = inv_best / np.repeat(implied, group_len)
+    sel_multi = np.repeat(group_len >= 2, group_len)
+    true_prob = sel_prob[row_selection]
+    ev_pct = (offered * true_prob - 1) * 100
+    hit = sel_multi[row_selection] & (ev_pct >= min_ev_pct)
+    kelly = np.where(hit, np.clip((true_prob * offered - 1) / (offered - 1), 0, 0.25), 0.0)
+    return implied, true_prob, ev_pct, kelly, hit
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True)
+    def _compute_ev_numba(offered, row_selection, inv_best,
+                          group_start, group_len, min_ev_pct,
+                          implied, sel_prob, sel_multi, true_prob, ev_pct, kelly, hit):
+        # One walk per group: its implied sum, then each selection's no-vig
+        # probability while the group's slice is still in cache
+        for g in range(group_start.shape[0]):
+            start = group_start[g]
+            end = start + group_len[g]
+            s = 0.0
+            for k in range(start, end):
+                s += inv_best[k]
+            implied[g] = s
+            for k in range(start, end):
+                sel_prob[k] = inv_best[k] / s
+                sel_multi[k] = group_len[g] >= 2
+
+        # One pass per row: EV%, threshold and Kelly from its selection
+        for i in range(offered.shape[0]):
+            sel = row_selection[i]
+            p = sel_prob[sel]
+            true_prob[i] = p
+            ev = (offered[i] * p - 1.0) * 100
+            ev_pct[i] = ev
+            hit[i] = sel_multi[sel] and ev >= min_ev_pct
+            if hit[i]:
+                k = (p * offered[i] - 1.0) / (offered[i] - 1.0)
+                kelly[i] = min(max(k, 0.0), 0.25)
+            else:
+                kelly[i] = 0.0
+
+    @njit(cache=True, fastmath=True)
+    def _arb_group(g, inv_odds, group_start, group_len, total_stake,
+                   implied, profit_pct, stakes, remainders):
+        start = group_start[g]
+        end = start + group_len[g]
+
+        # Explicit loop: reductions over slices don't vectorize reliably
+        s = 0.0
+        for k in range(start, end):
+            s += inv_odds[k]
+        implied[g] = s
+        profit_pct[g] = (1.0 / s - 1.0) * 100 if s < 1.0 else 0.0
+
+        # Split the total in whole cents so legs sum to it exactly; the
+        # total / implied divisor is loop-invariant, leaving one multiply per leg.
+        # Stakes are left in cents: under fastmath a / 100 here becomes an
+        # inexact * 0.01, so compute_arb converts to dollars outside the kernel
+        total_cents = np.rint(total_stake[g] * 100)
+        target = total_cents / s
+        allocated = 0.0
+        for k in range(start, end):
+            raw = target * inv_odds[k]
+            stakes[k] = np.floor(raw)
+            remainders[k] = raw - stakes[k]
+            allocated += stakes[k]
+
+        # Largest remainder: leftover cents go to the biggest fractions
+        shortfall = int(total_cents - allocated)
+        for _ in range(min(shortfall, end - start)):
+            best = start
+            for k in range(start + 1, end):
+                if remainders[k] > remainders[best]:
+                    best = k
+            stakes[best] += 1.0
+            remainders[best] = -1.0
+
+    @njit(cache=True, fastmath=True)
+    def _compute_arb_numba(inv_odds, group_start, group_len, total_stake,
+                           implied, profit_pct, stakes, remainders):
+        for g in range(group_start.shape[0]):
+            _arb_group(g, inv_odds, group_start, group_len, total_stake,
+                       implied, profit_pct, stakes, remainders)
+
+    # Groups write disjoint slices of the output arrays, so they can run in
+    # any order across threads
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _compute_arb_numba_parallel(inv_odds, group_start, group_len, total_stake,
+                                    implied, profit_pct, stakes, remainders):
+        for g in prange(group_start.shape[0]):
+            _arb_group(g, inv_odds, group_start, group_len, total_stake,
+                       implied, profit_pct, stakes, remainders)
+
+
+def prefilter_groups(
+    inv_odds: np.ndarray,
+    group_start: np.ndarray,
+    max_implied: float,
+) -> np.ndarray:
+    """
+    Indices of groups whose implied sum may be at or below ``max_implied``.
+
+    Runs in float32 (twice the SIMD lanes of float64) as a cheap screen; the
+    surviving groups are re-evaluated exactly by ``compute_arb``.
+    """
+    implied = np.add.reduceat(inv_odds.astype(np.float32), group_start)
+    return np.flatnonzero(implied <= max_implied * (1 + _F32_PREFILTER_MARGIN))
+
+
+def compute_arb(
+    odds: np.ndarray,
+    inv_odds: np.ndarray,
+    group_start: np.ndarray,
+    group_len: np.ndarray,
+    total_stake: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute implied sums, profit % and optimal stakes for every group.
+
+    Stakes are allocated in whole cents (largest-remainder rounding) so each
+    group's legs add up to its total stake exactly; payouts are unrounded.
+
+    Args:
+        odds: Best decimal odds, one per selection, grouped contiguously
+        inv_odds: ``1 / odds``, element for element
+        group_start: Offset of each group's first selection in ``odds``
+        group_len: Number of selections in each group
+        total_stake: Total stake to split across each group's legs
+
+    Returns:
+        (implied_sum[g], profit_pct[g], stake[i], payout[i])
+
+    With Numba the returned arrays are views into per-thread buffers that the
+    next call on the same thread overwrites; copy anything kept past the
+    current request.
+    """
+    if not NUMBA_AVAILABLE:
+        return _compute_arb_numpy(odds, inv_odds, group_start, group_len, total_stake)
+
+    n_groups = group_start.shape[0]
+    implied = _buffer("implied", n_groups)
+    profit_pct = _buffer("profit_pct", n_groups)
+    stakes = _buffer("stakes", odds.shape[0])
+    payouts = _buffer("payouts", odds.shape[0])
+    remainders = _buffer("remainders", odds.shape[0])
+    args = (inv_odds, group_start, group_len, total_stake,
+            implied, profit_pct, stakes, remainders)
+
+    if n_groups >= ARB_PARALLEL_MIN_GROUPS:
+        # Numba's default workqueue threading layer must not be entered from
+        # two threads at once, and FastAPI runs sync endpoints in a threadpool
+        with _parallel_lock:
+            _compute_arb_numba_parallel(*args)
+    else:
+        _compute_arb_numba(*args)
+
+    # Cents to dollars with a true division, so every stake is the nearest
+    # double to a whole-cent amount (same as the NumPy path)
+    np.divide(stakes, 100, out=stakes)
+    np.multiply(stakes, odds, out=payouts)
+    return implied, profit_pct, stakes, payouts
+
+
+def compute_ev(
+    offered: np.ndarray,
+    row_selection: np.ndarray,
+    inv_best: np.ndarray,
+    group_start: np.ndarray,
+    group_len: np.ndarray,
+    min_ev_pct: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Score every offered price against its group's no-vig fair price.
+
+    The vig is removed proportionally: each selection's true probability is
+    its best implied probability divided by the group's implied sum.
+
+    Args:
+        offered: Decimal odds of every row
+        row_selection: Each row's selection, indexing ``inv_best``
+        inv_best: ``1 / best odds`` per selection, grouped contiguously
+        group_start: Offset of each group's first selection in ``inv_best``
+        group_len: Number of selections in each group
+        min_ev_pct: EV% a row needs to be reported
+
+    Returns:
+        (implied_sum[g], true_prob[i], ev_pct[i], kelly[i], hit[i]); ``hit``
+        flags rows in groups with at least two selections that reach
+        ``min_ev_pct``, and ``kelly`` (capped at 0.25) is only set for them.
+        Float outputs share ``compute_arb``'s per-thread buffer caveat.
+    """
+    if not NUMBA_AVAILABLE:
+        return _compute_ev_numpy(
+            offered, row_selection, inv_best, group_start, group_len, min_ev_pct
+        )
+
+    n_rows = offered.shape[0]
+    implied = _buffer("ev_implied", group_start.shape[0])
+    sel_prob = _buffer("sel_prob", inv_best.shape[0])
+    sel_multi = np.empty(inv_best.shape[0], dtype=np.bool_)
+    true_prob = _buffer("true_prob", n_rows)
+    ev_pct = _buffer("ev_pct", n_rows)
+    kelly = _buffer("kelly", n_rows)
+    hit = np.empty(n_rows, dtype=np.bool_)
+    _compute_ev_numba(offered, row_selection, inv_best,
+                      group_start, group_len, float(min_ev_pct),
+                      implied, sel_prob, sel_multi, true_prob, ev_pct, kelly, hit)
+    return implied, true_prob, ev_pct, kelly, hit
+
+
+def warmup() -> None:
+    """
+    Compile every kernel for the argument types ``main`` passes.
+
+    With ``cache=True`` the machine code lands in Numba's on-disk cache, so
+    running this at image build time gives workers ahead-of-time compiled
+    kernels; no-op without Numba.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    odds = np.array([2.1, 2.1, 1.9, 1.9])
+    inv_odds = 1.0 / odds
+    group_start = np.array([0, 2], dtype=np.intp)
+    group_len = np.array([2, 2], dtype=np.intp)
+    total_stake = np.full(2, 100.0)
+
+    compute_arb(odds, inv_odds, group_start, group_len, total_stake)
+    with _parallel_lock:
+        _compute_arb_numba_parallel(
+            inv_odds, group_start, group_len, total_stake,
+            np.empty(2), np.empty(2), np.empty(4), np.empty(4),
+        )
+    compute_ev(odds, np.arange(4), inv_odds, group_start, group_len, 2.0)
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import bisect
+import operator
 import os
 import random
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, Response
 
 from shared.schemas import (
     ArbOpportunity,
@@ -17,6 +25,8 @@ from shared.schemas import (
     PromoConvertResponse,
 )
 
+from .kernels import compute_arb, compute_ev, prefilter_groups
+
 SERVICE_NAME = os.getenv("SERVICE_NAME", "arb_math")
 
 # Tiered alert thresholds (profit percentage)
@@ -33,86 +43,265 @@ STAKE_RANDOMIZATION_PCT = float(os.getenv("STAKE_RANDOMIZATION_PCT", "0.15"))
 # Minimum arb profit threshold — filters out noise / same-book rounding arbs
 MIN_ARB_PROFIT_PCT = float(os.getenv("MIN_ARB_PROFIT_PCT", "0.5"))
 
+# Best-odds memoization — pollers resend mostly unchanged books every few seconds.
+# Only a fraction of misses are admitted so one-off snapshots don't churn the cache.
+BEST_ODDS_CACHE_SIZE = int(os.getenv("BEST_ODDS_CACHE_SIZE", "256"))
+BEST_ODDS_CACHE_ADMIT_RATE = float(os.getenv("BEST_ODDS_CACHE_ADMIT_RATE", "0.3"))
+
+# Rendered responses for identical snapshots re-posted within the TTL
+ARB_RESULT_CACHE_SIZE = int(os.getenv("ARB_RESULT_CACHE_SIZE", "1024"))
+ARB_RESULT_CACHE_TTL_SECONDS = float(os.getenv("ARB_RESULT_CACHE_TTL_SECONDS", "0.5"))
+
 app = FastAPI(title="Arbitrage Math", version="0.1.0")
 
 
+_health_clock: Tuple[int, datetime] = (0, datetime.utcfromtimestamp(0))
+
+
+def _coarse_utcnow() -> datetime:
+    """UTC now at one-second resolution, rebuilt at most once per second."""
+    global _health_clock
+    second = time.time_ns() // 1_000_000_000
+    if second != _health_clock[0]:
+        _health_clock = (second, datetime.utcfromtimestamp(second))
+    return _health_clock[1]
+
+
 @app.get("/health", response_model=HealthResponse)
 def health() -> HealthResponse:
-    return HealthResponse(service=SERVICE_NAME, time_utc=datetime.utcnow())
+    return HealthResponse(service=SERVICE_NAME, time_utc=_coarse_utcnow())
+
+
+# ArbOpportunity field layout for opportunities serialized straight to JSON;
+# values computed here are trusted, so they skip model validation
+_OPPORTUNITY_FIELDS: Dict[str, Any] = {
+    name: None if field.is_required() or field.default_factory else field.default
+    for name, field in ArbOpportunity.model_fields.items()
+}
+
+# One C-level multi-attribute fetch per MarketOdds instead of a LOAD_ATTR per field
+_odds_columns = operator.attrgetter(
+    "event_id", "market", "selection", "bookmaker", "odds_decimal", "line", "market_type"
+)
+_leg_fields = operator.attrgetter("bookmaker", "selection", "sport", "market", "event_id")
+
+# (event_ids, markets, selections, bookmakers, odds_decimal, lines, market_types)
+OddsColumns = Tuple[tuple, tuple, tuple, tuple, np.ndarray, np.ndarray, tuple]
+
+
+_best_odds_cache: "OrderedDict[tuple, Tuple[np.ndarray, ...]]" = OrderedDict()
+_best_odds_cache_lock = threading.Lock()
+_best_odds_cache_admit_credit = 0.0
+
+
+def _unpack(odds: List[MarketOdds]) -> OddsColumns:
+    """
+    Column view of ``odds``, read off the pydantic models once per request.
+
+    Strings stay in tuples (hashable, and they keep their cached hashes);
+    odds and lines become float64 arrays with NaN for a missing line.
+    Everything downstream works on row indices into these columns and only
+    goes back to the MarketOdds objects to build arbitrage legs.
+    """
+    if not odds:
+        empty = np.empty(0, dtype=np.float64)
+        return (), (), (), (), empty, empty, ()
+    event_ids, markets, selections, bookmakers, prices, lines, market_types = zip(
+        *map(_odds_columns, odds)
+    )
+    return (
+        event_ids,
+        markets,
+        selections,
+        bookmakers,
+        np.array(prices, dtype=np.float64),
+        np.array(lines, dtype=np.float64),  # None -> NaN
+        market_types,
+    )
+
+
+def _intern(values: Sequence[str]) -> np.ndarray:
+    """
+    Map strings to small int64 codes numbered in order of first appearance.
+
+    A per-request dict keeps this O(N) with the strings' cached hashes, so
+    everything downstream compares ints instead of strings.
+    """
+    codes: Dict[str, int] = {}
+    intern = codes.setdefault
+    return np.array([intern(value, len(codes)) for value in values], dtype=np.int64)
+
+
+def _segment_starts(sorted_keys: np.ndarray) -> np.ndarray:
+    """Offsets where each run of equal keys begins in a sorted key array."""
+    return np.concatenate(([0], np.flatnonzero(np.diff(sorted_keys)) + 1))
+
+
+def _segment_rows(starts: np.ndarray, lens: np.ndarray) -> np.ndarray:
+    """Flat indices of the segments ``[starts[i], starts[i] + lens[i])``, in order."""
+    packed_starts = np.cumsum(lens) - lens
+    return np.arange(lens.sum()) + np.repeat(starts - packed_starts, lens)
 
 
 def _best_odds_by_selection(
-    odds: List[MarketOdds]
-) -> Dict[str, Tuple[float, MarketOdds]]:
-    """Get best odds for each selection with the full MarketOdds object."""
-    best: Dict[str, Tuple[float, MarketOdds]] = {}
-    for entry in odds:
-        current = best.get(entry.selection)
-        if current is None or entry.odds_decimal > current[0]:
-            best[entry.selection] = (entry.odds_decimal, entry)
-    return best
+    columns: OddsColumns
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Get best odds for each (event_id, market, selection) across all books.
+
+    Works on parallel arrays instead of per-entry dict lookups: rows are
+    sorted once by (event, market, selection, odds desc) so the head of each
+    selection segment is its best price. Groups and selections keep the
+    order in which they first appear in the columns.
+
+    Returns (group_codes, best_odds, best_rows, row_selection). The first
+    three hold one entry per selection, contiguous per group (a group's code
+    is its first row); ``best_rows`` holds the row of each winning price.
+    ``row_selection`` maps every row to its selection's position in those
+    arrays.
+    Results for recurring snapshots are served from a bounded LRU cache.
+    """
+    event_ids, markets, selections, _, prices, _, _ = columns
+    key = (event_ids, markets, selections, prices.tobytes())
+    with _best_odds_cache_lock:
+        cached = _best_odds_cache.get(key)
+        if cached is not None:
+            _best_odds_cache.move_to_end(key)
+            return cached
+
+    result = _group_best_odds(event_ids, markets, selections, prices)
+    _cache_best_odds(key, result)
+    return result
+
+
+def _group_best_odds(
+    event_ids: Sequence[str],
+    markets: Sequence[str],
+    selections: Sequence[str],
+    odds_arr: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized best-odds grouping over (event_id, market, selection, odds) columns."""
+    event_codes = _intern(event_ids)
+    market_codes = _intern(markets)
+    selection_codes = _intern(selections)
+
+    # The only full-size sort. lexsort is stable, so ties keep input order
+    # (first-seen book wins) and each selection segment starts at its best price
+    order = np.lexsort((-odds_arr, selection_codes, market_codes, event_codes))
+    event_sorted = event_codes[order]
+    group_breaks = np.r_[True, (np.diff(event_sorted) != 0) | (np.diff(market_codes[order]) != 0)]
+    sel_breaks = group_breaks | np.r_[True, np.diff(selection_codes[order]) != 0]
+    sel_starts = np.flatnonzero(sel_breaks)
+
+    best_odds = np.maximum.reduceat(odds_arr[order], sel_starts)
+    best_rows = order[sel_starts]
+
+    # Restore first-appearance order of groups and of selections within each
+    # group by re-sorting the (much shorter) per-selection arrays
+    sel_first_row = np.minimum.reduceat(order, sel_starts)
+    sel_group_breaks = group_breaks[sel_starts]
+    group_first_row = np.minimum.reduceat(sel_first_row, np.flatnonzero(sel_group_breaks))
+    sel_group_first = group_first_row[np.cumsum(sel_group_breaks) - 1]
+    sel_order = np.lexsort((sel_first_row, sel_group_first))
+
+    sel_position = np.empty_like(sel_order)
+    sel_position[sel_order] = np.arange(len(sel_order))
+    row_selection = np.empty_like(order)
+    row_selection[order] = sel_position[np.cumsum(sel_breaks) - 1]
+
+    return (
+        sel_group_first[sel_order],
+        best_odds[sel_order],
+        best_rows[sel_order],
+        row_selection,
+    )
+
+
+def _cache_best_odds(
+    key: tuple, result: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+) -> None:
+    """Admit a grouping result to the LRU at BEST_ODDS_CACHE_ADMIT_RATE."""
+    global _best_odds_cache_admit_credit
 
+    if BEST_ODDS_CACHE_SIZE <= 0:
+        return
 
-def _group_key(entry: MarketOdds) -> Tuple[str, str]:
-    return (entry.event_id, entry.market)
+    with _best_odds_cache_lock:
+        # Deterministic credit accumulator instead of random() so the stake
+        # randomization stream is left untouched
+        _best_odds_cache_admit_credit += BEST_ODDS_CACHE_ADMIT_RATE
+        if _best_odds_cache_admit_credit < 1.0:
+            return
+        _best_odds_cache_admit_credit -= 1.0
 
+        for arr in result:
+            arr.flags.writeable = False  # shared across requests
+        _best_odds_cache[key] = result
+        while len(_best_odds_cache) > BEST_ODDS_CACHE_SIZE:
+            _best_odds_cache.popitem(last=False)
 
-def _calculate_profit_percentage(implied_sum: float) -> float:
-    """Calculate profit percentage from implied probability sum."""
-    if implied_sum >= 1.0:
-        return 0.0
-    return ((1.0 / implied_sum) - 1.0) * 100
 
+_random = random.random
 
-def _calculate_stakes(
-    best_by_selection: Dict[str, Tuple[float, MarketOdds]],
-    total_stake: float = 1000.0,
-) -> List[Dict]:
+
+def _stake_totals(n_groups: int, total_stake: float) -> np.ndarray:
     """
-    Calculate optimal stakes for each leg to guarantee profit.
+    Total stake to split across each group's legs.
 
     Applies randomization if RANDOMIZE_STAKES is enabled to prevent detection.
-
-    Returns list of leg dictionaries with:
-    - bookmaker, selection, odds, stake, payout
     """
-    # Apply randomization to total_stake BEFORE calculating legs
+    totals = np.full(n_groups, total_stake, dtype=np.float64)
     if RANDOMIZE_STAKES:
-        variance = random.uniform(-STAKE_RANDOMIZATION_PCT, STAKE_RANDOMIZATION_PCT)
-        total_stake = total_stake * (1 + variance)
+        # Raw random() draws (same stream as random.uniform), scaled to
+        # ±STAKE_RANDOMIZATION_PCT in one array op instead of per call
+        draws = np.fromiter((_random() for _ in range(n_groups)), dtype=np.float64, count=n_groups)
+        variance = (draws * 2.0 - 1.0) * STAKE_RANDOMIZATION_PCT
         # Clamp to min/max bounds
-        total_stake = max(MIN_TOTAL_STAKE, min(MAX_TOTAL_STAKE, total_stake))
+        totals = np.clip(totals * (1 + variance), MIN_TOTAL_STAKE, MAX_TOTAL_STAKE)
+    return totals
 
-    implied_sum = sum(1.0 / odds for odds, _ in best_by_selection.values())
 
-    legs = []
-    for selection, (odds, market_odds) in best_by_selection.items():
-        # Stake = (Total / implied_sum) / odds
-        stake = (total_stake / implied_sum) / odds
-        payout = stake * odds
+def _calculate_stakes(
+    entries: List[MarketOdds],
+    odds: Sequence[float],
+    stakes: Sequence[float],
+    payouts: Sequence[float],
+) -> List[Dict]:
+    """
+    Build leg details for one arb from the kernel's optimal stakes.
+
+    ``entries``, ``odds``, ``stakes`` and ``payouts`` are aligned per leg;
+    stakes and payouts arrive already rounded to cents.
 
-        legs.append({
-            "bookmaker": market_odds.bookmaker,
+    Returns list of leg dictionaries with:
+    - bookmaker, selection, odds, stake, payout
+    """
+    # Legs go straight into their final dict form: orjson serializes dicts
+    # faster than any intermediate (tuples, slotted dataclasses) would save
+    return [
+        {
+            "bookmaker": bookmaker,
             "selection": selection,
-            "odds_decimal": odds,
-            "stake": round(stake, 2),
-            "payout": round(payout, 2),
-            "sport": market_odds.sport,
-            "market": market_odds.market,
-            "event_id": market_odds.event_id,
-        })
+            "odds_decimal": leg_odds,
+            "stake": stake,
+            "payout": payout,
+            "sport": sport,
+            "market": market,
+            "event_id": event_id,
+        }
+        for (bookmaker, selection, sport, market, event_id), leg_odds, stake, payout in zip(
+            map(_leg_fields, entries), odds, stakes, payouts
+        )
+    ]
 
-    return legs
+
+_TIERS = ("info", "lightning", "fire")
 
 
 def _get_tier(profit_pct: float) -> str:
     """Get alert tier based on profit percentage."""
-    if profit_pct >= TIER_FIRE:
-        return "fire"
-    elif profit_pct >= TIER_LIGHTNING:
-        return "lightning"
-    else:
-        return "info"
+    # Each threshold cleared adds one; bools sum as ints
+    return _TIERS[(profit_pct >= TIER_LIGHTNING) + (profit_pct >= TIER_FIRE)]
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -122,26 +311,11 @@ def _get_tier(profit_pct: float) -> str:
 MIN_EV_THRESHOLD = float(os.getenv("MIN_EV_THRESHOLD", "2.0"))  # 2% minimum edge
 
 
-def _calculate_no_vig_probabilities(odds_by_selection: Dict[str, float]) -> Dict[str, float]:
-    """
-    Remove vig from odds to get true probabilities.
-
-    For a 2-way market: implied_sum = 1/odds_a + 1/odds_b (includes vig)
-    True probability = implied_prob / implied_sum (removes vig proportionally)
-    """
-    implied_probs = {sel: 1.0 / odds for sel, odds in odds_by_selection.items()}
-    implied_sum = sum(implied_probs.values())
-
-    if implied_sum == 0:
-        return {}
-
-    return {sel: prob / implied_sum for sel, prob in implied_probs.items()}
-
-
 def _detect_positive_ev(
-    odds_list: List[MarketOdds],
-    min_ev_pct: float = MIN_EV_THRESHOLD,
-) -> List[ArbOpportunity]:
+    columns: OddsColumns,
+    min_ev_pct: float,
+    now: datetime,
+) -> List[Dict[str, Any]]:
     """
     Detect +EV opportunities by comparing offered odds to no-vig fair odds.
 
@@ -151,62 +325,69 @@ def _detect_positive_ev(
     3. Calculate no-vig "true" probabilities from best available odds
     4. Check each individual book's odds against fair odds
     5. If EV% > threshold, flag as +EV opportunity
+
+    Steps 3-5 run in one compiled pass over every row (``compute_ev``);
+    opportunities are only built for rows that clear the threshold, as
+    plain dicts in the ArbOpportunity shape.
     """
-    from collections import defaultdict
-
-    grouped: Dict[Tuple[str, str], List[MarketOdds]] = defaultdict(list)
-    for entry in odds_list:
-        grouped[(entry.event_id, entry.market)].append(entry)
-
-    ev_opportunities: List[ArbOpportunity] = []
-
-    for (event_id, market), group in grouped.items():
-        # Get best odds for each selection (used to derive true probability)
-        best_odds: Dict[str, float] = {}
-        for entry in group:
-            if entry.selection not in best_odds or entry.odds_decimal > best_odds[entry.selection]:
-                best_odds[entry.selection] = entry.odds_decimal
-
-        if len(best_odds) < 2:
-            continue  # Need at least 2 sides for no-vig calculation
-
-        # Calculate true probabilities from best available odds
-        true_probs = _calculate_no_vig_probabilities(best_odds)
-
-        # Check each individual offering for +EV
-        for entry in group:
-            if entry.selection not in true_probs:
-                continue
-
-            true_prob = true_probs[entry.selection]
-            fair_odds = 1.0 / true_prob if true_prob > 0 else float('inf')
-
-            # EV% = (offered_odds / fair_odds - 1) * 100
-            ev_pct = (entry.odds_decimal / fair_odds - 1) * 100
-
-            if ev_pct >= min_ev_pct:
-                # Kelly fraction = (p * odds - 1) / (odds - 1) where p = true_prob
-                kelly = (true_prob * entry.odds_decimal - 1) / (entry.odds_decimal - 1) if entry.odds_decimal > 1 else 0
-                kelly = max(0, min(kelly, 0.25))  # Cap at 25% of bankroll
-
-                ev_opportunities.append(ArbOpportunity(
-                    event_id=event_id,
-                    market=market,
-                    implied_prob_sum=sum(1/o for o in best_odds.values()),
-                    has_arb=False,
-                    opportunity_type="positive_ev",
-                    ev_percentage=round(ev_pct, 2),
-                    true_probability=round(true_prob, 4),
-                    kelly_fraction=round(kelly, 4),
-                    notes=f"📈 +{ev_pct:.1f}% EV on {entry.selection} @ {entry.bookmaker} ({entry.odds_decimal})",
-                    legs=[{
-                        "bookmaker": entry.bookmaker,
-                        "selection": entry.selection,
-                        "odds_decimal": entry.odds_decimal,
-                        "fair_odds": round(fair_odds, 3),
-                        "ev_percentage": round(ev_pct, 2),
-                    }],
-                ))
+    event_ids, markets, selections, bookmakers, offered, _, _ = columns
+    if not event_ids:
+        return []
+
+    group_codes, best_odds, _, row_selection = _best_odds_by_selection(columns)
+    group_starts = _segment_starts(group_codes)
+    group_lens = np.diff(np.r_[group_starts, len(group_codes)])
+    # EV% = (offered_odds / fair_odds - 1) * 100 and Kelly fraction
+    # (p * odds - 1) / (odds - 1), p = true_prob, capped at 25% of bankroll.
+    # Groups need at least 2 sides for the no-vig calculation.
+    implied_sums, true_prob, ev_pct, kelly, hit = compute_ev(
+        offered, row_selection, np.reciprocal(best_odds),
+        group_starts, group_lens, min_ev_pct,
+    )
+
+    hits = np.flatnonzero(hit)
+    if not hits.size:
+        return []
+    # Report groups in first-seen order, rows in input order within a group
+    hits = hits[np.argsort(group_codes[row_selection[hits]], kind="stable")]
+
+    hit_odds = offered[hits]
+    hit_true_prob = true_prob[hits]
+    # Each group's implied sum is computed once by the kernel; rows only gather it
+    hit_groups = np.searchsorted(group_starts, row_selection[hits], side="right") - 1
+
+    ev_opportunities: List[Dict[str, Any]] = []
+    for row, implied_sum, odds_decimal, ev, ev_rounded, prob_rounded, kelly_rounded, fair in zip(
+        hits.tolist(),
+        implied_sums[hit_groups].tolist(),
+        hit_odds.tolist(),
+        ev_pct[hits].tolist(),
+        np.round(ev_pct[hits], 2).tolist(),
+        np.round(hit_true_prob, 4).tolist(),
+        np.round(kelly[hits], 4).tolist(),
+        np.round(1.0 / hit_true_prob, 3).tolist(),
+    ):
+        selection, bookmaker = selections[row], bookmakers[row]
+        ev_opportunities.append(dict(
+            _OPPORTUNITY_FIELDS,
+            event_id=event_ids[row],
+            market=markets[row],
+            implied_prob_sum=implied_sum,
+            detected_at=now,
+            has_arb=False,
+            opportunity_type="positive_ev",
+            ev_percentage=ev_rounded,
+            true_probability=prob_rounded,
+            kelly_fraction=kelly_rounded,
+            notes=f"📈 +{ev:.1f}% EV on {selection} @ {bookmaker} ({odds_decimal})",
+            legs=[{
+                "bookmaker": bookmaker,
+                "selection": selection,
+                "odds_decimal": odds_decimal,
+                "fair_odds": fair,
+                "ev_percentage": ev_rounded,
+            }],
+        ))
 
     return ev_opportunities
 
@@ -215,7 +396,55 @@ def _detect_positive_ev(
 # Middles Detection Functions
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _detect_middles(odds_list: List[MarketOdds]) -> List[ArbOpportunity]:
+def _half_point_lines(lines: np.ndarray) -> Tuple[List[Any], float]:
+    """
+    Comparison keys for betting lines and the factor back to points.
+
+    Lines are almost always whole or half points, so doubling them gives
+    exact ints and middle checks become integer compares. Feeds with other
+    increments (e.g. quarter-goal handicaps) keep their float lines.
+    """
+    doubled = lines * 2
+    if np.array_equal(doubled, np.rint(doubled), equal_nan=True):
+        return np.nan_to_num(doubled).astype(np.int64).tolist(), 0.5
+    return lines.tolist(), 1.0
+
+
+# Side flags for total selections; a selection may carry both
+_SIDE_OVER = 1
+_SIDE_UNDER = 2
+
+# Selection name -> side flags, kept across requests: feeds re-send the same
+# handful of names ("Over 210.5", ...) every snapshot. Reset when it fills.
+_SIDE_CACHE_MAX = 1 << 16
+_selection_side_cache: Dict[str, int] = {}
+
+
+def _selection_side(name: str) -> int:
+    lowered = name.lower()
+    side = ("over" in lowered) * _SIDE_OVER | ("under" in lowered) * _SIDE_UNDER
+    if len(_selection_side_cache) >= _SIDE_CACHE_MAX:
+        _selection_side_cache.clear()
+    _selection_side_cache[name] = side
+    return side
+
+
+def _selection_sides(selections: Sequence[str]) -> np.ndarray:
+    """
+    Over/under flags per row as int8 ``_SIDE_OVER | _SIDE_UNDER`` bits.
+
+    Each name is lowercased and scanned the first time it is seen; after
+    that a row costs one dict lookup.
+    """
+    cached = _selection_side_cache.get
+    return np.array(
+        [_selection_side(name) if (side := cached(name)) is None else side
+         for name in selections],
+        dtype=np.int8,
+    )
+
+
+def _detect_middles(columns: OddsColumns, now: datetime) -> List[Dict[str, Any]]:
     """
     Detect middle opportunities where both sides of a spread/total can win.
 
@@ -223,148 +452,252 @@ def _detect_middles(odds_list: List[MarketOdds]) -> List[ArbOpportunity]:
     - Spread: DK Lakers -3.5 + FD Celtics +5.5 → middle at 4-5 points
     - Total: DK Over 210.5 + FD Under 213.5 → middle at 211-213
     """
-    from collections import defaultdict
+    event_ids, _, selections, bookmakers, prices, lines, market_types = columns
+    if not event_ids:
+        return []
+
+    # Rows on a spread or total with a line (NaN is a missing line)
+    type_codes = _intern(market_types)
+    type_names = list(dict.fromkeys(market_types))
+    middle_types = np.array([name in ("spread", "total") for name in type_names])
+    rows = np.flatnonzero(middle_types[type_codes] & ~np.isnan(lines))
+    if not rows.size:
+        return []
+
+    # Group by event + market_type with one stable sort; rows stay in input
+    # order within a group and groups are visited in first-seen order
+    event_codes = _intern(event_ids)[rows]
+    type_codes = type_codes[rows]
+    order = np.lexsort((type_codes, event_codes))
+    sorted_rows = rows[order]
+    group_starts = np.flatnonzero(np.r_[
+        True, (np.diff(event_codes[order]) != 0) | (np.diff(type_codes[order]) != 0)
+    ])
+    group_ends = np.r_[group_starts[1:], len(sorted_rows)]
+
+    # Low side = favorite (line < 0) or over, high side = underdog (line > 0)
+    # or under. A group can only middle if it has both, so one segmented
+    # reduction over all groups skips the rest before any per-row work.
+    is_spread = np.array([name == "spread" for name in type_names])[type_codes[order]]
+    sorted_lines = lines[sorted_rows]
+    sides = _selection_sides([selections[row] for row in sorted_rows.tolist()])
+    low_side = np.where(is_spread, sorted_lines < 0, (sides & _SIDE_OVER) != 0)
+    high_side = np.where(is_spread, sorted_lines > 0, (sides & _SIDE_UNDER) != 0)
+    viable = (np.logical_or.reduceat(low_side, group_starts)
+              & np.logical_or.reduceat(high_side, group_starts))
+    group_starts, group_ends = group_starts[viable], group_ends[viable]
+    if not group_starts.size:
+        return []
+    group_order = np.argsort(sorted_rows[group_starts], kind="stable")
+
+    sorted_row_list = sorted_rows.tolist()
+    low_list = low_side.tolist()
+    high_list = high_side.tolist()
+    price_values = prices.tolist()
+    line_values = lines.tolist()
+    line_keys, points_per_key = _half_point_lines(lines)
+    middle_opportunities: List[Dict[str, Any]] = []
+
+    for start, end in zip(group_starts[group_order].tolist(), group_ends[group_order].tolist()):
+        group = sorted_row_list[start:end]
+        event_id, market_type = event_ids[group[0]], market_types[group[0]]
+        # Tag each entry with (bookmaker index, position within bookmaker) in
+        # first-seen order; results are reported in that order
+        book_index: Dict[str, int] = {}
+        book_counts: List[int] = []
+        tagged = []
+        for row in group:
+            book = book_index.setdefault(bookmakers[row], len(book_index))
+            if book == len(book_counts):
+                book_counts.append(0)
+            tagged.append((book, book_counts[book], row))
+            book_counts[book] += 1
+
+        if len(book_index) < 2:
+            continue
 
-    # Group by event + market_type (spread or total)
-    grouped: Dict[Tuple[str, str], List[MarketOdds]] = defaultdict(list)
-    for entry in odds_list:
-        if entry.market_type in ("spread", "total") and entry.line is not None:
-            grouped[(entry.event_id, entry.market_type)].append(entry)
+        # Favorite -L1 and underdog +L2 middle when -L1 + L2 > 0; keying
+        # favorites by -line makes that the same "low < high" test as
+        # Over L1 / Under L2 with L1 < L2
+        sign = -1 if market_type == "spread" else 1
+        lows = [(sign * line_keys[t[2]], t) for t, is_low in zip(tagged, low_list[start:end]) if is_low]
+        highs = [(line_keys[t[2]], t) for t, is_high in zip(tagged, high_list[start:end]) if is_high]
+
+        for low_key, high_key, low, high, first, second in _middle_pairs(lows, highs):
+            legs = [
+                {
+                    "bookmaker": bookmakers[row],
+                    "selection": selections[row],
+                    "odds_decimal": price_values[row],
+                    "line": line_values[row],
+                }
+                for row in (first, second)
+            ]
+            middle_opportunities.append(_middle_opportunity(
+                event_id,
+                market_type,
+                now,
+                line_values[low],
+                line_values[high],
+                (high_key - low_key) * points_per_key,
+                legs,
+            ))
 
-    middle_opportunities: List[ArbOpportunity] = []
+    return middle_opportunities
 
-    for (event_id, market_type), group in grouped.items():
-        # Separate by bookmaker
-        by_book: Dict[str, List[MarketOdds]] = defaultdict(list)
-        for entry in group:
-            by_book[entry.bookmaker].append(entry)
 
-        bookmakers = list(by_book.keys())
-        if len(bookmakers) < 2:
-            continue
+def _middle_pairs(
+    lows: List[Tuple[Any, tuple]],
+    highs: List[Tuple[Any, tuple]],
+) -> List[tuple]:
+    """
+    Match every low-side entry with the high-side entries whose key is
+    strictly greater, across different bookmakers.
 
-        # Check each pair of bookmakers for middles
-        for i, book1 in enumerate(bookmakers):
-            for book2 in bookmakers[i+1:]:
-                _check_middle_pair(
-                    by_book[book1], by_book[book2],
-                    event_id, market_type, middle_opportunities
-                )
+    Entries are (key, (bookmaker index, position, row)). Returns
+    (low_key, high_key, low_row, high_row, first_row, second_row) per pair.
 
-    return middle_opportunities
+    Sorting the high side once and binary-searching it makes this
+    O(L log L + M) for M middles instead of scanning every bookmaker pair.
+    Pairs are returned in bookmaker-pair order (earlier bookmaker's leg
+    first), matching a nested scan over bookmakers and their entries.
+    """
+    if not lows or not highs:
+        return []
+
+    highs = sorted(highs, key=operator.itemgetter(0))
+    high_keys = [key for key, _ in highs]
 
+    pairs = []
+    for low_key, low in lows:
+        for high_key, high in highs[bisect.bisect_right(high_keys, low_key):]:
+            if low[0] == high[0]:
+                continue  # same bookmaker
+            first, second = (low, high) if low[0] < high[0] else (high, low)
+            pairs.append(((first[0], second[0], first[1], second[1]),
+                          low_key, high_key, low[2], high[2], first[2], second[2]))
+    pairs.sort(key=operator.itemgetter(0))
+    return [pair[1:] for pair in pairs]
 
-def _check_middle_pair(
-    book1_odds: List[MarketOdds],
-    book2_odds: List[MarketOdds],
+
+def _middle_opportunity(
     event_id: str,
     market_type: str,
-    results: List[ArbOpportunity],
-) -> None:
-    """Check a pair of bookmakers for middle opportunities."""
-    for o1 in book1_odds:
-        for o2 in book2_odds:
-            if o1.line is None or o2.line is None:
-                continue
-
-            middle_gap = None
-            middle_range = None
-
-            if market_type == "spread":
-                # For spreads: middle exists if lines don't overlap
-                # e.g., Team A -3.5 (line=-3.5) vs Team B +5.5 (line=+5.5)
-                # Middle if abs(line1) < abs(line2) and opposite signs
-                if o1.line < 0 and o2.line > 0:  # o1 is favorite spread, o2 is underdog spread
-                    if abs(o1.line) < o2.line:
-                        middle_gap = o2.line - abs(o1.line)
-                        low = int(abs(o1.line)) + 1
-                        high = int(o2.line)
-                        middle_range = f"{low}-{high} points"
-                elif o1.line > 0 and o2.line < 0:  # opposite
-                    if o1.line > abs(o2.line):
-                        middle_gap = o1.line - abs(o2.line)
-                        low = int(abs(o2.line)) + 1
-                        high = int(o1.line)
-                        middle_range = f"{low}-{high} points"
-
-            elif market_type == "total":
-                # For totals: middle exists if over line < under line
-                is_over_1 = "over" in o1.selection.lower()
-                is_under_2 = "under" in o2.selection.lower()
-
-                if is_over_1 and is_under_2 and o1.line < o2.line:
-                    middle_gap = o2.line - o1.line
-                    middle_range = f"{o1.line + 0.5:.1f}-{o2.line - 0.5:.1f}"
-                elif "under" in o1.selection.lower() and "over" in o2.selection.lower() and o2.line < o1.line:
-                    middle_gap = o1.line - o2.line
-                    middle_range = f"{o2.line + 0.5:.1f}-{o1.line - 0.5:.1f}"
-
-            if middle_gap and middle_gap > 0:
-                # Estimate probability of hitting middle (rough approximation)
-                middle_prob = min(0.15, middle_gap * 0.03)  # ~3% per point of gap
-
-                results.append(ArbOpportunity(
-                    event_id=event_id,
-                    market=f"{market_type}_middle",
-                    implied_prob_sum=1.0,
-                    has_arb=False,
-                    opportunity_type="middle",
-                    middle_range=middle_range,
-                    middle_gap=round(middle_gap, 1),
-                    middle_probability=round(middle_prob, 3),
-                    notes=f"🎯 Middle: {middle_range} ({middle_gap:.1f}pt gap, ~{middle_prob*100:.0f}% hit rate)",
-                    legs=[
-                        {"bookmaker": o1.bookmaker, "selection": o1.selection, "odds_decimal": o1.odds_decimal, "line": o1.line},
-                        {"bookmaker": o2.bookmaker, "selection": o2.selection, "odds_decimal": o2.odds_decimal, "line": o2.line},
-                    ],
-                ))
-
-
-@app.post("/arbitrage", response_model=ArbResponse)
-def evaluate_arbitrage(
-    payload: ArbRequest,
-    min_profit_pct: Optional[float] = None,
-    total_stake: float = MAX_TOTAL_STAKE,  # Use configured max stake
-) -> ArbResponse:
+    now: datetime,
+    low_line: float,
+    high_line: float,
+    middle_gap: float,
+    legs: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Build a middle from the low-side (favorite/over) and high-side (underdog/under) lines."""
+    if market_type == "spread":
+        middle_range = f"{int(abs(low_line)) + 1}-{int(high_line)} points"
+    else:
+        middle_range = f"{low_line + 0.5:.1f}-{high_line - 0.5:.1f}"
+
+    # Estimate probability of hitting middle (rough approximation)
+    middle_prob = min(0.15, middle_gap * 0.03)  # ~3% per point of gap
+
+    return dict(
+        _OPPORTUNITY_FIELDS,
+        event_id=event_id,
+        market=f"{market_type}_middle",
+        implied_prob_sum=1.0,
+        detected_at=now,
+        has_arb=False,
+        opportunity_type="middle",
+        middle_range=middle_range,
+        middle_gap=round(middle_gap, 1),
+        middle_probability=round(middle_prob, 3),
+        notes=f"🎯 Middle: {middle_range} ({middle_gap:.1f}pt gap, ~{middle_prob*100:.0f}% hit rate)",
+        legs=legs,
+    )
+
+
+def _arbitrage_opportunities(
+    odds: List[MarketOdds],
+    columns: OddsColumns,
+    min_profit_pct: Optional[float],
+    total_stake: float,
+    now: datetime,
+) -> List[Dict[str, Any]]:
     """
-    Evaluate arbitrage opportunities with enhanced details.
+    Evaluate every (event_id, market) group in ``odds`` for arbitrage.
 
-    Args:
-        payload: ArbRequest with list of odds
-        min_profit_pct: Optional minimum profit percentage filter
-        total_stake: Total stake for calculating individual leg amounts
+    ``columns`` is ``_unpack(odds)``; the MarketOdds themselves are only read
+    to build the legs of reported opportunities. Opportunities are returned
+    as plain dicts in the ArbOpportunity shape, ready to be serialized
+    without model revalidation.
     """
-    grouped: Dict[Tuple[str, str], List[MarketOdds]] = {}
-    for entry in payload.odds:
-        grouped.setdefault(_group_key(entry), []).append(entry)
+    if not odds:
+        return []
+
+    group_codes, best_odds, best_rows, _ = _best_odds_by_selection(columns)
+    group_starts = _segment_starts(group_codes)
+    group_lens = np.diff(np.r_[group_starts, len(group_codes)])
+    # The only division per selection; the screen and the kernel share it
+    best_inv = np.reciprocal(best_odds)
 
     # Use explicit threshold or fall back to configured minimum
     effective_min = min_profit_pct if min_profit_pct is not None else MIN_ARB_PROFIT_PCT
 
-    opportunities: List[ArbOpportunity] = []
-    for (event_id, market), group in grouped.items():
-        best_by_selection = _best_odds_by_selection(group)
-
-        implied_sum = sum(
-            1.0 / odds for odds, _ in best_by_selection.values()
-        ) if best_by_selection else 1.0
-
+    # A positive threshold is an implied-sum ceiling: screen groups against it
+    # in float32 so the exact float64 kernel only runs on candidates
+    if effective_min > 0:
+        candidates = prefilter_groups(
+            best_inv, group_starts, 1.0 / (1.0 + effective_min / 100.0)
+        )
+        if not candidates.size:
+            return []
+        if candidates.size < group_starts.size:
+            group_lens = group_lens[candidates]
+            keep = _segment_rows(group_starts[candidates], group_lens)
+            group_starts = np.cumsum(group_lens) - group_lens
+            best_odds, best_inv, best_rows = best_odds[keep], best_inv[keep], best_rows[keep]
+
+    implied_sums, profit_pcts, stakes, payouts = compute_arb(
+        best_odds, best_inv, group_starts, group_lens, _stake_totals(len(group_starts), total_stake)
+    )
+    np.round(payouts, 2, out=payouts)  # stakes come back as whole cents
+
+    # Drop groups below the minimum profit threshold in one vectorized pass,
+    # before any legs, notes or models are built for them
+    survivors = np.flatnonzero(profit_pcts >= effective_min)
+
+    # Reported values are rounded for all survivors at once; filtering and
+    # tiering above/below keep full precision
+    implied_reported = np.round(implied_sums[survivors], 6).tolist()
+    profit_reported = np.round(profit_pcts[survivors], 2).tolist()
+
+    # Pull every surviving leg out of the kernel arrays in one gather, so
+    # per-opportunity work below only slices Python lists
+    leg_lens = group_lens[survivors]
+    leg_idx = _segment_rows(group_starts[survivors], leg_lens)
+    leg_ends = np.cumsum(leg_lens)
+    leg_bounds = zip((leg_ends - leg_lens).tolist(), leg_ends.tolist())
+    leg_rows = best_rows[leg_idx].tolist()
+    leg_odds = best_odds[leg_idx].tolist()
+    leg_stakes = stakes[leg_idx].tolist()
+    leg_payouts = payouts[leg_idx].tolist()
+
+    opportunities: List[Dict[str, Any]] = []
+    for i, (implied_sum, profit_pct, (start, end)) in enumerate(zip(
+        implied_sums[survivors].tolist(), profit_pcts[survivors].tolist(), leg_bounds
+    )):
         has_arb = implied_sum < 1.0
-        profit_pct = _calculate_profit_percentage(implied_sum)
-
-        # Skip if below minimum profit threshold
-        if profit_pct < effective_min:
-            continue
+        entries = [odds[row] for row in leg_rows[start:end]]
 
         # Skip same-bookmaker "arbs" — not real arbitrage
-        bookmakers_in_arb = {mo.bookmaker for _, mo in best_by_selection.values()}
+        bookmakers_in_arb = {mo.bookmaker for mo in entries}
         if len(bookmakers_in_arb) < 2:
             continue
 
         # Build leg details for arbs
         legs = []
         if has_arb:
-            legs = _calculate_stakes(best_by_selection, total_stake)
+            legs = _calculate_stakes(
+                entries, leg_odds[start:end], leg_stakes[start:end], leg_payouts[start:end]
+            )
 
         tier = _get_tier(profit_pct) if has_arb else "info"
 
@@ -372,54 +705,241 @@ def evaluate_arbitrage(
         if has_arb:
             note = f"🎯 {profit_pct:.2f}% arb ({tier}). Stakes for ${total_stake:.0f}."
 
-        opportunities.append(
-            ArbOpportunity(
-                event_id=event_id,
-                market=market,
-                implied_prob_sum=round(implied_sum, 6),
-                has_arb=has_arb,
-                notes=note,
-                profit_percentage=round(profit_pct, 2) if has_arb else None,
-                legs=legs,
-                is_live=False,  # Will be set by caller if from live feed
-            )
-        )
+        opportunities.append(dict(
+            _OPPORTUNITY_FIELDS,
+            event_id=entries[0].event_id,
+            market=entries[0].market,
+            implied_prob_sum=implied_reported[i],
+            has_arb=has_arb,
+            notes=note,
+            profit_percentage=profit_reported[i] if has_arb else None,
+            legs=legs,
+            is_live=False,  # Will be set by caller if from live feed
+            detected_at=now,
+        ))
+
+    return opportunities
+
+
+_result_cache: "OrderedDict[tuple, Tuple[float, bytes]]" = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+
+def _snapshot_key(columns: OddsColumns, *extra: Any) -> tuple:
+    """Exact-match cache key for an odds snapshot plus endpoint parameters."""
+    event_ids, markets, selections, bookmakers, prices, lines, market_types = columns
+    return (extra, event_ids, markets, selections, bookmakers,
+            prices.tobytes(), lines.tobytes(), market_types)
+
+
+def _cached_result(key: tuple) -> Optional[Response]:
+    """Replay the rendered body for ``key`` if it is younger than the TTL."""
+    if ARB_RESULT_CACHE_SIZE <= 0:
+        return None
+    with _result_cache_lock:
+        hit = _result_cache.get(key)
+        if hit is None:
+            return None
+        if hit[0] <= time.monotonic():
+            del _result_cache[key]
+            return None
+        _result_cache.move_to_end(key)
+    return Response(content=hit[1], media_type="application/json")
+
+
+def _cache_result(key: tuple, response: Response) -> None:
+    if ARB_RESULT_CACHE_SIZE <= 0:
+        return
+    with _result_cache_lock:
+        _result_cache[key] = (time.monotonic() + ARB_RESULT_CACHE_TTL_SECONDS, response.body)
+        _result_cache.move_to_end(key)
+        while len(_result_cache) > ARB_RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+
+
+@app.post("/arbitrage", response_model=ArbResponse, response_class=ORJSONResponse)
+async def evaluate_arbitrage(
+    payload: ArbRequest,
+    min_profit_pct: Optional[float] = None,
+    total_stake: float = MAX_TOTAL_STAKE,  # Use configured max stake
+) -> Response:
+    """
+    Evaluate arbitrage opportunities with enhanced details.
+
+    Args:
+        payload: ArbRequest with list of odds
+        min_profit_pct: Optional minimum profit percentage filter
+        total_stake: Total stake for calculating individual leg amounts
 
-    return ArbResponse(opportunities=opportunities, evaluated_at=datetime.utcnow())
+    Opportunities are built as plain dicts in the ArbResponse shape and
+    serialized with orjson, skipping response_model revalidation. The
+    evaluation and rendering run in a worker thread so the event loop keeps
+    accepting requests meanwhile. With fixed stakes, an identical snapshot
+    re-posted within ARB_RESULT_CACHE_TTL_SECONDS gets the cached response.
+    """
+    return await asyncio.to_thread(
+        _evaluate_arbitrage, payload.odds, min_profit_pct, total_stake
+    )
+
+
+def _evaluate_arbitrage(
+    odds: List[MarketOdds], min_profit_pct: Optional[float], total_stake: float
+) -> Response:
+    columns = _unpack(odds)
+
+    # Randomized stakes differ on every call, so only fixed stakes are replayed
+    key = None
+    if not RANDOMIZE_STAKES:
+        sports = tuple(entry.sport for entry in odds)  # only legs carry sport
+        key = _snapshot_key(columns, "arbitrage", min_profit_pct, total_stake, sports)
+        cached = _cached_result(key)
+        if cached is not None:
+            return cached
+
+    # One timestamp for the whole batch instead of a utcnow() per opportunity
+    now = datetime.utcnow()
+    opportunities = _arbitrage_opportunities(odds, columns, min_profit_pct, total_stake, now)
+    response = ORJSONResponse(content={"opportunities": opportunities, "evaluated_at": now})
+    if key is not None:
+        _cache_result(key, response)
+    return response
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Incremental (Delta) Arbitrage Endpoint
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Groups not updated for this long are dropped from the delta state
+ARB_DELTA_STATE_TTL_SECONDS = float(os.getenv("ARB_DELTA_STATE_TTL_SECONDS", "21600"))
+# A price not re-posted for this long is treated as pulled or suspended
+ARB_DELTA_ENTRY_TTL_SECONDS = float(os.getenv("ARB_DELTA_ENTRY_TTL_SECONDS", "120"))
+_DELTA_SWEEP_INTERVAL_SECONDS = 60.0
+
+# (event_id, market) -> (latest odds, monotonic last-seen) per (selection, bookmaker)
+_delta_state: Dict[Tuple[str, str], Dict[Tuple[str, str], Tuple[MarketOdds, float]]] = {}
+_delta_updated_at: Dict[Tuple[str, str], float] = {}
+_delta_last_sweep = 0.0
+_delta_lock = threading.Lock()
+
+
+def _sweep_delta_state(now_mono: float) -> None:
+    """Drop groups that have not been updated within the TTL (lock held)."""
+    global _delta_last_sweep
+    if now_mono - _delta_last_sweep < _DELTA_SWEEP_INTERVAL_SECONDS:
+        return
+    _delta_last_sweep = now_mono
+    cutoff = now_mono - ARB_DELTA_STATE_TTL_SECONDS
+    for key in [k for k, updated in _delta_updated_at.items() if updated < cutoff]:
+        del _delta_state[key]
+        del _delta_updated_at[key]
+
+
+@app.post("/arbitrage/delta", response_model=ArbResponse, response_class=ORJSONResponse)
+def evaluate_arbitrage_delta(
+    payload: ArbRequest,
+    min_profit_pct: Optional[float] = None,
+    total_stake: float = MAX_TOTAL_STAKE,
+) -> ORJSONResponse:
+    """
+    Incrementally evaluate arbitrage from changed odds only.
+
+    The service keeps the latest price per (selection, bookmaker) for every
+    event+market it has seen. Posted odds are merged into that state and
+    only the groups they touch are re-evaluated, so pollers can send just
+    the prices that moved each tick. A price that has not been re-posted
+    within ARB_DELTA_ENTRY_TTL_SECONDS is dropped as pulled, so pollers must
+    resend unchanged prices at least that often. Use /arbitrage for
+    stateless batches.
+    """
+    now = datetime.utcnow()
+    now_mono = time.monotonic()
+
+    with _delta_lock:
+        touched: Dict[Tuple[str, str], None] = {}
+        for entry in payload.odds:
+            key = (entry.event_id, entry.market)
+            _delta_state.setdefault(key, {})[(entry.selection, entry.bookmaker)] = (entry, now_mono)
+            _delta_updated_at[key] = now_mono
+            touched[key] = None
+
+        odds: List[MarketOdds] = []
+        cutoff = now_mono - ARB_DELTA_ENTRY_TTL_SECONDS
+        for key in touched:
+            group = _delta_state[key]
+            for price_key in [k for k, (_, seen) in group.items() if seen < cutoff]:
+                del group[price_key]
+            odds.extend(entry for entry, _ in group.values())
+        _sweep_delta_state(now_mono)
+
+    opportunities = _arbitrage_opportunities(
+        odds, _unpack(odds), min_profit_pct, total_stake, now
+    )
+    return ORJSONResponse(content={"opportunities": opportunities, "evaluated_at": now})
+
+
+@app.delete("/arbitrage/delta")
+def reset_arbitrage_delta() -> Dict[str, int]:
+    """Clear the incremental arbitrage state (e.g. after a feed restart)."""
+    with _delta_lock:
+        cleared = len(_delta_state)
+        _delta_state.clear()
+        _delta_updated_at.clear()
+    return {"cleared_groups": cleared}
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # +EV Endpoint
 # ─────────────────────────────────────────────────────────────────────────────
 
-@app.post("/positive-ev", response_model=ArbResponse)
-def evaluate_positive_ev(
+@app.post("/positive-ev", response_model=ArbResponse, response_class=ORJSONResponse)
+async def evaluate_positive_ev(
     payload: ArbRequest,
     min_ev_pct: float = MIN_EV_THRESHOLD,
-) -> ArbResponse:
+) -> Response:
     """
     Detect +EV (Positive Expected Value) opportunities.
 
     Compares offered odds to fair (no-vig) odds derived from the best
-    available lines across bookmakers.
+    available lines across bookmakers. Runs in a worker thread; identical
+    snapshots re-posted within ARB_RESULT_CACHE_TTL_SECONDS are replayed.
     """
-    ev_opps = _detect_positive_ev(payload.odds, min_ev_pct)
-    return ArbResponse(opportunities=ev_opps, evaluated_at=datetime.utcnow())
+    return await asyncio.to_thread(_evaluate_positive_ev, payload.odds, min_ev_pct)
+
+
+def _evaluate_positive_ev(odds: List[MarketOdds], min_ev_pct: float) -> Response:
+    columns = _unpack(odds)
+    key = _snapshot_key(columns, "positive_ev", min_ev_pct)
+    cached = _cached_result(key)
+    if cached is not None:
+        return cached
+
+    # One timestamp for the whole batch instead of a utcnow() per opportunity
+    now = datetime.utcnow()
+    ev_opps = _detect_positive_ev(columns, min_ev_pct, now)
+    response = ORJSONResponse(content={"opportunities": ev_opps, "evaluated_at": now})
+    _cache_result(key, response)
+    return response
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Middles Endpoint
 # ─────────────────────────────────────────────────────────────────────────────
 
-@app.post("/middles", response_model=ArbResponse)
-def evaluate_middles(payload: ArbRequest) -> ArbResponse:
+@app.post("/middles", response_model=ArbResponse, response_class=ORJSONResponse)
+async def evaluate_middles(payload: ArbRequest) -> Response:
     """
     Detect middle opportunities where both sides of a spread/total can win.
 
     Requires odds with market_type='spread' or 'total' and line values.
+    Runs in a worker thread.
     """
-    middle_opps = _detect_middles(payload.odds)
-    return ArbResponse(opportunities=middle_opps, evaluated_at=datetime.utcnow())
+    return await asyncio.to_thread(_evaluate_middles, payload.odds)
+
+
+def _evaluate_middles(odds: List[MarketOdds]) -> Response:
+    now = datetime.utcnow()
+    middle_opps = _detect_middles(_unpack(odds), now)
+    return ORJSONResponse(content={"opportunities": middle_opps, "evaluated_at": now})
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -0,0 +1,288 @@
+"""
+Tests for the /arbitrage endpoint.
+"""
+import pytest
+from fastapi.testclient import TestClient
+from services.arb_math.app import main
+from services.arb_math.app.main import app
+
+client = TestClient(app)
+
+
+def _odds(event_id, bookmaker, selection, odds_decimal, market="h2h"):
+    return {
+        "event_id": event_id,
+        "sport": "basketball_nba",
+        "market": market,
+        "bookmaker": bookmaker,
+        "selection": selection,
+        "odds_decimal": odds_decimal,
+    }
+
+
+@pytest.fixture(autouse=True)
+def fixed_stakes(monkeypatch):
+    monkeypatch.setattr(main, "RANDOMIZE_STAKES", False)
+
+
+def test_arbitrage_uses_best_odds_per_selection():
+    """Best price per selection wins across books, groups keep input order."""
+    payload = {
+        "odds": [
+            _odds("game_2", "draftkings", "Home", 2.20),
+            _odds("game_2", "fanduel", "Away", 2.10),
+            _odds("game_1", "fanduel", "Lakers", 2.10),
+            _odds("game_1", "draftkings", "Lakers", 2.15),
+            _odds("game_1", "fanatics", "Lakers", 2.05),
+            _odds("game_1", "fanduel", "Celtics", 2.00),
+            _odds("game_1", "fanatics", "Celtics", 2.05),
+            _odds("game_1", "draftkings", "Celtics", 2.05),
+        ]
+    }
+
+    response = client.post("/arbitrage", json=payload, params={"total_stake": 1000})
+    assert response.status_code == 200
+    opportunities = response.json()["opportunities"]
+
+    assert [opp["event_id"] for opp in opportunities] == ["game_2", "game_1"]
+    legs = opportunities[1]["legs"]
+    assert [(leg["selection"], leg["bookmaker"]) for leg in legs] == [
+        ("Lakers", "draftkings"),
+        ("Celtics", "fanatics"),  # tie at 2.05 goes to the first book seen
+    ]
+    assert opportunities[1]["implied_prob_sum"] == pytest.approx(1 / 2.15 + 1 / 2.05, abs=1e-6)
+
+
+def test_arbitrage_empty_payload():
+    response = client.post("/arbitrage", json={"odds": []})
+    assert response.status_code == 200
+    assert response.json()["opportunities"] == []
+
+
+def test_compute_arb_numpy_matches_kernel():
+    """The NumPy fallback agrees with the compiled kernel."""
+    import numpy as np
+    from services.arb_math.app import kernels
+
+    odds = np.array([2.15, 2.05, 3.0, 3.5, 2.8, 1.9, 1.9])
+    group_start = np.array([0, 2, 5])
+    group_len = np.array([2, 3, 2])
+    totals = np.array([1000.0, 500.0, 250.0])
+
+    inv_odds = 1.0 / odds
+
+    expected = kernels._compute_arb_numpy(odds, inv_odds, group_start, group_len, totals)
+    actual_all = kernels.compute_arb(odds, inv_odds, group_start, group_len, totals)
+    for actual, want in zip(actual_all, expected):
+        np.testing.assert_allclose(actual, want)
+
+    implied, profit_pct, stakes, payouts = expected
+    assert implied[2] > 1.0 and profit_pct[2] == 0.0
+    assert payouts[0] == pytest.approx(payouts[1], abs=0.03)
+
+    # Whole-cent stakes that add up to each group's total exactly, on both
+    # paths (no float residue such as 446.46000000000004)
+    for stakes in (expected[2], actual_all[2]):
+        assert np.array_equal(stakes, np.round(stakes, 2))
+        np.testing.assert_array_equal(np.add.reduceat(stakes, group_start), totals)
+
+
+def test_compute_ev_numpy_matches_kernel():
+    """The NumPy +EV fallback agrees with the compiled kernel."""
+    import numpy as np
+    from services.arb_math.app import kernels
+
+    # Group 0: two selections (best 2.30 / 1.80); group 1: one selection
+    offered = np.array([2.30, 1.80, 2.00, 1.70, 3.00])
+    row_selection = np.array([0, 1, 0, 1, 2])
+    inv_best = 1.0 / np.array([2.30, 1.80, 3.00])
+    group_start = np.array([0, 2])
+    group_len = np.array([2, 1])
+    args = (offered, row_selection, inv_best, group_start, group_len, -100.0)
+
+    expected = kernels._compute_ev_numpy(*args)
+    for actual, want in zip(kernels.compute_ev(*args), expected):
+        np.testing.assert_allclose(actual, want)
+
+    implied, true_prob, ev_pct, kelly, hit = expected
+    assert hit.tolist() == [True, True, True, True, False]  # one-sided group skipped
+    assert true_prob[0] + true_prob[1] == pytest.approx(1.0)
+    assert ((kelly >= 0) & (kelly <= 0.25)).all()
+
+
+def test_min_profit_threshold_filters_groups():
+    """Groups below the threshold are dropped; 0.0 is an explicit threshold."""
+    payload = {
+        "odds": [
+            _odds("arb", "draftkings", "Lakers", 2.15),
+            _odds("arb", "fanduel", "Celtics", 2.05),
+            _odds("no_arb", "draftkings", "Home", 1.90),
+            _odds("no_arb", "fanduel", "Away", 1.90),
+        ]
+    }
+
+    default = client.post("/arbitrage", json=payload).json()["opportunities"]
+    assert [opp["event_id"] for opp in default] == ["arb"]
+
+    high = client.post("/arbitrage", json=payload, params={"min_profit_pct": 5.0}).json()
+    assert high["opportunities"] == []
+
+    zero = client.post("/arbitrage", json=payload, params={"min_profit_pct": 0.0}).json()
+    by_event = {opp["event_id"]: opp for opp in zero["opportunities"]}
+    assert by_event["no_arb"]["has_arb"] is False
+    assert by_event["no_arb"]["legs"] == []
+
+
+def test_best_odds_cache_serves_repeated_snapshots(monkeypatch):
+    """Recurring odds snapshots are admitted to the LRU and reused."""
+    from shared.schemas import MarketOdds
+
+    monkeypatch.setattr(main, "_best_odds_cache", main.OrderedDict())
+    monkeypatch.setattr(main, "BEST_ODDS_CACHE_ADMIT_RATE", 0.5)
+    monkeypatch.setattr(main, "_best_odds_cache_admit_credit", 0.0)
+    odds = [
+        MarketOdds(**_odds("game_1", "draftkings", "Lakers", 2.15)),
+        MarketOdds(**_odds("game_1", "fanduel", "Celtics", 2.05)),
+    ]
+
+    first = main._best_odds_by_selection(main._unpack(odds))
+    assert len(main._best_odds_cache) == 0  # first miss only earns credit
+    second = main._best_odds_by_selection(main._unpack(odds))
+    assert len(main._best_odds_cache) == 1
+    assert main._best_odds_by_selection(main._unpack(odds)) is second
+    for fresh, cached in zip(first, second):
+        assert (fresh == cached).all()
+
+
+def test_arbitrage_shares_one_timestamp_per_batch():
+    payload = {
+        "odds": [
+            _odds("game_1", "draftkings", "Lakers", 2.15),
+            _odds("game_1", "fanduel", "Celtics", 2.05),
+            _odds("game_2", "draftkings", "Home", 2.20),
+            _odds("game_2", "fanduel", "Away", 2.10),
+        ]
+    }
+    data = client.post("/arbitrage", json=payload).json()
+    assert len(data["opportunities"]) == 2
+    assert {opp["detected_at"] for opp in data["opportunities"]} == {data["evaluated_at"]}
+
+
+def test_health_time_is_second_resolution():
+    data = client.get("/health").json()
+    assert data["status"] == "ok"
+    assert "." not in data["time_utc"]
+
+
+def test_routes_registered_once():
+    """Each path/method pair maps to exactly one endpoint."""
+    routes = [
+        (route.path, method)
+        for route in app.routes
+        for method in getattr(route, "methods", None) or ()
+    ]
+    assert routes.count(("/arbitrage", "POST")) == 1
+    assert len(routes) == len(set(routes))
+
+
+def test_arbitrage_delta_reevaluates_touched_groups():
+    """Delta posts merge into state and only touched groups are returned."""
+    client.delete("/arbitrage/delta")
+    initial = {
+        "odds": [
+            _odds("game_1", "draftkings", "Lakers", 1.90),
+            _odds("game_1", "fanduel", "Celtics", 1.90),
+            _odds("game_2", "draftkings", "Home", 2.20),
+            _odds("game_2", "fanduel", "Away", 2.10),
+        ]
+    }
+    first = client.post("/arbitrage/delta", json=initial).json()["opportunities"]
+    assert [opp["event_id"] for opp in first] == ["game_2"]
+
+    # Only game_1's Lakers price moves — game_1 now arbs against stored Celtics
+    moved = {"odds": [_odds("game_1", "draftkings", "Lakers", 2.30)]}
+    second = client.post("/arbitrage/delta", json=moved).json()["opportunities"]
+    assert [opp["event_id"] for opp in second] == ["game_1"]
+    assert {leg["selection"]: leg["odds_decimal"] for leg in second[0]["legs"]} == {
+        "Lakers": 2.30,
+        "Celtics": 1.90,
+    }
+
+    # A book drifting back replaces its own earlier price
+    back = {"odds": [_odds("game_1", "draftkings", "Lakers", 1.90)]}
+    assert client.post("/arbitrage/delta", json=back).json()["opportunities"] == []
+
+    assert client.delete("/arbitrage/delta").json() == {"cleared_groups": 2}
+
+
+def test_arbitrage_delta_expires_stale_prices(monkeypatch):
+    """A book that stops re-posting its price drops out while the group stays active."""
+    client.delete("/arbitrage/delta")
+    initial = {
+        "odds": [
+            _odds("game_1", "draftkings", "Lakers", 2.30),
+            _odds("game_1", "fanduel", "Celtics", 1.90),
+        ]
+    }
+    assert len(client.post("/arbitrage/delta", json=initial).json()["opportunities"]) == 1
+
+    # Only draftkings keeps posting; fanduel's Celtics price was pulled
+    refresh = {"odds": [_odds("game_1", "draftkings", "Lakers", 2.30)]}
+    assert len(client.post("/arbitrage/delta", json=refresh).json()["opportunities"]) == 1
+    monkeypatch.setattr(main, "ARB_DELTA_ENTRY_TTL_SECONDS", 0.0)
+    assert client.post("/arbitrage/delta", json=refresh).json()["opportunities"] == []
+
+    client.delete("/arbitrage/delta")
+
+
+def test_kernel_warmup_runs():
+    from services.arb_math.app import kernels
+
+    kernels.warmup()
+
+
+def test_prefilter_groups_keeps_threshold_boundary():
+    """The float32 screen never drops a group the exact check would keep."""
+    import numpy as np
+    from services.arb_math.app import kernels
+
+    # implied sums: 0.9523.. (arb), 1.0526.. (no arb), exactly 1/1.02 (boundary)
+    odds = np.array([2.10, 2.10, 1.90, 1.90, 2.04, 2.04])
+    group_start = np.array([0, 2, 4])
+    candidates = kernels.prefilter_groups(1.0 / odds, group_start, 1.0 / 1.02)
+    assert candidates.tolist() == [0, 2]
+
+
+def test_tier_thresholds_are_inclusive():
+    assert main._get_tier(0.5) == "info"
+    assert main._get_tier(main.TIER_LIGHTNING) == "lightning"
+    assert main._get_tier(2.99) == "lightning"
+    assert main._get_tier(main.TIER_FIRE) == "fire"
+
+
+def test_identical_snapshot_replays_cached_response(monkeypatch):
+    """Fixed-stake results are replayed within the TTL, never with random stakes."""
+    monkeypatch.setattr(main, "_result_cache", main.OrderedDict())
+    payload = {
+        "odds": [
+            _odds("cache_game", "draftkings", "Lakers", 2.15),
+            _odds("cache_game", "fanduel", "Celtics", 2.05),
+        ]
+    }
+
+    first = client.post("/arbitrage", json=payload)
+    second = client.post("/arbitrage", json=payload)
+    assert second.content == first.content
+    assert len(main._result_cache) == 1
+
+    monkeypatch.setattr(main, "ARB_RESULT_CACHE_TTL_SECONDS", 0.0)
+    other_stake = client.post("/arbitrage", json=payload, params={"total_stake": 500})
+    legs = other_stake.json()["opportunities"][0]["legs"]
+    assert round(sum(leg["stake"] for leg in legs), 2) == 500.0
+    expired = client.post("/arbitrage", json=payload, params={"total_stake": 500})
+    assert expired.json()["evaluated_at"] != other_stake.json()["evaluated_at"]
+
+    monkeypatch.setattr(main, "RANDOMIZE_STAKES", True)
+    main._result_cache.clear()
+    client.post("/arbitrage", json=payload)
+    assert len(main._result_cache) == 0
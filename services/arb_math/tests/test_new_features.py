@@ -8,6 +8,23 @@ from services.arb_math.app.main import app
 client = TestClient(app)
 
 
+def _odds(event_id, bookmaker, selection, odds_decimal, sport="basketball_nba",
+          market="h2h", market_type=None, line=None):
+    entry = {
+        "event_id": event_id,
+        "sport": sport,
+        "market": market,
+        "bookmaker": bookmaker,
+        "selection": selection,
+        "odds_decimal": odds_decimal,
+    }
+    if market_type is not None:
+        entry["market_type"] = market_type
+    if line is not None:
+        entry["line"] = line
+    return entry
+
+
 def test_positive_ev_detection():
     """Test +EV detection with real-world scenario."""
     # DK offers Lakers ML at 2.10, FD offers Celtics ML at 2.05
@@ -67,6 +84,34 @@ def test_positive_ev_detection():
     assert opp["kelly_fraction"] is not None
 
 
+def test_positive_ev_order_and_single_sided_groups():
+    """+EV rows come out group by group in input order; one-sided groups are skipped."""
+    payload = {
+        "odds": [
+            _odds("game_b", "draftkings", "Home", 2.30),
+            _odds("game_a", "fanduel", "Only", 3.00),
+            _odds("game_b", "fanduel", "Away", 1.80),
+            _odds("game_b", "fanduel", "Home", 2.00),
+            _odds("game_b", "fanatics", "Away", 1.70),
+        ]
+    }
+
+    response = client.post("/positive-ev", json=payload, params={"min_ev_pct": -100})
+    assert response.status_code == 200
+    opportunities = response.json()["opportunities"]
+
+    assert [(o["legs"][0]["bookmaker"], o["legs"][0]["selection"]) for o in opportunities] == [
+        ("draftkings", "Home"),
+        ("fanduel", "Away"),
+        ("fanduel", "Home"),
+        ("fanatics", "Away"),
+    ]
+    true_home = (1 / 2.30) / (1 / 2.30 + 1 / 1.80)
+    assert opportunities[0]["true_probability"] == pytest.approx(true_home, abs=1e-4)
+    assert opportunities[0]["implied_prob_sum"] == pytest.approx(1 / 2.30 + 1 / 1.80)
+    assert all(0 <= o["kelly_fraction"] <= 0.25 for o in opportunities)
+
+
 def test_middles_detection_spread():
     """Test middle detection for spread bets."""
     # DK: Lakers -3.5, FD: Celtics +5.5 → middle at 4-5 points
@@ -191,3 +236,57 @@ def test_promo_converter_profit_boost():
     assert data["recommended_hedge_stake"] > 0
     assert data["guaranteed_profit"] > 0
 
+
+def test_middles_pairs_across_books_only():
+    """Every favorite/underdog pair with a gap is reported once, never within one book."""
+    spread = {"market": "spreads", "market_type": "spread"}
+    payload = {
+        "odds": [
+            _odds("game_1", "fanduel", "Celtics", 1.91, line=5.5, **spread),
+            _odds("game_1", "draftkings", "Lakers", 1.91, line=-3.5, **spread),
+            _odds("game_1", "draftkings", "Celtics", 1.91, line=6.5, **spread),
+            _odds("game_1", "fanduel", "Lakers", 1.91, line=-4.5, **spread),
+            _odds("game_1", "fanatics", "Celtics", 1.91, line=3.5, **spread),
+        ]
+    }
+
+    response = client.post("/middles", json=payload)
+    assert response.status_code == 200
+    legs = [
+        [(leg["bookmaker"], leg["line"]) for leg in opp["legs"]]
+        for opp in response.json()["opportunities"]
+    ]
+    assert legs == [
+        [("fanduel", 5.5), ("draftkings", -3.5)],
+        [("fanduel", -4.5), ("draftkings", 6.5)],
+    ]
+
+
+def test_middles_quarter_lines_keep_float_gap():
+    """Lines that aren't half points fall back to float comparisons."""
+    total = {"sport": "soccer_epl", "market": "totals", "market_type": "total"}
+    payload = {
+        "odds": [
+            _odds("match_1", "bet365", "Over", 1.95, line=2.25, **total),
+            _odds("match_1", "pinnacle", "Under", 1.95, line=2.75, **total),
+        ]
+    }
+    response = client.post("/middles", json=payload)
+    assert response.status_code == 200
+    opportunities = response.json()["opportunities"]
+    assert [opp["middle_gap"] for opp in opportunities] == [0.5]
+
+
+def test_positive_ev_shares_one_timestamp_per_batch():
+    """Every +EV row in one response carries the batch's evaluated_at timestamp."""
+    payload = {
+        "odds": [
+            _odds("g1", "draftkings", "Home", 2.30),
+            _odds("g1", "fanduel", "Away", 1.80),
+            _odds("g1", "fanduel", "Home", 2.00),
+            _odds("g1", "fanatics", "Away", 1.70),
+        ]
+    }
+    data = client.post("/positive-ev", json=payload, params={"min_ev_pct": -100}).json()
+    assert len(data["opportunities"]) == 4
+    assert {opp["detected_at"] for opp in data["opportunities"]} == {data["evaluated_at"]}
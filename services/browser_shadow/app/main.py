@@ -1,17 +1,56 @@
 from __future__ import annotations
 
+import asyncio
 import os
 from datetime import datetime
+from typing import Optional
 
 from fastapi import FastAPI, HTTPException
-from playwright.async_api import async_playwright
+from playwright.async_api import Browser, Playwright, async_playwright
 
 from shared.schemas import HealthResponse, ObserveRequest, ObserveResponse
 
 SERVICE_NAME = os.getenv("SERVICE_NAME", "browser_shadow")
 
+# Concurrent /observe pages sharing the browser; extra requests wait
+MAX_CONTEXTS = int(os.getenv("BROWSER_SHADOW_MAX_CONTEXTS", "8"))
+
 app = FastAPI(title="Browser Shadow", version="0.1.0")
 
+# One Chromium for the life of the process; each request gets its own context
+_playwright: Optional[Playwright] = None
+_browser: Optional[Browser] = None
+_browser_lock = asyncio.Lock()
+_context_slots = asyncio.Semaphore(max(1, MAX_CONTEXTS))
+
+
+async def _get_browser() -> Browser:
+    """Return the shared browser, (re)launching it if needed."""
+    global _playwright, _browser
+    async with _browser_lock:
+        if _browser is None or not _browser.is_connected():
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(headless=True)
+        return _browser
+
+
+@app.on_event("startup")
+async def startup_event():
+    await _get_browser()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    global _playwright, _browser
+    async with _browser_lock:
+        if _browser is not None:
+            await _browser.close()
+            _browser = None
+        if _playwright is not None:
+            await _playwright.stop()
+            _playwright = None
+
 
 @app.get("/health", response_model=HealthResponse)
 def health() -> HealthResponse:
@@ -24,15 +63,16 @@ async def observe(payload: ObserveRequest) -> ObserveResponse:
     if not url.startswith("http://") and not url.startswith("https://"):
         raise HTTPException(status_code=400, detail="Only http/https URLs are allowed.")
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+    async with _context_slots:
+        browser = await _get_browser()
         context = await browser.new_context(user_agent=payload.user_agent)
-        page = await context.new_page()
-        response = await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-        title = await page.title()
-        final_url = page.url
-        await context.close()
-        await browser.close()
+        try:
+            page = await context.new_page()
+            response = await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            title = await page.title()
+            final_url = page.url
+        finally:
+            await context.close()
 
     if response is None:
         raise HTTPException(status_code=502, detail="No response from target URL.")
@@ -42,4 +82,4 @@ async def observe(payload: ObserveRequest) -> ObserveResponse:
         final_url=final_url,
         title=title,
         fetched_at=datetime.utcnow(),
-    )
\ No newline at end of file
+    )
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import os
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
-from fastapi import FastAPI, HTTPException
+from fastapi import BackgroundTasks, FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from shared.schemas import DecisionRequest, DecisionResponse, HealthResponse
@@ -13,10 +15,14 @@ from .stealth_advisor import StealthAdvisor
 
 SERVICE_NAME = os.getenv("SERVICE_NAME", "decision_gateway")
 
-app = FastAPI(title="Decision Gateway", version="0.1.0")
+# Decisions evaluated at once (each may be an AI API round-trip); the rest wait
+MAX_CONCURRENT_DECISIONS = int(os.getenv("DECISION_MAX_CONCURRENCY", "10"))
+
+app = FastAPI(title="Decision Gateway", version="0.1.0", default_response_class=ORJSONResponse)
 
 # Global stealth advisor instance
 stealth_advisor = StealthAdvisor()
+_decision_slots = asyncio.Semaphore(max(1, MAX_CONCURRENT_DECISIONS))
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -39,6 +45,11 @@ class RecordBetRequest(BaseModel):
     won: bool = True
 
 
+class BatchDecisionRequest(BaseModel):
+    """Opportunities to evaluate together in one AI prompt."""
+    items: List[DecisionRequest]
+
+
 class CoolingRequest(BaseModel):
     """Request to force cooling on a bookmaker."""
     bookmaker: str
@@ -50,6 +61,16 @@ class CoolingRequest(BaseModel):
 # ─────────────────────────────────────────────────────────────────────────────
 
 
+@app.on_event("startup")
+async def startup_event():
+    await stealth_advisor.warmup()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await stealth_advisor.aclose()
+
+
 @app.get("/health", response_model=HealthResponse)
 def health() -> HealthResponse:
     return HealthResponse(service=SERVICE_NAME, time_utc=datetime.utcnow())
@@ -63,28 +84,60 @@ async def decision(payload: DecisionRequest) -> DecisionResponse:
     The advisor analyzes betting patterns, heat scores, and opportunity quality
     to decide whether to take, skip, or suggest cover bets before the arb.
     """
-    return await stealth_advisor.evaluate(payload.opportunity, payload.context)
+    return (await decisions([payload]))[0]
+
+
+@app.post("/decisions", response_model=List[DecisionResponse])
+async def decisions(payloads: List[DecisionRequest]) -> List[DecisionResponse]:
+    """
+    Evaluate a batch of arb opportunities concurrently.
+
+    AI round-trips overlap on the advisor's pooled client, at most
+    DECISION_MAX_CONCURRENCY at a time. Results are returned in request order.
+    """
+    async def one(payload: DecisionRequest) -> DecisionResponse:
+        async with _decision_slots:
+            return await stealth_advisor.evaluate(payload.opportunity, payload.context)
+
+    return list(await asyncio.gather(*(one(payload) for payload in payloads)))
+
+
+@app.post("/decision/batch", response_model=List[DecisionResponse])
+async def decision_batch(payload: BatchDecisionRequest) -> List[DecisionResponse]:
+    """
+    Evaluate a batch of arb opportunities with a single AI round-trip.
+
+    Unlike /decisions, which asks the AI about each opportunity separately,
+    the opportunities that need AI advice share one prompt. Results are
+    returned in request order.
+    """
+    async with _decision_slots:
+        return await stealth_advisor.evaluate_batch(
+            [(item.opportunity, item.context) for item in payload.items]
+        )
 
 
 @app.get("/heat", response_model=HeatScoreResponse)
-def get_heat_scores() -> HeatScoreResponse:
+def get_heat_scores() -> ORJSONResponse:
     """
     Get current heat scores for all tracked bookmakers.
 
     Heat score (0-100) indicates how suspicious the betting pattern appears.
     Higher scores indicate more risk of account limiting.
     """
-    return HeatScoreResponse(
-        bookmakers=stealth_advisor.get_all_heat_scores(),
-        timestamp=datetime.utcnow(),
-    )
+    # Values come straight from the advisor, so the response model is only
+    # documentation here; orjson renders the dicts and datetimes directly
+    return ORJSONResponse(content={
+        "bookmakers": stealth_advisor.get_all_heat_scores(),
+        "timestamp": datetime.utcnow(),
+    })
 
 
 @app.get("/heat/{bookmaker}")
 def get_bookmaker_heat(bookmaker: str) -> Dict[str, Any]:
     """Get heat score for a specific bookmaker."""
-    all_scores = stealth_advisor.get_all_heat_scores()
-    if bookmaker not in all_scores:
+    scores = stealth_advisor.get_heat_score(bookmaker)
+    if scores is None:
         # Return a default profile
         profile = stealth_advisor.get_profile(bookmaker)
         return {
@@ -94,27 +147,38 @@ def get_bookmaker_heat(bookmaker: str) -> Dict[str, Any]:
             "total_bets": profile.total_bets,
             "is_new": True,
         }
-    return {"bookmaker": bookmaker, **all_scores[bookmaker]}
+    return {"bookmaker": bookmaker, **scores}
 
 
 @app.post("/record-bet")
-def record_bet(request: RecordBetRequest) -> Dict[str, Any]:
+def record_bet(
+    request: RecordBetRequest, background: BackgroundTasks, sync: bool = False
+) -> Dict[str, Any]:
     """
     Record a bet result to update heat tracking.
 
     Call this after each bet placement to keep heat scores accurate.
+
+    The bet is recorded after the response is sent, so the reply carries the
+    heat from before this bet (``deferred: true``). Pass ``?sync=1`` to wait
+    for the updated score instead.
     """
-    stealth_advisor.record_bet_result(
+    bet = dict(
         bookmaker=request.bookmaker,
         is_arb=request.is_arb,
         stake=request.stake,
         profit=request.profit,
         won=request.won,
     )
+    if sync:
+        stealth_advisor.record_bet_result(**bet)
+    else:
+        background.add_task(stealth_advisor.record_bet_result, **bet)
     profile = stealth_advisor.get_profile(request.bookmaker)
     return {
         "bookmaker": request.bookmaker,
         "recorded": True,
+        "deferred": not sync,
         "new_heat_score": round(profile.heat_score, 1),
         "needs_cooling": profile.needs_cooling,
     }
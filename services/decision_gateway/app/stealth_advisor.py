@@ -12,16 +12,26 @@ even if it means sacrificing some short-term +EV opportunities.
 """
 from __future__ import annotations
 
-import hashlib
 import json
 import logging
 import os
 import random
+import time
+from bisect import bisect_left
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 
-import httpx
+if TYPE_CHECKING:
+    import aiohttp
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 from shared.schemas import ArbOpportunity, DecisionResponse
 
@@ -38,8 +48,63 @@ MAX_ARB_FREQUENCY_PER_DAY = int(os.getenv("STEALTH_MAX_ARBS_PER_DAY", "12"))  #
 HEAT_DECAY_HOURS = int(os.getenv("STEALTH_HEAT_DECAY_HOURS", "18"))  # Hours for heat to decay by half
 COVER_BET_PROBABILITY = float(os.getenv("STEALTH_COVER_BET_PROB", "0.05"))  # 5% chance to suggest a cover bet
 
+# AI decisions reused for repeat opportunities (same market, quality, profit and
+# heat bucket); live odds move faster, so their advice expires sooner
+AI_CACHE_SIZE = int(os.getenv("STEALTH_AI_CACHE_SIZE", "2048"))
+AI_CACHE_TTL_SECONDS = float(os.getenv("STEALTH_AI_CACHE_TTL_SECONDS", "30"))
+AI_CACHE_TTL_LIVE_SECONDS = float(os.getenv("STEALTH_AI_CACHE_TTL_LIVE_SECONDS", "10"))
+AI_CACHE_HEAT_BUCKET = 5  # heat scores within the same 5 points share advice
+
+# Decision tables (LOOSENED). Heat tables are indexed by how many thresholds
+# max_heat strictly exceeds: bisect_left(thresholds, max_heat).
+_SKIP_BASE = {"high": 0.02, "medium": 0.06, "low": 0.12}  # by arb quality
+_SKIP_HEAT_THRESHOLDS = (35, 55, 75)
+_SKIP_HEAT_BONUS = (0.0, 0.03, 0.08, 0.15)  # only skip more when really hot
+_SKIP_LIVE_BONUS = 0.05
+_SKIP_MAX = 0.50  # never skip more than 50%
+
+_STAKE_HEAT_THRESHOLDS = (50, 70, 85)
+_STAKE_MODIFIERS = {
+    # Low-quality arbs are trimmed slightly once warm; all arbs are cut when hot
+    "low": (1.0, 0.85, 0.8, 0.6),
+    "medium": (1.0, 1.0, 0.8, 0.6),
+    "high": (1.0, 1.0, 0.8, 0.6),
+}
+
+
+def _heat_kernel(
+    total_bets: int, wins: int, arb_bets: int, arb_bets_today: int, consecutive_wins: int
+) -> float:
+    """Heat score (0-100) from a profile's bet counters."""
+    heat = 0.0
+
+    # Win rate factor (0-25 points) - only kicks in at higher win rates
+    if total_bets >= 15:
+        win_rate = wins / total_bets
+        if win_rate > 0.60:
+            heat += (win_rate - 0.60) * 80  # Up to 24 for 90% win rate
+
+    # Arb frequency factor (0-20 points) - reduced weight
+    if total_bets > 0:
+        arb_ratio = arb_bets / total_bets
+        heat += arb_ratio * 20
+
+    # Daily arb frequency (0-15 points) - more lenient
+    heat += min(arb_bets_today * 1.5, 15.0)
+
+    # Consecutive wins (0-15 points) - takes longer to build
+    heat += min(consecutive_wins * 2.5, 15.0)
 
-@dataclass
+    return min(heat, 100.0)
+
+
+if NUMBA_AVAILABLE:
+    # Compiled for bulk replays of bet history and cached to disk;
+    # StealthAdvisor.warmup() loads it before the first recorded bet
+    _heat_kernel = njit(cache=True)(_heat_kernel)
+
+
+@dataclass(slots=True)
 class BookmakerProfile:
     """Tracks betting history and heat for a single bookmaker."""
     bookmaker: str
@@ -49,23 +114,32 @@ class BookmakerProfile:
     losses: int = 0
     total_wagered: float = 0.0
     total_profit: float = 0.0
-    last_bet_at: Optional[datetime] = None
-    last_arb_at: Optional[datetime] = None
+    # Epoch seconds (0.0 = never); see the last_bet_at/last_arb_at properties
+    last_bet_ts: float = 0.0
+    last_arb_ts: float = 0.0
     arb_bets_today: int = 0
-    today_date: Optional[str] = None
+    today_day_index: int = -1  # UTC days since the epoch for arb_bets_today
     heat_score: float = 0.0  # 0-100, higher = more suspicious
     cooling_until: Optional[datetime] = None
     consecutive_wins: int = 0
-    bet_history: List[Dict[str, Any]] = field(default_factory=list)
+    # Last 100 bets for pattern analysis; the oldest drops off automatically
+    bet_history: Deque[Dict[str, Any]] = field(default_factory=lambda: deque(maxlen=100))
+    # Maintained by record_bet so reads don't re-divide
+    _win_rate: float = field(default=0.0, repr=False)
+    # Epoch seconds when heat_score was last brought up to date (computed or decayed)
+    _heat_as_of: float = field(default=0.0, repr=False)
+    # Last summary() result and the inputs it was built from
+    _summary: Dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+    _summary_key: Optional[tuple] = field(default=None, repr=False, compare=False)
 
     def record_bet(self, is_arb: bool, stake: float, profit: float, won: bool) -> None:
         """Record a bet and update metrics."""
-        now = datetime.utcnow()
-        today = now.strftime("%Y-%m-%d")
+        now = time.time()
+        today = int(now // 86400)
 
         # Reset daily counter if new day
-        if self.today_date != today:
-            self.today_date = today
+        if self.today_day_index != today:
+            self.today_day_index = today
             self.arb_bets_today = 0
 
         self.total_bets += 1
@@ -74,7 +148,7 @@ class BookmakerProfile:
         if is_arb:
             self.arb_bets += 1
             self.arb_bets_today += 1
-            self.last_arb_at = now
+            self.last_arb_ts = now
 
         if won:
             self.wins += 1
@@ -85,49 +159,40 @@ class BookmakerProfile:
             self.consecutive_wins = 0
             self.total_profit -= stake  # Loss
 
-        self.last_bet_at = now
+        self._win_rate = self.wins / self.total_bets
+        self.last_bet_ts = now
         self._update_heat_score()
+        self._heat_as_of = now
 
-        # Keep last 100 bets for pattern analysis
         self.bet_history.append({
-            "timestamp": now.isoformat(),
+            "timestamp": now,
             "is_arb": is_arb,
             "stake": stake,
             "won": won,
             "profit": profit,
         })
-        if len(self.bet_history) > 100:
-            self.bet_history.pop(0)
 
     def _update_heat_score(self) -> None:
         """Calculate heat score based on suspicious patterns. LOOSENED."""
-        heat = 0.0
-
-        # Win rate factor (0-25 points) - only kicks in at higher win rates
-        if self.total_bets >= 15:
-            win_rate = self.wins / self.total_bets
-            if win_rate > 0.60:
-                heat += (win_rate - 0.60) * 80  # Up to 24 for 90% win rate
-
-        # Arb frequency factor (0-20 points) - reduced weight
-        if self.total_bets > 0:
-            arb_ratio = self.arb_bets / self.total_bets
-            heat += arb_ratio * 20
-
-        # Daily arb frequency (0-15 points) - more lenient
-        heat += min(self.arb_bets_today * 1.5, 15)
+        self.heat_score = _heat_kernel(
+            self.total_bets, self.wins, self.arb_bets,
+            self.arb_bets_today, self.consecutive_wins,
+        )
 
-        # Consecutive wins (0-15 points) - takes longer to build
-        heat += min(self.consecutive_wins * 2.5, 15)
+    @property
+    def last_bet_at(self) -> Optional[datetime]:
+        """UTC time of the last recorded bet, if any."""
+        return datetime.utcfromtimestamp(self.last_bet_ts) if self.last_bet_ts else None
 
-        self.heat_score = min(heat, 100)
+    @property
+    def last_arb_at(self) -> Optional[datetime]:
+        """UTC time of the last recorded arb bet, if any."""
+        return datetime.utcfromtimestamp(self.last_arb_ts) if self.last_arb_ts else None
 
     @property
     def win_rate(self) -> float:
         """Current win rate."""
-        if self.total_bets == 0:
-            return 0.0
-        return self.wins / self.total_bets
+        return self._win_rate
 
     @property
     def is_hot(self) -> bool:
@@ -141,19 +206,83 @@ class BookmakerProfile:
             return True
         return self.heat_score >= 90  # Only force cooling at 90+
 
+    def summary(self) -> Dict[str, Any]:
+        """
+        Rounded heat snapshot used in decisions and /heat.
+
+        Rebuilt only when a value it shows changes; callers must not mutate
+        the returned dict.
+        """
+        heat_score = round(self.heat_score, 1)
+        is_hot = self.is_hot
+        needs_cooling = self.needs_cooling
+        key = (heat_score, self.total_bets, self.arb_bets_today, is_hot, needs_cooling)
+        if key != self._summary_key:
+            self._summary_key = key
+            self._summary = {
+                "heat_score": heat_score,
+                "win_rate": round(self._win_rate, 3),
+                "total_bets": self.total_bets,
+                "arb_bets_today": self.arb_bets_today,
+                "consecutive_wins": self.consecutive_wins,
+                "is_hot": is_hot,
+                "needs_cooling": needs_cooling,
+            }
+        return self._summary
+
     def start_cooling(self, hours: int = 24) -> None:
         """Start a cooling period."""
         self.cooling_until = datetime.utcnow() + timedelta(hours=hours)
         logger.info(f"[{self.bookmaker}] Starting {hours}h cooling period (heat={self.heat_score:.1f})")
 
-    def decay_heat(self) -> None:
-        """Apply time-based heat decay."""
-        if self.last_bet_at:
-            hours_since = (datetime.utcnow() - self.last_bet_at).total_seconds() / 3600
-            decay_factor = 0.5 ** (hours_since / HEAT_DECAY_HOURS)
-            self.heat_score *= decay_factor
+    def decay_heat(self, now: Optional[float] = None) -> None:
+        """Apply time-based heat decay up to ``now`` (epoch seconds, default: current time)."""
+        # Decay only the time elapsed since the last update, so heat halves
+        # every HEAT_DECAY_HOURS however often the profile is read
+        if not self.heat_score:
+            return
+        if now is None:
+            now = time.time()
+        hours_since = (now - self._heat_as_of) / 3600
+        self.heat_score *= 0.5 ** (hours_since / HEAT_DECAY_HOURS)
+        self._heat_as_of = now
 
 
+# Static parts of the AI prompt, built once; only the opportunity fields and
+# heat scores are formatted per decision
+_PROMPT_INTRO = """You are a stealth betting advisor. Your goal is to maximize long-term profit by extending account longevity, even if it means sacrificing some short-term +EV opportunities.
+
+"""
+
+_PROMPT_GUIDELINES = f"""
+
+STRATEGY GUIDELINES:
+- High heat (>60): Skip more opportunities, suggest cover bets
+- High win rate (>65%): Account needs cover bets to look recreational
+- Daily arb limit: {MAX_ARB_FREQUENCY_PER_DAY} per bookmaker
+- Low-quality arbs (<1.5%): Not worth the heat, skip more often
+- Live bets: More suspicious, higher skip probability
+
+DECISION OPTIONS:
+1. "take" - Place the arb bet (with optional delay/stake modifier)
+2. "skip" - Pass on this opportunity to maintain recreational pattern
+3. "cover_then_take" - Place a cover bet first, then take the arb
+4. "delay" - Wait before placing (specify seconds)
+
+"""
+
+_DECISION_JSON = (
+    '{"decision": "take|skip|cover_then_take|delay", "rationale": "detailed explanation", '
+    '"delay_seconds": 0, "stake_modifier": 1.0, "cover_bet": null}'
+)
+
+_PROMPT_HEAD = _PROMPT_INTRO + "OPPORTUNITY:\n"
+_PROMPT_TAIL = f"{_PROMPT_GUIDELINES}Respond with JSON:\n{_DECISION_JSON}\n"
+_BATCH_PROMPT_TAIL = (
+    f"{_PROMPT_GUIDELINES}Respond with JSON, one decision per opportunity in the order given:\n"
+    f'{{"decisions": [{_DECISION_JSON}]}}\n'
+)
+
 
 class StealthAdvisor:
     """
@@ -169,16 +298,66 @@ class StealthAdvisor:
 
     def __init__(self):
         self._profiles: Dict[str, BookmakerProfile] = {}
+        self._ai_session: Optional[aiohttp.ClientSession] = None
+        # Private generator for the advisor's dice rolls; callers may pass a
+        # seed to evaluate/evaluate_batch for reproducible rule-based decisions
+        self._rng = random.Random()
+        self._ai_cache: "OrderedDict[tuple, Tuple[float, DecisionResponse]]" = OrderedDict()
+
+    def _get_ai_session(self) -> aiohttp.ClientSession:
+        """
+        Shared keep-alive session for the AI API, created on first use.
+
+        Created lazily so it binds to the server's running event loop.
+        """
+        if self._ai_session is None or self._ai_session.closed:
+            # Imported here so rule-based-only deployments never load it
+            import aiohttp
+
+            self._ai_session = aiohttp.ClientSession(
+                # Bound the pool so a decision burst queues on open
+                # connections instead of opening hundreds of new ones
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=30),
+                headers={"Authorization": f"Bearer {AI_API_KEY}"},
+            )
+        return self._ai_session
+
+    async def warmup(self) -> None:
+        """
+        Pay first-request costs up front: compile (or load) the heat kernel
+        and open a pooled connection to the AI API.
+
+        The connection is opened with a GET on the API's origin; only the
+        DNS/TCP/TLS setup matters, so any response (even a 404) will do.
+        """
+        _heat_kernel(0, 0, 0, 0, 0)
+        if not (AI_API_URL and AI_API_KEY):
+            return
+        origin = "{0.scheme}://{0.netloc}/".format(urlsplit(AI_API_URL))
+        try:
+            async with self._get_ai_session().get(origin) as response:
+                await response.read()
+        except Exception as e:
+            logger.info(f"AI API warmup connection failed: {e}")
+
+    async def aclose(self) -> None:
+        """Close the AI API session's pooled connections."""
+        if self._ai_session is not None:
+            await self._ai_session.close()
+            self._ai_session = None
 
     def get_profile(self, bookmaker: str) -> BookmakerProfile:
         """Get or create a bookmaker profile."""
-        if bookmaker not in self._profiles:
-            self._profiles[bookmaker] = BookmakerProfile(bookmaker=bookmaker)
-        profile = self._profiles[bookmaker]
+        profile = self._profiles.get(bookmaker)
+        if profile is None:
+            profile = self._profiles.setdefault(bookmaker, BookmakerProfile(bookmaker=bookmaker))
         profile.decay_heat()  # Apply time decay on access
         return profile
 
-    async def evaluate(self, opportunity: ArbOpportunity, context: Dict[str, Any]) -> DecisionResponse:
+    async def evaluate(
+        self, opportunity: ArbOpportunity, context: Dict[str, Any], seed: Optional[int] = None
+    ) -> DecisionResponse:
         """
         Evaluate an arb opportunity through the stealth lens.
 
@@ -188,16 +367,12 @@ class StealthAdvisor:
         - COVER: Place a cover bet instead
         - DELAY: Wait before placing
         - COOL: Account needs cooling period
-        """
-        # Extract bookmakers from legs
-        bookmakers = [leg.get("bookmaker", "") for leg in opportunity.legs]
-        profiles = {bm: self.get_profile(bm) for bm in bookmakers if bm}
 
-        # Build analysis context
-        analysis = self._build_analysis(opportunity, profiles)
+        ``seed`` makes the rule-based dice rolls reproducible (e.g. replays).
+        """
+        profiles, analysis, hard_block = self._prepare(opportunity)
 
-        # Check hard limits first
-        hard_block = self._check_hard_limits(profiles, analysis)
+        # Hard limits come first
         if hard_block:
             return hard_block
 
@@ -205,14 +380,82 @@ class StealthAdvisor:
         if AI_API_URL and AI_API_KEY:
             return await self._ai_reasoning(opportunity, analysis, profiles)
         else:
-            return self._rule_based_reasoning(opportunity, analysis, profiles)
+            return self._rule_based_reasoning(opportunity, analysis, profiles, self._seeded(seed))
+
+    async def evaluate_batch(
+        self, items: List[Tuple[ArbOpportunity, Dict[str, Any]]], seed: Optional[int] = None
+    ) -> List[DecisionResponse]:
+        """
+        Evaluate several opportunities with at most one AI call.
 
-    def _build_analysis(
+        Hard limits, cached AI decisions and the rule-based path are resolved
+        locally; everything left goes to the AI API in a single prompt.
+        Decisions are returned in input order. ``seed`` works as in evaluate,
+        drawing the whole batch from one seeded generator.
+        """
+        rng = self._seeded(seed)
+        decisions: List[Optional[DecisionResponse]] = [None] * len(items)
+        pending = []
+        for i, (opportunity, _context) in enumerate(items):
+            profiles, analysis, hard_block = self._prepare(opportunity)
+            if hard_block:
+                decisions[i] = hard_block
+            elif not (AI_API_URL and AI_API_KEY):
+                decisions[i] = self._rule_based_reasoning(opportunity, analysis, profiles, rng)
+            else:
+                cache_key = self._ai_cache_key(opportunity, analysis, profiles)
+                decisions[i] = self._cached_ai_decision(cache_key)
+                if decisions[i] is None:
+                    pending.append((i, opportunity, analysis, profiles, cache_key))
+
+        if len(pending) == 1:
+            i, opportunity, analysis, profiles, _ = pending[0]
+            decisions[i] = await self._ai_reasoning(opportunity, analysis, profiles)
+        elif pending:
+            prompt = _PROMPT_INTRO + "\n\n".join(
+                f"OPPORTUNITY {n}:\n{self._opportunity_prompt(opportunity, analysis)}"
+                for n, (_, opportunity, analysis, _, _) in enumerate(pending, 1)
+            ) + _BATCH_PROMPT_TAIL
+            try:
+                results = (await self._ai_complete(prompt)).get("decisions", [])
+                if len(results) != len(pending):
+                    raise ValueError(f"expected {len(pending)} decisions, got {len(results)}")
+                for (i, _, analysis, profiles, cache_key), result in zip(pending, results):
+                    decisions[i] = self._ai_decision(result, profiles)
+                    self._cache_ai_decision(cache_key, decisions[i], analysis["is_live"])
+            except Exception as e:
+                logger.warning(f"AI batch reasoning failed, falling back to rule-based: {e}")
+                for i, opportunity, analysis, profiles, _ in pending:
+                    decisions[i] = self._rule_based_reasoning(opportunity, analysis, profiles, rng)
+
+        return decisions
+
+    def _seeded(self, seed: Optional[int]) -> random.Random:
+        """The advisor's generator, or a fresh one for an explicit seed."""
+        return self._rng if seed is None else random.Random(seed)
+
+    def _prepare(
+        self, opportunity: ArbOpportunity
+    ) -> Tuple[Dict[str, BookmakerProfile], Dict[str, Any], Optional[DecisionResponse]]:
+        """Profiles of the opportunity's bookmakers, its analysis and any hard block."""
+        # Extract bookmakers from legs
+        bookmakers = [leg.get("bookmaker", "") for leg in opportunity.legs]
+        profiles = {bm: self.get_profile(bm) for bm in bookmakers if bm}
+        analysis, hard_block = self._analyze_and_check(opportunity, profiles)
+        return profiles, analysis, hard_block
+
+    def _analyze_and_check(
         self,
         opportunity: ArbOpportunity,
         profiles: Dict[str, BookmakerProfile],
-    ) -> Dict[str, Any]:
-        """Build a comprehensive analysis context for reasoning."""
+    ) -> Tuple[Dict[str, Any], Optional[DecisionResponse]]:
+        """
+        Build the analysis context for reasoning and check hard limits.
+
+        One pass over the profiles gathers the heat summary and the first
+        bookmaker that needs cooling or is over its daily arb limit. Returns
+        the analysis and a blocking decision, if any.
+        """
         profit_pct = opportunity.profit_percentage or 0
         now = datetime.utcnow()
 
@@ -221,20 +464,18 @@ class StealthAdvisor:
         is_peak_hours = 10 <= hour <= 23  # Normal betting hours
         is_off_hours = hour < 7 or hour > 1  # Suspicious hours
 
-        # Bookmaker heat summary
+        # Bookmaker heat summary and hard-limit violators
         heat_summary = {}
         max_heat = 0
+        cooling: Optional[Tuple[str, BookmakerProfile]] = None
+        over_limit: Optional[Tuple[str, BookmakerProfile]] = None
         for bm, profile in profiles.items():
-            heat_summary[bm] = {
-                "heat_score": round(profile.heat_score, 1),
-                "win_rate": round(profile.win_rate, 3),
-                "total_bets": profile.total_bets,
-                "arb_bets_today": profile.arb_bets_today,
-                "consecutive_wins": profile.consecutive_wins,
-                "is_hot": profile.is_hot,
-                "needs_cooling": profile.needs_cooling,
-            }
+            summary = heat_summary[bm] = profile.summary()
             max_heat = max(max_heat, profile.heat_score)
+            if cooling is None and summary["needs_cooling"]:
+                cooling = bm, profile
+            if over_limit is None and profile.arb_bets_today >= MAX_ARB_FREQUENCY_PER_DAY:
+                over_limit = bm, profile
 
         # Opportunity quality
         quality = "low"
@@ -243,7 +484,7 @@ class StealthAdvisor:
         elif profit_pct >= 1.5:
             quality = "medium"
 
-        return {
+        analysis = {
             "profit_pct": profit_pct,
             "quality": quality,
             "is_live": opportunity.is_live,
@@ -256,51 +497,45 @@ class StealthAdvisor:
             "bookmaker_count": len(profiles),
         }
 
-    def _check_hard_limits(
-        self,
-        profiles: Dict[str, BookmakerProfile],
-        analysis: Dict[str, Any],
-    ) -> Optional[DecisionResponse]:
-        """Check hard limits that should always block betting."""
-
         # Any bookmaker needs cooling
-        for bm, profile in profiles.items():
-            if profile.needs_cooling:
-                remaining = ""
-                if profile.cooling_until:
-                    mins = int((profile.cooling_until - datetime.utcnow()).total_seconds() / 60)
-                    remaining = f" ({mins}min remaining)"
-                return DecisionResponse(
-                    decision="cool",
-                    rationale=(
-                        f"🧊 COOLING REQUIRED for {bm}{remaining}. "
-                        f"Heat score: {profile.heat_score:.0f}/100. "
-                        f"Win rate: {profile.win_rate:.0%}. "
-                        f"Consecutive wins: {profile.consecutive_wins}. "
-                        f"Placing bets now would risk account limiting."
-                    ),
-                )
+        if cooling is not None:
+            bm, profile = cooling
+            remaining = ""
+            if profile.cooling_until:
+                mins = int((profile.cooling_until - now).total_seconds() / 60)
+                remaining = f" ({mins}min remaining)"
+            return analysis, DecisionResponse(
+                decision="cool",
+                rationale=(
+                    f"🧊 COOLING REQUIRED for {bm}{remaining}. "
+                    f"Heat score: {profile.heat_score:.0f}/100. "
+                    f"Win rate: {profile.win_rate:.0%}. "
+                    f"Consecutive wins: {profile.consecutive_wins}. "
+                    f"Placing bets now would risk account limiting."
+                ),
+            )
 
         # Daily arb limit exceeded
-        for bm, profile in profiles.items():
-            if profile.arb_bets_today >= MAX_ARB_FREQUENCY_PER_DAY:
-                return DecisionResponse(
-                    decision="skip",
-                    rationale=(
-                        f"⏸️ Daily arb limit reached for {bm} "
-                        f"({profile.arb_bets_today}/{MAX_ARB_FREQUENCY_PER_DAY}). "
-                        f"More arb bets today would create a detectable pattern. "
-                        f"Consider placing a recreational bet instead."
-                    ),
-                )
-
-        return None
+        if over_limit is not None:
+            bm, profile = over_limit
+            return analysis, DecisionResponse(
+                decision="skip",
+                rationale=(
+                    f"⏸️ Daily arb limit reached for {bm} "
+                    f"({profile.arb_bets_today}/{MAX_ARB_FREQUENCY_PER_DAY}). "
+                    f"More arb bets today would create a detectable pattern. "
+                    f"Consider placing a recreational bet instead."
+                ),
+            )
+
+        return analysis, None
 
     def _rule_based_reasoning(
         self,
         opportunity: ArbOpportunity,
         analysis: Dict[str, Any],
         profiles: Dict[str, BookmakerProfile],
+        rng: Optional[random.Random] = None,
     ) -> DecisionResponse:
         """
         Rule-based stealth reasoning when no AI API is configured.
@@ -310,6 +545,7 @@ class StealthAdvisor:
         2. Medium arbs (1.5-3%) - take if heat is low, sometimes skip
         3. Low arbs (<1.5%) - skip more often, not worth the heat
         """
+        rng = rng or self._rng
         profit_pct = analysis["profit_pct"]
         max_heat = analysis["max_heat"]
         quality = analysis["quality"]
@@ -320,7 +556,7 @@ class StealthAdvisor:
         skip_chance = self._calculate_skip_probability(max_heat, quality, is_live)
 
         # Roll the dice - sometimes we intentionally pass
-        if random.random() < skip_chance:
+        if rng.random() < skip_chance:
             hottest_bm = max(profiles.keys(), key=lambda b: profiles[b].heat_score)
             profile = profiles[hottest_bm]
             reasons.append(
@@ -333,8 +569,8 @@ class StealthAdvisor:
             return DecisionResponse(decision="skip", rationale=" ".join(reasons))
 
         # ── Cover bet suggestion ──
-        if self._should_suggest_cover(profiles):
-            cover = self._generate_cover_bet_suggestion(profiles)
+        if self._should_suggest_cover(profiles, rng):
+            cover = self._generate_cover_bet_suggestion(profiles, rng)
             reasons.append(
                 f"🎭 COVER BET RECOMMENDED before taking this arb. "
                 f"{cover['suggestion']}. "
@@ -343,7 +579,7 @@ class StealthAdvisor:
             return DecisionResponse(decision="cover_then_take", rationale=" ".join(reasons))
 
         # ── Delay suggestion ──
-        delay_seconds = self._calculate_delay(analysis, profiles)
+        delay_seconds = self._calculate_delay(analysis, profiles, rng)
         if delay_seconds > 0:
             reasons.append(f"⏱️ Delay {delay_seconds}s before placing.")
 
@@ -373,31 +609,16 @@ class StealthAdvisor:
 
         LOOSENED: Only skip when really necessary.
         """
-        base_skip = 0.0
-
-        # Quality-based skip rate (loosened significantly)
-        if quality == "high":
-            base_skip = 0.02  # Only skip 2% of >3% arbs - almost never skip these
-        elif quality == "medium":
-            base_skip = 0.06  # Skip 6% of 1.5-3% arbs
-        else:
-            base_skip = 0.12  # Skip 12% of <1.5% arbs
-
-        # Heat modifier - only skip more when really hot
-        if max_heat > 75:
-            base_skip += 0.15
-        elif max_heat > 55:
-            base_skip += 0.08
-        elif max_heat > 35:
-            base_skip += 0.03
-
-        # Live betting - small additional skip
-        if is_live:
-            base_skip += 0.05
-
-        return min(base_skip, 0.50)  # Never skip more than 50%
+        skip = (
+            _SKIP_BASE.get(quality, _SKIP_BASE["low"])
+            + _SKIP_HEAT_BONUS[bisect_left(_SKIP_HEAT_THRESHOLDS, max_heat)]
+            + _SKIP_LIVE_BONUS * is_live
+        )
+        return min(skip, _SKIP_MAX)
 
-    def _should_suggest_cover(self, profiles: Dict[str, BookmakerProfile]) -> bool:
+    def _should_suggest_cover(
+        self, profiles: Dict[str, BookmakerProfile], rng: random.Random
+    ) -> bool:
         """Determine if a cover bet should be placed before the arb. LOOSENED."""
         for profile in profiles.values():
             # Suggest cover only if win rate is very high
@@ -407,12 +628,12 @@ class StealthAdvisor:
             if profile.consecutive_wins >= 7:
                 return True
             # Random cover bet - now much rarer (5% default)
-            if random.random() < COVER_BET_PROBABILITY:
+            if rng.random() < COVER_BET_PROBABILITY:
                 return True
         return False
 
     def _generate_cover_bet_suggestion(
-        self, profiles: Dict[str, BookmakerProfile]
+        self, profiles: Dict[str, BookmakerProfile], rng: random.Random
     ) -> Dict[str, Any]:
         """Generate a cover bet suggestion to look recreational."""
         hottest_bm = max(profiles.keys(), key=lambda b: profiles[b].heat_score)
@@ -444,41 +665,36 @@ class StealthAdvisor:
             },
         ]
 
-        return random.choice(cover_types)
+        return rng.choice(cover_types)
 
     def _calculate_delay(
-        self, analysis: Dict[str, Any], profiles: Dict[str, BookmakerProfile]
+        self, analysis: Dict[str, Any], profiles: Dict[str, BookmakerProfile], rng: random.Random
     ) -> int:
         """Calculate delay in seconds before placing bet."""
         delay = 0
 
         # Off-hours betting is suspicious
         if analysis.get("is_off_hours"):
-            delay += random.randint(30, 120)
+            delay += rng.randint(30, 120)
 
         # High heat = more delay
         max_heat = analysis.get("max_heat", 0)
         if max_heat > 50:
-            delay += random.randint(15, 60)
+            delay += rng.randint(15, 60)
 
         # Check if betting too fast after last bet
         for profile in profiles.values():
-            if profile.last_bet_at:
-                seconds_since = (datetime.utcnow() - profile.last_bet_at).total_seconds()
+            if profile.last_bet_ts:
+                seconds_since = time.time() - profile.last_bet_ts
                 if seconds_since < 60:
-                    delay += random.randint(30, 90)
+                    delay += rng.randint(30, 90)
 
         return delay
 
     def _calculate_stake_modifier(self, max_heat: float, quality: str) -> float:
         """Calculate stake reduction factor based on heat and quality. LOOSENED."""
-        if max_heat > 85:
-            return 0.6  # Reduce to 60% only when very hot
-        if max_heat > 70:
-            return 0.8  # Reduce to 80%
-        if quality == "low" and max_heat > 50:
-            return 0.85  # Slight reduction on low-quality when warm
-        return 1.0  # Full stakes most of the time
+        modifiers = _STAKE_MODIFIERS.get(quality, _STAKE_MODIFIERS["low"])
+        return modifiers[bisect_left(_STAKE_HEAT_THRESHOLDS, max_heat)]
 
     async def _ai_reasoning(
         self,
@@ -490,86 +706,138 @@ class StealthAdvisor:
         Use LLM reasoning for stealth advice.
         Falls back to rule-based if API call fails.
         """
-        prompt = f"""You are a stealth betting advisor. Your goal is to maximize long-term profit by extending account longevity, even if it means sacrificing some short-term +EV opportunities.
-
-OPPORTUNITY:
-- Profit: {analysis['profit_pct']:.2f}% ({analysis['quality']} quality)
-- Market: {opportunity.market}
-- Is Live: {analysis['is_live']}
-- Time: {analysis['hour']}:00 ({'peak hours' if analysis['is_peak_hours'] else 'off hours'})
-
-BOOKMAKER HEAT SCORES:
-{json.dumps(analysis['heat_summary'], indent=2)}
-
-STRATEGY GUIDELINES:
-- High heat (>60): Skip more opportunities, suggest cover bets
-- High win rate (>65%): Account needs cover bets to look recreational
-- Daily arb limit: {MAX_ARB_FREQUENCY_PER_DAY} per bookmaker
-- Low-quality arbs (<1.5%): Not worth the heat, skip more often
-- Live bets: More suspicious, higher skip probability
+        cache_key = self._ai_cache_key(opportunity, analysis, profiles)
+        cached = self._cached_ai_decision(cache_key)
+        if cached is not None:
+            return cached
 
-DECISION OPTIONS:
-1. "take" - Place the arb bet (with optional delay/stake modifier)
-2. "skip" - Pass on this opportunity to maintain recreational pattern
-3. "cover_then_take" - Place a cover bet first, then take the arb
-4. "delay" - Wait before placing (specify seconds)
-
-Respond with JSON:
-{{"decision": "take|skip|cover_then_take|delay", "rationale": "detailed explanation", "delay_seconds": 0, "stake_modifier": 1.0, "cover_bet": null}}
-"""
+        prompt = f"{_PROMPT_HEAD}{self._opportunity_prompt(opportunity, analysis)}{_PROMPT_TAIL}"
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    AI_API_URL,
-                    headers={"Authorization": f"Bearer {AI_API_KEY}"},
-                    json={
-                        "model": AI_MODEL,
-                        "messages": [{"role": "user", "content": prompt}],
-                        "response_format": {"type": "json_object"},
-                    },
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                # Parse response
-                content = data.get("choices", [{}])[0].get("message", {}).get("content", "{}")
-                result = json.loads(content)
-
-                decision = result.get("decision", "take")
-                rationale = result.get("rationale", "AI reasoning completed.")
-
-                # Add heat context to rationale
-                heat_status = ", ".join(
-                    f"{bm}={p.heat_score:.0f}" for bm, p in profiles.items()
-                )
-                full_rationale = f"🤖 AI STEALTH ADVICE: {rationale} [Heat: {heat_status}]"
-
-                return DecisionResponse(decision=decision, rationale=full_rationale)
+            result = self._ai_decision(await self._ai_complete(prompt), profiles)
+            self._cache_ai_decision(cache_key, result, analysis["is_live"])
+            return result
 
         except Exception as e:
             logger.warning(f"AI reasoning failed, falling back to rule-based: {e}")
             return self._rule_based_reasoning(opportunity, analysis, profiles)
 
+    @staticmethod
+    def _opportunity_prompt(opportunity: ArbOpportunity, analysis: Dict[str, Any]) -> str:
+        """The per-opportunity lines of the AI prompt."""
+        return (
+            f"- Profit: {analysis['profit_pct']:.2f}% ({analysis['quality']} quality)\n"
+            f"- Market: {opportunity.market}\n"
+            f"- Is Live: {analysis['is_live']}\n"
+            f"- Time: {analysis['hour']}:00 "
+            f"({'peak hours' if analysis['is_peak_hours'] else 'off hours'})\n"
+            f"\nBOOKMAKER HEAT SCORES:\n"
+            f"{json.dumps(analysis['heat_summary'], separators=(',', ':'))}"
+        )
+
+    async def _ai_complete(self, prompt: str) -> Dict[str, Any]:
+        """Send ``prompt`` to the AI API and return its parsed JSON answer."""
+        # Pooled connection: no TCP/TLS handshake per decision
+        async with self._get_ai_session().post(
+            AI_API_URL,
+            json={
+                "model": AI_MODEL,
+                "messages": [{"role": "user", "content": prompt}],
+                "response_format": {"type": "json_object"},
+            },
+        ) as response:
+            response.raise_for_status()
+            data = await response.json()
+
+        # Parse response
+        content = data.get("choices", [{}])[0].get("message", {}).get("content", "{}")
+        return json.loads(content)
+
+    @staticmethod
+    def _ai_decision(
+        result: Dict[str, Any], profiles: Dict[str, BookmakerProfile]
+    ) -> DecisionResponse:
+        """DecisionResponse for one AI answer, tagged with current heat."""
+        decision = result.get("decision", "take")
+        rationale = result.get("rationale", "AI reasoning completed.")
+
+        # Add heat context to rationale
+        heat_status = ", ".join(
+            f"{bm}={p.heat_score:.0f}" for bm, p in profiles.items()
+        )
+        full_rationale = f"🤖 AI STEALTH ADVICE: {rationale} [Heat: {heat_status}]"
+        return DecisionResponse(decision=decision, rationale=full_rationale)
+
+    def _ai_cache_key(
+        self,
+        opportunity: ArbOpportunity,
+        analysis: Dict[str, Any],
+        profiles: Dict[str, BookmakerProfile],
+    ) -> tuple:
+        """Fingerprint of what the AI prompt depends on, with heat bucketed."""
+        heat = tuple(sorted(
+            (bm, round(p.heat_score / AI_CACHE_HEAT_BUCKET)) for bm, p in profiles.items()
+        ))
+        return (
+            opportunity.market,
+            analysis["quality"],
+            round(analysis["profit_pct"], 2),
+            analysis["is_live"],
+            heat,
+        )
+
+    def _cached_ai_decision(self, key: tuple) -> Optional[DecisionResponse]:
+        """Unexpired cached AI decision for ``key``, restamped to now."""
+        entry = self._ai_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, decision = entry
+        if time.monotonic() >= expires_at:
+            del self._ai_cache[key]
+            return None
+        self._ai_cache.move_to_end(key)
+        return decision.model_copy(update={"decided_at": datetime.utcnow()})
+
+    def _cache_ai_decision(self, key: tuple, decision: DecisionResponse, is_live: bool) -> None:
+        if AI_CACHE_SIZE <= 0:
+            return
+        ttl = AI_CACHE_TTL_LIVE_SECONDS if is_live else AI_CACHE_TTL_SECONDS
+        self._ai_cache[key] = (time.monotonic() + ttl, decision)
+        self._ai_cache.move_to_end(key)
+        while len(self._ai_cache) > AI_CACHE_SIZE:
+            self._ai_cache.popitem(last=False)
+
     def get_all_heat_scores(self) -> Dict[str, Dict[str, Any]]:
-        """Get heat scores for all tracked bookmakers."""
+        """
+        Get heat scores for all tracked bookmakers.
+
+        Timestamps are naive UTC datetimes (or None); JSON responses render
+        them as ISO 8601.
+        """
         result = {}
+        now = time.time()  # one clock read for the whole sweep
         for bm, profile in self._profiles.items():
-            profile.decay_heat()  # Apply decay
-            result[bm] = {
-                "heat_score": round(profile.heat_score, 1),
-                "win_rate": round(profile.win_rate, 3),
-                "total_bets": profile.total_bets,
-                "arb_bets": profile.arb_bets,
-                "arb_bets_today": profile.arb_bets_today,
-                "consecutive_wins": profile.consecutive_wins,
-                "is_hot": profile.is_hot,
-                "needs_cooling": profile.needs_cooling,
-                "cooling_until": profile.cooling_until.isoformat() if profile.cooling_until else None,
-                "last_bet_at": profile.last_bet_at.isoformat() if profile.last_bet_at else None,
-            }
+            profile.decay_heat(now)
+            result[bm] = self._heat_entry(profile)
         return result
 
+    def get_heat_score(self, bookmaker: str) -> Optional[Dict[str, Any]]:
+        """Heat score for one tracked bookmaker, or None if it has no profile yet."""
+        profile = self._profiles.get(bookmaker)
+        if profile is None:
+            return None
+        profile.decay_heat()
+        return self._heat_entry(profile)
+
+    @staticmethod
+    def _heat_entry(profile: BookmakerProfile) -> Dict[str, Any]:
+        return {
+            **profile.summary(),
+            "arb_bets": profile.arb_bets,
+            "cooling_until": profile.cooling_until,
+            "last_bet_at": profile.last_bet_at,
+        }
+
     def record_bet_result(
         self, bookmaker: str, is_arb: bool, stake: float, profit: float, won: bool
     ) -> None:
@@ -5,13 +5,17 @@ Playwright, stealth drivers). Unit tests and lightweight environments should
 still be able to import the prediction-market adapters without having those
 dependencies installed.
 
-So: we eagerly export the lightweight adapters and *guard* imports of
-browser-based adapters.
+So: we eagerly export the lightweight adapters and import browser-based
+adapters lazily, on first attribute access (PEP 562). Importing the package
+(or any submodule) never loads a browser stack; accessing an adapter whose
+dependencies are missing raises AttributeError / ImportError as if it were
+not exported.
 """
 
 from __future__ import annotations
 
-from typing import List
+import importlib
+from typing import Dict, List, Tuple
 
 # Always-available, API-only adapters
 from .prediction_markets import (  # noqa: F401
@@ -47,55 +51,37 @@ __all__: List[str] = [
 ]
 
 
-def _try_export(name: str, fn) -> None:
-    """Best-effort optional import/export.
+# Optional adapters (browser stacks and extra deps): name -> (submodule, attribute)
+_LAZY: Dict[str, Tuple[str, str]] = {
+    "BaseFeedAdapter": ("base", "BaseFeedAdapter"),
+    "GenericSportsbookAdapter": ("generic", "GenericSportsbookAdapter"),
+    "PlaywrightFeedAdapter": ("playwright_adapter", "PlaywrightFeedAdapter"),
+    "PlaywrightGenericAdapter": ("playwright_generic", "PlaywrightGenericAdapter"),
+    "PinnacleAdapter": ("pinnacle_adapter", "PinnacleAdapter"),
+    "CLVCalculator": ("pinnacle_adapter", "CLVCalculator"),
+    "OddsAPIAdapter": ("odds_api_adapter", "OddsAPIAdapter"),
+    "InterceptingAdapter": ("intercepting_adapter", "InterceptingAdapter"),
+    "DraftKingsPublicAPIAdapter": ("draftkings_public_api", "DraftKingsPublicAPIAdapter"),
+}
 
-    We swallow ImportError so unit tests can run without browser dependencies.
-    """
+__all__.extend(_LAZY)
 
-    try:
-        obj = fn()
-    except ImportError:
-        return
-    except Exception:
-        # Defensive: don't break package import on unexpected environment issues.
-        return
-    globals()[name] = obj
-    __all__.append(name)
 
+def __getattr__(name: str):
+    """Import an optional adapter the first time it is accessed."""
+    target = _LAZY.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = target
+    try:
+        obj = getattr(importlib.import_module("." + module_name, __name__), attr)
+    except ImportError as e:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r} ({e})"
+        ) from e
+    globals()[name] = obj  # later lookups skip __getattr__
+    return obj
 
-# Optional adapters (browser stacks and extra deps)
-_try_export("BaseFeedAdapter", lambda: __import__(__name__ + ".base", fromlist=["BaseFeedAdapter"]).BaseFeedAdapter)
-_try_export(
-    "GenericSportsbookAdapter",
-    lambda: __import__(__name__ + ".generic", fromlist=["GenericSportsbookAdapter"]).GenericSportsbookAdapter,
-)
-_try_export(
-    "PlaywrightFeedAdapter",
-    lambda: __import__(__name__ + ".playwright_adapter", fromlist=["PlaywrightFeedAdapter"]).PlaywrightFeedAdapter,
-)
-_try_export(
-    "PlaywrightGenericAdapter",
-    lambda: __import__(__name__ + ".playwright_generic", fromlist=["PlaywrightGenericAdapter"]).PlaywrightGenericAdapter,
-)
-_try_export(
-    "PinnacleAdapter",
-    lambda: __import__(__name__ + ".pinnacle_adapter", fromlist=["PinnacleAdapter"]).PinnacleAdapter,
-)
-_try_export(
-    "CLVCalculator",
-    lambda: __import__(__name__ + ".pinnacle_adapter", fromlist=["CLVCalculator"]).CLVCalculator,
-)
-_try_export(
-    "OddsAPIAdapter",
-    lambda: __import__(__name__ + ".odds_api_adapter", fromlist=["OddsAPIAdapter"]).OddsAPIAdapter,
-)
-_try_export(
-    "InterceptingAdapter",
-    lambda: __import__(__name__ + ".intercepting_adapter", fromlist=["InterceptingAdapter"]).InterceptingAdapter,
-)
-_try_export(
-    "DraftKingsPublicAPIAdapter",
-    lambda: __import__(__name__ + ".draftkings_public_api", fromlist=["DraftKingsPublicAPIAdapter"]).DraftKingsPublicAPIAdapter,
-)
 
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
@@ -4,11 +4,15 @@ Defines the interface that all sportsbook-specific adapters must implement.
 """
 from __future__ import annotations
 
+import json
 import logging
+import os
 import time
 from abc import ABC, abstractmethod
 from datetime import datetime
+from pathlib import Path
 from typing import List, Optional
+from urllib.parse import urlsplit
 
 from selenium.webdriver.remote.webdriver import WebDriver
 
@@ -23,6 +27,11 @@ from ..stealth import create_stealth_driver, jittered_delay
 
 logger = logging.getLogger(__name__)
 
+# Cookies saved after a successful login are replayed on the next login()
+# while younger than this, skipping the form/2FA flow
+SESSION_DIR = Path(os.getenv("SESSION_DIR", "/tmp/arb-desk-sessions"))
+SESSION_TTL_SECONDS = float(os.getenv("FEED_SESSION_TTL_HOURS", "12")) * 3600
+
 
 class BaseFeedAdapter(ABC):
     """
@@ -88,17 +97,19 @@ class BaseFeedAdapter(ABC):
             self.initialize()
         
         try:
+            if self._restore_session():
+                self._mark_logged_in()
+                logger.info(f"[{self.bookmaker}] Restored saved session")
+                return True
+            
             logger.info(f"[{self.bookmaker}] Attempting login...")
             jittered_delay(self.config.min_delay_seconds, self.config.max_delay_seconds)
             
             success = self._perform_login()
             
             if success:
-                self.session_status.logged_in = True
-                self.session_status.session_valid = True
-                self.session_status.last_login_at = datetime.utcnow()
-                self.session_status.login_failures = 0
-                self.session_status.error = None
+                self._save_session()
+                self._mark_logged_in()
                 logger.info(f"[{self.bookmaker}] Login successful")
             else:
                 self.session_status.login_failures += 1
@@ -113,6 +124,63 @@ class BaseFeedAdapter(ABC):
             logger.error(f"[{self.bookmaker}] Login error: {e}")
             return False
     
+    def _mark_logged_in(self) -> None:
+        self.session_status.logged_in = True
+        self.session_status.session_valid = True
+        self.session_status.last_login_at = datetime.utcnow()
+        self.session_status.login_failures = 0
+        self.session_status.error = None
+    
+    @property
+    def _session_file(self) -> Path:
+        return SESSION_DIR / f"{self.bookmaker.lower()}.cookies.json"
+    
+    def _save_session(self) -> None:
+        """Persist the driver's cookies after a successful login."""
+        if self.driver is None:
+            return  # Driverless adapters (API wrappers) have no cookies
+        try:
+            SESSION_DIR.mkdir(parents=True, exist_ok=True)
+            with open(self._session_file, "w") as f:
+                json.dump({"saved_at": time.time(), "cookies": self.driver.get_cookies()}, f)
+        except Exception as e:
+            logger.warning(f"[{self.bookmaker}] Failed to save session: {e}")
+    
+    def _restore_session(self) -> bool:
+        """
+        Replay saved cookies if they are fresh enough and still accepted.
+        Returns False (fall through to a full login) otherwise.
+        """
+        if self.driver is None:
+            return False
+        home_url = self.config.login_url or next(iter(self.config.odds_urls or []), None)
+        if not home_url or not self._session_file.exists():
+            return False
+        
+        try:
+            with open(self._session_file, "r") as f:
+                state = json.load(f)
+            if time.time() - state.get("saved_at", 0) > SESSION_TTL_SECONDS:
+                return False
+            
+            # Cookies can only be set for the domain currently loaded
+            parts = urlsplit(home_url)
+            self.driver.get(f"{parts.scheme}://{parts.netloc}/")
+            for cookie in state.get("cookies", []):
+                try:
+                    self.driver.add_cookie(cookie)
+                except Exception:
+                    continue
+            self.driver.refresh()
+            return self._verify_session()
+        except Exception as e:
+            logger.warning(f"[{self.bookmaker}] Failed to restore session: {e}")
+            return False
+    
+    def _verify_session(self) -> bool:
+        """Check a restored session is logged in. Override for a real check."""
+        return not self._is_session_expired()
+    
     def scrape(self) -> ScrapeResult:
         """
         Scrape current odds from the sportsbook.
@@ -8,16 +8,30 @@ As of 2026, Connecticut has 3 legal online sportsbooks:
 
 These configurations provide the CSS selectors and URLs needed
 for the PlaywrightGenericAdapter to scrape each book.
+
+The configs are read-only (nested MappingProxyType / tuples), so callers can
+share them without copying; build a FeedConfig or dict() one to customize.
 """
 from __future__ import annotations
 
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Mapping
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # FanDuel Connecticut
 # ─────────────────────────────────────────────────────────────────────────────
 
-FANDUEL_CT_CONFIG: Dict[str, Any] = {
+FANDUEL_CT_CONFIG: Mapping[str, Any] = _freeze({
     "bookmaker": "fanduel",
     "enabled": True,
     "login_url": "https://sportsbook.fanduel.com/login",
@@ -66,14 +80,14 @@ FANDUEL_CT_CONFIG: Dict[str, Any] = {
         "confirmation_selector": ".bet-confirmed, [data-testid='bet-confirmation']",
         "betslip_odds_selector": ".betslip .odds, [data-testid='betslip-odds']",
     },
-}
+})
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # DraftKings Connecticut
 # ─────────────────────────────────────────────────────────────────────────────
 
-DRAFTKINGS_CT_CONFIG: Dict[str, Any] = {
+DRAFTKINGS_CT_CONFIG: Mapping[str, Any] = _freeze({
     "bookmaker": "draftkings",
     "enabled": True,
     "login_url": "https://sportsbook.draftkings.com/login",
@@ -125,14 +139,14 @@ DRAFTKINGS_CT_CONFIG: Dict[str, Any] = {
         "confirmation_selector": ".bet-receipt, [data-testid='bet-confirmation']",
         "betslip_odds_selector": ".betslip-odds, [data-testid='selection-odds']",
     },
-}
+})
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Fanatics Connecticut
 # ─────────────────────────────────────────────────────────────────────────────
 
-FANATICS_CT_CONFIG: Dict[str, Any] = {
+FANATICS_CT_CONFIG: Mapping[str, Any] = _freeze({
     "bookmaker": "fanatics",
     "enabled": True,
     "login_url": "https://sportsbook.fanatics.com/login",
@@ -183,26 +197,28 @@ FANATICS_CT_CONFIG: Dict[str, Any] = {
         "confirmation_selector": ".bet-success, .confirmation-message",
         "betslip_odds_selector": ".slip-odds, .selected-odds",
     },
-}
+})
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # All CT Sportsbook Configs
 # ─────────────────────────────────────────────────────────────────────────────
 
-CT_SPORTSBOOK_CONFIGS = {
+CT_SPORTSBOOK_CONFIGS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
     "fanduel": FANDUEL_CT_CONFIG,
     "draftkings": DRAFTKINGS_CT_CONFIG,
     "fanatics": FANATICS_CT_CONFIG,
-}
+})
+
+_EMPTY_CONFIG: Mapping[str, Any] = MappingProxyType({})
 
 
-def get_ct_config(bookmaker: str) -> Dict[str, Any]:
-    """Get configuration for a CT sportsbook by name."""
-    return CT_SPORTSBOOK_CONFIGS.get(bookmaker.lower(), {})
+def get_ct_config(bookmaker: str) -> Mapping[str, Any]:
+    """Get configuration for a CT sportsbook by name (read-only)."""
+    return CT_SPORTSBOOK_CONFIGS.get(bookmaker.lower(), _EMPTY_CONFIG)
 
 
-def get_all_ct_configs() -> Dict[str, Dict[str, Any]]:
-    """Get all CT sportsbook configurations."""
-    return CT_SPORTSBOOK_CONFIGS.copy()
+def get_all_ct_configs() -> Mapping[str, Mapping[str, Any]]:
+    """Get all CT sportsbook configurations (read-only, no copy)."""
+    return CT_SPORTSBOOK_CONFIGS
 
@@ -12,12 +12,30 @@ NO login, NO cookies, NO browser automation required.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-import requests
+import httpx
+import orjson
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# httpx decodes brotli only when this is installed, so only advertise it then
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
 
 from shared.schemas import (
     BookmakerCredentials,
@@ -29,6 +47,116 @@ from shared.schemas import (
 
 logger = logging.getLogger(__name__)
 
+# Navigation (eventGroupId -> sport) barely changes: serve it from cache while
+# fresh, serve it and revalidate alongside the scrape while stale, refetch
+# inline only once it has expired
+NAV_FRESH_SECONDS = float(os.getenv("DK_NAV_FRESH_SECONDS", "600"))
+NAV_STALE_SECONDS = float(os.getenv("DK_NAV_STALE_SECONDS", "3600"))
+
+# Worker processes that decode + walk eventGroup payloads off the event loop
+# (0 = parse in-process). Worth it only on multi-core hosts with big payloads
+PARSE_WORKERS = int(os.getenv("DK_PARSE_WORKERS", "0"))
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+# Where events sit in an eventGroup payload (top level, or under eventGroup)
+_EVENT_PREFIXES = frozenset(("events.item", "eventGroup.events.item"))
+
+# Keyword -> canonical name, checked in order (first match wins)
+_SPORT_TOKENS = (
+    ("nba", "nba"), ("basketball", "nba"),
+    ("nfl", "nfl"), ("football", "nfl"),
+    ("mlb", "mlb"), ("baseball", "mlb"),
+    ("nhl", "nhl"), ("hockey", "nhl"),
+)
+_MARKET_TOKENS = (
+    ("moneyline", "moneyline"), ("winner", "moneyline"),
+    ("spread", "spread"), ("handicap", "spread"),
+    ("total", "total"), ("over", "total"),
+)
+
+
+# The same league/market names repeat across every event in a scrape
+@lru_cache(maxsize=256)
+def _match_sport(text_lower: str) -> Optional[str]:
+    return next((sport for token, sport in _SPORT_TOKENS if token in text_lower), None)
+
+
+@lru_cache(maxsize=256)
+def _match_market(market_lower: str) -> str:
+    return next((market for token, market in _MARKET_TOKENS if token in market_lower), market_lower)
+
+
+# Odds strings come from a small set of prices ("+110", "-115", ...) that
+# repeat across every market, so converting each distinct one once is enough
+@lru_cache(maxsize=4096)
+def _american_to_decimal(american: str) -> Optional[float]:
+    if not american:
+        return None
+    try:
+        american = american.replace("+", "").replace("−", "-").replace("–", "-")
+        odds = int(american)
+        if odds > 0:
+            return 1 + (odds / 100)
+        else:
+            return 1 + (100 / abs(odds))
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+# (event_id, sport, market description, [(selection, decimal odds)])
+MarketRow = Tuple[str, str, str, List[Tuple[str, float]]]
+
+
+def _market_rows(events: Iterable[Dict[str, Any]], sport: str) -> Iterator[MarketRow]:
+    """Walk DraftKings events down to each market's valid prices."""
+    am_to_decimal = _american_to_decimal
+    for event in events:
+        event_id = str(event.get("eventId", ""))
+        event_group_name = event.get("eventGroupName", "")
+        event_sport = (_match_sport(event_group_name.lower()) if event_group_name else None) or sport
+
+        for market in event.get("displayGroups", [{}])[0].get("markets", []):
+            prices = []
+
+            for outcome in market.get("outcomes", []):
+                selection = outcome.get("description", "")
+                odds_decimal = am_to_decimal(outcome.get("oddsAmerican", ""))
+
+                if selection and odds_decimal and odds_decimal > 1.0:
+                    prices.append((selection, odds_decimal))
+
+            yield event_id, event_sport, market.get("description", "moneyline"), prices
+
+
+def _extract_market_rows(body: bytes, sport: str) -> List[MarketRow]:
+    """Process-pool entry point: decode a raw eventGroup body into market rows."""
+    data = orjson.loads(body)
+    events = data.get("events", []) or data.get("eventGroup", {}).get("events", [])
+    return list(_market_rows(events, sport))
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS)
+    return _parse_pool
+
+
+def _collect_events(sink: List[Dict[str, Any]]):
+    """ijson parse target: append each complete event object to sink."""
+    builder = None
+    while True:
+        prefix, event, value = yield
+        if builder is None:
+            if event == "start_map" and prefix in _EVENT_PREFIXES:
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            continue
+        builder.event(event, value)
+        if event == "end_map" and prefix in _EVENT_PREFIXES:
+            sink.append(builder.value)
+            builder = None
+
 
 class DraftKingsPublicAPIAdapter:
     """
@@ -48,10 +176,15 @@ class DraftKingsPublicAPIAdapter:
     HEADERS = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
         "Accept": "application/json",
+        "Accept-Encoding": "br, gzip, deflate" if BROTLI_AVAILABLE else "gzip, deflate",
         "Origin": "https://sportsbook.draftkings.com",
         "Referer": "https://sportsbook.draftkings.com/",
     }
     
+    # Shared by all instances: (monotonic fetched-at, event groups)
+    _nav_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+    _nav_refreshing = False
+    
     def __init__(self, config: FeedConfig, credentials: BookmakerCredentials):
         self.config = config
         self.credentials = credentials
@@ -66,6 +199,29 @@ class DraftKingsPublicAPIAdapter:
         self._scrape_count = 0
         self._error_count = 0
         
+        # Pacing for eventGroup fetches so a full sweep does not trip DK's
+        # rate limiting; extra_config overrides the env defaults per feed
+        extra = config.extra_config or {}
+        self._max_concurrent = max(1, int(extra.get(
+            "max_concurrent", os.getenv("DK_MAX_CONCURRENT", "4"))))
+        self._min_request_interval_s = float(extra.get(
+            "min_request_interval_seconds", os.getenv("DK_MIN_REQUEST_INTERVAL_SECONDS", "0.10")))
+        self._next_request_at = 0.0
+        
+        # Optionally emit only markets whose prices moved since the last
+        # scrape. Off by default: downstream /process treats each payload as
+        # a full snapshot. Maps (event_id, market description) to
+        # (outcome prices, scrape generation it was last seen in)
+        self._emit_changes_only = str(extra.get(
+            "emit_changes_only", os.getenv("DK_EMIT_CHANGES_ONLY", "false"))).lower() == "true"
+        self._last_market_prices: Dict[Tuple[str, str], Tuple[tuple, int]] = {}
+        self._generation = 0
+        
+        # Keep-alive client for scrape_async(), bound to the loop it was
+        # created on (the poller's); created lazily
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        
         logger.info("[DK PUBLIC] DraftKings Public API Adapter initialized")
     
     def initialize(self) -> None:
@@ -76,8 +232,20 @@ class DraftKingsPublicAPIAdapter:
         self.session_status.last_login_at = datetime.utcnow()
     
     def close(self) -> None:
-        """Close adapter (no-op for public API)."""
+        """Close adapter and its pooled HTTP client."""
         logger.info("[DK PUBLIC] Closing DraftKings Public API adapter")
+        client, loop = self._client, self._client_loop
+        self._client = self._client_loop = None
+        if client is None or client.is_closed or loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            loop.create_task(client.aclose())
+        else:
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
     
     def login(self) -> bool:
         """Login (no-op for public API - always returns True)."""
@@ -87,51 +255,40 @@ class DraftKingsPublicAPIAdapter:
         return True
     
     def scrape(self) -> ScrapeResult:
-        """Scrape odds from DraftKings public API."""
+        """Scrape odds from DraftKings public API (blocking wrapper)."""
+        async def _run() -> ScrapeResult:
+            # The pooled client cannot cross event loops; use a scoped one
+            async with self._new_client() as client:
+                return await self._scrape(client)
+        return asyncio.run(_run())
+
+    async def scrape_async(self) -> ScrapeResult:
+        """Scrape odds from DraftKings public API over the pooled client."""
+        return await self._scrape(self._get_client())
+
+    def _new_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            headers=self.HEADERS,
+            timeout=10,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+            # Retries connection failures only; HTTP errors surface as-is
+            transport=httpx.AsyncHTTPTransport(retries=2),
+        )
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the keep-alive client for the running loop, creating it once."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = self._new_client()
+            self._client_loop = loop
+        return self._client
+
+    async def _scrape(self, client: httpx.AsyncClient) -> ScrapeResult:
         start_time = time.time()
         
         try:
             logger.info("[DK PUBLIC] Starting public API scrape")
-            
-            # Step 1: Get navigation data to find eventGroupIds
-            event_groups = self._fetch_navigation()
-            
-            if not event_groups:
-                logger.warning("[DK PUBLIC] No event groups found in navigation")
-                return ScrapeResult(
-                    bookmaker=self.bookmaker,
-                    success=True,
-                    odds=[],
-                    duration_ms=int((time.time() - start_time) * 1000),
-                )
-            
-            logger.info(f"[DK PUBLIC] DK PUBLIC EVENTGROUPS DETECTED: {len(event_groups)}")
-            
-            # Step 2: Fetch odds for each eventGroup
-            all_odds: List[MarketOdds] = []
-            for event_group in event_groups:
-                event_group_id = event_group.get("eventGroupId")
-                sport = event_group.get("sport", "unknown")
-                
-                if not event_group_id:
-                    continue
-                
-                odds = self._fetch_eventgroup_odds(event_group_id, sport)
-                all_odds.extend(odds)
-            
-            duration_ms = int((time.time() - start_time) * 1000)
-            self._scrape_count += 1
-            self.session_status.last_activity_at = datetime.utcnow()
-            
-            logger.info(f"[DK PUBLIC] DK PUBLIC ODDS INGESTED: {len(all_odds)} odds from {len(event_groups)} event groups")
-            
-            return ScrapeResult(
-                bookmaker=self.bookmaker,
-                success=True,
-                odds=all_odds,
-                duration_ms=duration_ms,
-                scraped_at=datetime.utcnow(),
-            )
+            return await self._scrape_with_client(client, start_time)
             
         except Exception as e:
             self._error_count += 1
@@ -145,7 +302,122 @@ class DraftKingsPublicAPIAdapter:
                 duration_ms=duration_ms,
             )
 
-    def _fetch_navigation(self) -> List[Dict[str, Any]]:
+    async def _scrape_with_client(self, client: httpx.AsyncClient, start_time: float) -> ScrapeResult:
+        """Fetch navigation, then every eventGroup concurrently."""
+        # Step 1: Get navigation data to find eventGroupIds
+        event_groups, nav_refresh = await self._get_navigation(client)
+        
+        if not event_groups:
+            logger.warning("[DK PUBLIC] No event groups found in navigation")
+            if nav_refresh is not None:
+                await nav_refresh
+            return ScrapeResult(
+                bookmaker=self.bookmaker,
+                success=True,
+                odds=[],
+                duration_ms=int((time.time() - start_time) * 1000),
+            )
+        
+        logger.info(f"[DK PUBLIC] DK PUBLIC EVENTGROUPS DETECTED: {len(event_groups)}")
+        
+        self._generation += 1
+        
+        # Step 2: Fetch odds for the eventGroups concurrently (bounded)
+        sem = asyncio.Semaphore(self._max_concurrent)
+        
+        async def _fetch_one(event_group_id: str, sport: str) -> List[MarketOdds]:
+            async with sem:
+                await self._wait_for_request_slot()
+                return await self._fetch_eventgroup_odds(client, event_group_id, sport)
+        
+        results = await asyncio.gather(
+            *[
+                _fetch_one(event_group["eventGroupId"], event_group.get("sport", "unknown"))
+                for event_group in event_groups
+                if event_group.get("eventGroupId")
+            ],
+            return_exceptions=True,
+        )
+        # The revalidation shares this scrape's client, so finish it first
+        if nav_refresh is not None:
+            await nav_refresh
+        all_odds: List[MarketOdds] = []
+        for odds in results:
+            if isinstance(odds, BaseException):
+                logger.error(f"[DK PUBLIC] EventGroup fetch failed: {odds}")
+                continue
+            all_odds.extend(odds)
+        if self._emit_changes_only:
+            self._prune_market_prices()
+        
+        duration_ms = int((time.time() - start_time) * 1000)
+        self._scrape_count += 1
+        self.session_status.last_activity_at = datetime.utcnow()
+        
+        logger.info(f"[DK PUBLIC] DK PUBLIC ODDS INGESTED: {len(all_odds)} odds from {len(event_groups)} event groups")
+        
+        return ScrapeResult(
+            bookmaker=self.bookmaker,
+            success=True,
+            odds=all_odds,
+            duration_ms=duration_ms,
+            scraped_at=datetime.utcnow(),
+        )
+
+    def _prune_market_prices(self) -> None:
+        """Forget markets that were not in this scrape (settled or pulled)."""
+        generation = self._generation
+        stale = [key for key, (_, seen) in self._last_market_prices.items() if seen != generation]
+        for key in stale:
+            del self._last_market_prices[key]
+
+    async def _wait_for_request_slot(self) -> None:
+        """Space request dispatches at least min_request_interval_seconds apart."""
+        if self._min_request_interval_s <= 0:
+            return
+        now = time.monotonic()
+        # Reserve the next slot before sleeping so concurrent callers queue up
+        slot = max(now, self._next_request_at)
+        self._next_request_at = slot + self._min_request_interval_s
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def _get_navigation(
+        self, client: httpx.AsyncClient
+    ) -> Tuple[List[Dict[str, Any]], Optional[asyncio.Task]]:
+        """
+        Return event groups, using the shared navigation cache.
+
+        When the cache is stale, the cached groups are returned together with
+        a revalidation task the caller must await before closing the client.
+        """
+        cls = type(self)
+        cached = cls._nav_cache
+        if cached is not None:
+            age = time.monotonic() - cached[0]
+            if age < NAV_FRESH_SECONDS:
+                return cached[1], None
+            if age < NAV_STALE_SECONDS:
+                if cls._nav_refreshing:
+                    return cached[1], None
+                cls._nav_refreshing = True
+                return cached[1], asyncio.create_task(self._refresh_navigation(client))
+        return await self._refresh_navigation(client), None
+
+    async def _refresh_navigation(self, client: httpx.AsyncClient) -> List[Dict[str, Any]]:
+        """Refetch navigation into the cache; fall back to the old copy on failure."""
+        cls = type(self)
+        cls._nav_refreshing = True
+        try:
+            event_groups = await self._fetch_navigation(client)
+        finally:
+            cls._nav_refreshing = False
+        if event_groups:
+            cls._nav_cache = (time.monotonic(), event_groups)
+            return event_groups
+        return cls._nav_cache[1] if cls._nav_cache is not None else []
+
+    async def _fetch_navigation(self, client: httpx.AsyncClient) -> List[Dict[str, Any]]:
         """
         Fetch navigation data from DraftKings public API.
 
@@ -155,10 +427,10 @@ class DraftKingsPublicAPIAdapter:
 
         try:
             logger.debug(f"[DK PUBLIC] Fetching navigation from {url}")
-            response = requests.get(url, headers=self.HEADERS, timeout=10)
+            response = await client.get(url)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             event_groups = []
 
             # Navigate through the navigation structure
@@ -191,7 +463,9 @@ class DraftKingsPublicAPIAdapter:
             logger.error(f"[DK PUBLIC] Error fetching navigation: {e}")
             return []
 
-    def _fetch_eventgroup_odds(self, event_group_id: str, sport: str) -> List[MarketOdds]:
+    async def _fetch_eventgroup_odds(
+        self, client: httpx.AsyncClient, event_group_id: str, sport: str
+    ) -> List[MarketOdds]:
         """
         Fetch odds for a specific eventGroup.
 
@@ -201,13 +475,34 @@ class DraftKingsPublicAPIAdapter:
 
         try:
             logger.debug(f"[DK PUBLIC] Fetching eventGroup {event_group_id}")
-            response = requests.get(url, headers=self.HEADERS, timeout=10)
-            response.raise_for_status()
+            if PARSE_WORKERS > 0:
+                response = await client.get(url)
+                response.raise_for_status()
+                # Ship the raw bytes: decoding happens in the worker too
+                rows = await asyncio.get_running_loop().run_in_executor(
+                    _get_parse_pool(), _extract_market_rows, response.content, sport
+                )
+                odds = self._build_odds(rows)
+            elif IJSON_AVAILABLE:
+                async with client.stream("GET", url) as response:
+                    response.raise_for_status()
+                    logger.debug(
+                        f"[DK PUBLIC] eventGroup {event_group_id} encoding: "
+                        f"{response.headers.get('content-encoding', 'identity')}"
+                    )
+                    odds = await self._stream_eventgroup_odds(response, sport)
+            else:
+                response = await client.get(url)
+                response.raise_for_status()
+                logger.debug(
+                    f"[DK PUBLIC] eventGroup {event_group_id} encoding: "
+                    f"{response.headers.get('content-encoding', 'identity')}"
+                )
 
-            data = response.json()
+                data = orjson.loads(response.content)
 
-            # Use existing DraftKings parser
-            odds = self._parse_draftkings_json(data, sport)
+                # Use existing DraftKings parser
+                odds = self._parse_draftkings_json(data, sport)
 
             logger.debug(f"[DK PUBLIC] Parsed {len(odds)} odds from eventGroup {event_group_id}")
             return odds
@@ -216,44 +511,89 @@ class DraftKingsPublicAPIAdapter:
             logger.error(f"[DK PUBLIC] Error fetching eventGroup {event_group_id}: {e}")
             return []
 
+    async def _stream_eventgroup_odds(self, response: httpx.Response, sport: str) -> List[MarketOdds]:
+        """
+        Parse events as the body arrives, holding one chunk's worth of events
+        instead of the whole payload tree.
+
+        A truncated or malformed body keeps the odds of the events parsed so
+        far (each one complete), like a partial page in the browser adapters.
+        """
+        odds: List[MarketOdds] = []
+        events: List[Dict[str, Any]] = []
+        collector = _collect_events(events)
+        next(collector)
+        parser = ijson.parse_coro(collector, use_float=True)
+        try:
+            async for chunk in response.aiter_bytes():
+                parser.send(chunk)
+                if events:
+                    odds.extend(self._parse_events(events, sport))
+                    events.clear()
+            parser.close()
+        except Exception as e:
+            logger.error(f"[DK PUBLIC] EventGroup stream ended early: {e}")
+        if events:
+            odds.extend(self._parse_events(events, sport))
+        return odds
+
     def _parse_draftkings_json(self, data: Any, sport: str) -> List[MarketOdds]:
         """
         Parse DraftKings API response.
 
         REUSED from http_adapter.py - DO NOT modify parsing logic.
         """
-        odds_list: List[MarketOdds] = []
-
         try:
             # DraftKings API structure
             events = data.get("events", []) or data.get("eventGroup", {}).get("events", [])
-
-            for event in events:
-                event_id = str(event.get("eventId", ""))
-                event_name = event.get("name", "")
-                event_sport = self._detect_sport(event.get("eventGroupName", "")) or sport
-
-                for market in event.get("displayGroups", [{}])[0].get("markets", []):
-                    market_name = market.get("description", "moneyline")
-
-                    for outcome in market.get("outcomes", []):
-                        selection = outcome.get("description", "")
-                        odds_american = outcome.get("oddsAmerican", "")
-                        odds_decimal = self._american_to_decimal(odds_american)
-
-                        if selection and odds_decimal and odds_decimal > 1.0:
-                            odds_list.append(MarketOdds(
-                                event_id=event_id,
-                                event_name=event_name,
-                                sport=event_sport,
-                                market=self._normalize_market(market_name),
-                                bookmaker=self.bookmaker,
-                                selection=selection,
-                                odds_decimal=odds_decimal,
-                                captured_at=datetime.utcnow(),
-                            ))
         except Exception as e:
             logger.error(f"[DK PUBLIC] Error parsing DraftKings JSON: {e}")
+            return []
+
+        return self._parse_events(events, sport)
+
+    def _parse_events(self, events: Iterable[Dict[str, Any]], sport: str) -> List[MarketOdds]:
+        """Turn DraftKings event dicts into MarketOdds."""
+        return self._build_odds(_market_rows(events, sport))
+
+    def _build_odds(self, rows: Iterable[MarketRow]) -> List[MarketOdds]:
+        """Build MarketOdds from market rows (skipping unchanged markets if enabled)."""
+        odds_list: List[MarketOdds] = []
+        append = odds_list.append
+        # Values come from this parser (odds already checked > 1.0), so the
+        # models are built without re-running pydantic validation
+        construct = MarketOdds.model_construct
+        bookmaker = self.bookmaker
+        captured_at = datetime.utcnow()
+        changes_only = self._emit_changes_only
+        last_prices = self._last_market_prices
+        generation = self._generation
+
+        try:
+            for event_id, event_sport, market_name, prices in rows:
+                if changes_only:
+                    # Markets are emitted whole so every payload still
+                    # carries all sides of what it reports
+                    key = (event_id, market_name)
+                    prices_key = tuple(prices)
+                    previous = last_prices.get(key)
+                    last_prices[key] = (prices_key, generation)
+                    if previous is not None and previous[0] == prices_key:
+                        continue
+
+                market_key = self._normalize_market(market_name)
+                for selection, odds_decimal in prices:
+                    append(construct(
+                        event_id=event_id,
+                        sport=event_sport,
+                        market=market_key,
+                        bookmaker=bookmaker,
+                        selection=selection,
+                        odds_decimal=odds_decimal,
+                        captured_at=captured_at,
+                    ))
+        except Exception as e:
+            logger.error(f"[DK PUBLIC] Error parsing DraftKings events: {e}")
 
         return odds_list
 
@@ -261,52 +601,17 @@ class DraftKingsPublicAPIAdapter:
         """Detect sport from text."""
         if not text:
             return None
-        text_lower = text.lower()
-        if "nba" in text_lower or "basketball" in text_lower:
-            return "nba"
-        elif "nfl" in text_lower or "football" in text_lower:
-            return "nfl"
-        elif "mlb" in text_lower or "baseball" in text_lower:
-            return "mlb"
-        elif "nhl" in text_lower or "hockey" in text_lower:
-            return "nhl"
-        return None
+        return _match_sport(text.lower())
 
     def _normalize_sport(self, sport_name: str) -> str:
         """Normalize sport name from navigation."""
         sport_lower = sport_name.lower()
-        if "basketball" in sport_lower or "nba" in sport_lower:
-            return "nba"
-        elif "football" in sport_lower or "nfl" in sport_lower:
-            return "nfl"
-        elif "baseball" in sport_lower or "mlb" in sport_lower:
-            return "mlb"
-        elif "hockey" in sport_lower or "nhl" in sport_lower:
-            return "nhl"
-        return sport_lower
+        return _match_sport(sport_lower) or sport_lower
 
     def _normalize_market(self, market: str) -> str:
         """Normalize market name."""
-        market_lower = market.lower()
-        if "moneyline" in market_lower or "winner" in market_lower:
-            return "moneyline"
-        elif "spread" in market_lower or "handicap" in market_lower:
-            return "spread"
-        elif "total" in market_lower or "over" in market_lower:
-            return "total"
-        return market_lower
+        return _match_market(market.lower())
 
     def _american_to_decimal(self, american: str) -> Optional[float]:
         """Convert American odds to decimal."""
-        if not american:
-            return None
-        try:
-            american = american.replace("+", "").replace("−", "-").replace("–", "-")
-            odds = int(american)
-            if odds > 0:
-                return 1 + (odds / 100)
-            else:
-                return 1 + (100 / abs(odds))
-        except (ValueError, ZeroDivisionError):
-            return None
-
+        return _american_to_decimal(american)
@@ -7,26 +7,83 @@ from __future__ import annotations
 import logging
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from urllib.parse import urlsplit
 from typing import Any, Dict, List, Optional
 
 import httpx
+import orjson
 import pyotp
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+# lxml (+ cssselect) lets odds pages be parsed in-process from one HTML
+# snapshot instead of a WebDriver round trip per element
+try:
+    import lxml.html
+    from lxml.cssselect import CSSSelector
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
 from shared.schemas import BookmakerCredentials, FeedConfig, MarketOdds, TwoFactorConfig
 from .base import BaseFeedAdapter
-from ..stealth import jittered_delay
+from ..stealth import create_stealth_driver, jittered_delay
 
 logger = logging.getLogger(__name__)
 
+# Odds formats recognised by _parse_odds, tried in this order
+_DECIMAL_RE = re.compile(r'(\d+\.?\d*)')
+_AMERICAN_RE = re.compile(r'([+-])(\d+)')
+_FRACTIONAL_RE = re.compile(r'(\d+)/(\d+)')
+
+# Top-level JSON fields a 2FA code API may put the code in, tried in order
+_CODE_FIELDS = ("code", "otp", "verification_code")
+
+# Reads every configured selector inside the page in one execute_script and
+# returns plain data; per-element find_element/.text calls each cost a
+# WebDriver round trip, i.e. O(events x selections) per page
+_EXTRACT_EVENTS_JS = """
+const [eventSel, cfg] = arguments;
+const text = (root, sel) => {
+    const el = sel ? root.querySelector(sel) : null;
+    return el ? el.innerText.trim() : null;
+};
+return Array.from(document.querySelectorAll(eventSel), event => {
+    const eventId = text(event, cfg.eventId);
+    return {
+        eventId: eventId,
+        eventText: eventId ? null : event.innerText,
+        sport: text(event, cfg.sport),
+        market: text(event, cfg.market),
+        selections: cfg.selection ? Array.from(event.querySelectorAll(cfg.selection), sel => {
+            const name = sel.innerText.trim();
+            return [name, cfg.odds ? text(sel, cfg.odds) : name];
+        }) : [],
+    };
+});
+"""
+
+# Sets an input's value through the native setter (so framework-controlled
+# inputs such as React's see it) and fires the events a real edit would
+_SET_INPUT_VALUE_JS = """
+const [el, value] = arguments;
+const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+"""
+
 
 class GenericSportsbookAdapter(BaseFeedAdapter):
     """
     A configurable adapter that works with any sportsbook via CSS/XPath selectors.
+
+    This is the Selenium engine, used when FEED_BROWSER_ENGINE=selenium. The
+    default fallback, PlaywrightGenericAdapter, reads the same extra_config.
     
     Required extra_config keys:
         - login_url: URL of the login page
@@ -43,11 +100,57 @@ class GenericSportsbookAdapter(BaseFeedAdapter):
         - odds_selector: CSS selector for odds value within selection
         - sport_selector: CSS selector for sport name
         - market_selector: CSS selector for market name
+        - static_odds_pages: fetch odds pages over plain HTTP (with the
+          browser's cookies) instead of navigating the driver; only for
+          books whose odds are in the served HTML, not rendered by JS
+        - fast_typing: fill login/2FA fields with one script call instead of
+          per-keystroke typing. Faster, but skips the keystroke events that
+          bot detection looks at; only for books that don't watch typing
+        - odds_page_workers: load up to this many odds_urls at once (default
+          1). Extra browsers share the main one's user agent and session
+          cookies, and are kept for later scrapes
     """
-    
+
+    # Selectors evaluated against the odds page (compiled for lxml)
+    _ODDS_SELECTOR_KEYS = (
+        "event_container_selector",
+        "event_id_selector",
+        "sport_selector",
+        "market_selector",
+        "selection_selector",
+        "odds_selector",
+    )
+
     def __init__(self, config: FeedConfig, credentials: BookmakerCredentials):
         super().__init__(config, credentials)
         self.selectors = config.extra_config
+        self._static_odds_pages = bool(self.selectors.get("static_odds_pages"))
+        self._odds_page_workers = max(1, int(self.selectors.get("odds_page_workers", 1)))
+        self._fast_typing = bool(self.selectors.get("fast_typing"))
+        # Resolved once: read for every event on every page
+        self._forced_sport = config.sports[0] if config.sports else None
+        self._forced_market = config.markets[0] if config.markets else None
+        self._extract_cfg = {
+            "eventId": self.selectors.get("event_id_selector"),
+            "sport": self.selectors.get("sport_selector"),
+            "market": self.selectors.get("market_selector"),
+            "selection": self.selectors.get("selection_selector"),
+            "odds": self.selectors.get("odds_selector"),
+        }
+        self._totp: Optional[pyotp.TOTP] = None
+        self._totp_step: Optional[int] = None
+        self._totp_code: Optional[str] = None
+        self._page_drivers: List[Any] = []  # helper browsers, beyond self.driver
+        self._compiled_selectors: Dict[str, Any] = {}
+        if LXML_AVAILABLE:
+            for key in self._ODDS_SELECTOR_KEYS:
+                css = self.selectors.get(key)
+                if not css:
+                    continue
+                try:
+                    self._compiled_selectors[key] = CSSSelector(css)
+                except Exception as e:
+                    logger.warning(f"[{self.bookmaker}] Cannot compile {key} {css!r} for lxml: {e}")
     
     def _get_selector(self, key: str, default: Optional[str] = None) -> Optional[str]:
         """Get a selector from config."""
@@ -62,17 +165,19 @@ class GenericSportsbookAdapter(BaseFeedAdapter):
         
         try:
             self.driver.get(login_url)
-            jittered_delay(2, 4)
             
             # Find and fill username
             username_sel = self._get_selector("username_selector")
             if username_sel:
+                # Waiting for the field doubles as the page-load wait
                 username_input = WebDriverWait(self.driver, 10).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, username_sel))
                 )
                 username_input.clear()
                 self._human_type(username_input, self.credentials.username)
                 jittered_delay(0.5, 1.5)
+            else:
+                jittered_delay(2, 4)
             
             # Find and fill password
             password_sel = self._get_selector("password_selector")
@@ -82,21 +187,26 @@ class GenericSportsbookAdapter(BaseFeedAdapter):
                 self._human_type(password_input, self.credentials.password)
                 jittered_delay(0.5, 1.5)
             
+            twofa_sel = self._get_selector("totp_selector") or self._get_selector("twofa_selector")
+            success_sel = self._get_selector("login_success_selector")
+
             # Click submit
             submit_sel = self._get_selector("submit_selector")
             if submit_sel:
                 submit_btn = self.driver.find_element(By.CSS_SELECTOR, submit_sel)
                 submit_btn.click()
-                jittered_delay(3, 6)
+                # Wait for whatever the login leads to rather than a fixed pause
+                if success_sel or twofa_sel:
+                    self._wait_for_any(self.driver, (success_sel, twofa_sel), 15)
+                else:
+                    jittered_delay(3, 6)
 
             # Handle 2FA if configured
-            twofa_sel = self._get_selector("totp_selector") or self._get_selector("twofa_selector")
             if twofa_sel and self._has_2fa_config():
                 if not self._handle_2fa(twofa_sel):
                     return False
 
             # Verify login success
-            success_sel = self._get_selector("login_success_selector")
             if success_sel:
                 try:
                     WebDriverWait(self.driver, 15).until(
@@ -114,9 +224,28 @@ class GenericSportsbookAdapter(BaseFeedAdapter):
             logger.error(f"[{self.bookmaker}] Login error: {e}")
             return False
     
+    def _wait_for_any(self, driver, selectors, timeout: float) -> bool:
+        """Wait until any of the CSS selectors is present. False on timeout."""
+        conditions = [
+            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            for selector in selectors if selector
+        ]
+        if not conditions:
+            return False
+        try:
+            WebDriverWait(driver, timeout).until(EC.any_of(*conditions))
+            return True
+        except TimeoutException:
+            return False
+
     def _human_type(self, element, text: str) -> None:
         """Type text with human-like delays between keystrokes."""
         import random
+        if self._fast_typing:
+            # One script call instead of a send_keys round trip per character
+            self.driver.execute_script(_SET_INPUT_VALUE_JS, element, text)
+            time.sleep(random.uniform(0.3, 0.8))
+            return
         for char in text:
             element.send_keys(char)
             delay = random.uniform(0.05, 0.15)
@@ -158,7 +287,9 @@ class GenericSportsbookAdapter(BaseFeedAdapter):
                 from selenium.webdriver.common.keys import Keys
                 twofa_input.send_keys(Keys.RETURN)
 
-            jittered_delay(3, 5)
+            # With a success selector, _perform_login waits for it next
+            if not self._get_selector("login_success_selector"):
+                jittered_delay(3, 5)
             return True
 
         except TimeoutException:
@@ -172,8 +303,7 @@ class GenericSportsbookAdapter(BaseFeedAdapter):
         """Get 2FA code based on configured method."""
         # Check for simple TOTP secret (backward compatibility)
         if self.credentials.totp_secret and not self.credentials.two_factor:
-            totp = pyotp.TOTP(self.credentials.totp_secret)
-            return totp.now()
+            return self._current_totp(self.credentials.totp_secret)
 
         # Check for advanced 2FA config
         twofa = self.credentials.two_factor
@@ -184,8 +314,7 @@ class GenericSportsbookAdapter(BaseFeedAdapter):
             if not twofa.totp_secret:
                 logger.error(f"[{self.bookmaker}] TOTP method requires totp_secret")
                 return None
-            totp = pyotp.TOTP(twofa.totp_secret)
-            return totp.now()
+            return self._current_totp(twofa.totp_secret)
 
         elif twofa.method == "sms":
             return self._fetch_code_from_api(twofa, "SMS")
@@ -200,6 +329,17 @@ class GenericSportsbookAdapter(BaseFeedAdapter):
             logger.error(f"[{self.bookmaker}] Unknown 2FA method: {twofa.method}")
             return None
 
+    def _current_totp(self, secret: str) -> str:
+        """TOTP code for now; the generator and each step's code are reused."""
+        if self._totp is None or self._totp.secret != secret:
+            self._totp = pyotp.TOTP(secret)
+            self._totp_step = None
+        step = int(time.time()) // self._totp.interval
+        if step != self._totp_step:
+            self._totp_step = step
+            self._totp_code = self._totp.at(step * self._totp.interval)
+        return self._totp_code
+
     def _fetch_code_from_api(self, twofa: TwoFactorConfig, method_name: str) -> Optional[str]:
         """Fetch 2FA code from SMS/email API with polling."""
         if not twofa.api_url:
@@ -208,7 +348,7 @@ class GenericSportsbookAdapter(BaseFeedAdapter):
 
         logger.info(f"[{self.bookmaker}] Waiting for {method_name} code...")
 
-        headers = twofa.api_headers or {}
+        headers = dict(twofa.api_headers or {})
         if twofa.api_key:
             headers["Authorization"] = f"Bearer {twofa.api_key}"
 
@@ -219,22 +359,21 @@ class GenericSportsbookAdapter(BaseFeedAdapter):
         if twofa.email_address:
             params["email"] = twofa.email_address
 
-        # Poll for the code
+        # Poll for the code (one client, so polls reuse the connection)
         start_time = time.time()
         timeout = twofa.poll_timeout_seconds
         interval = twofa.poll_interval_seconds
+        code_re = re.compile(twofa.code_regex) if twofa.code_regex else None
 
-        while (time.time() - start_time) < timeout:
-            try:
-                with httpx.Client(timeout=10.0) as client:
-                    response = client.get(twofa.api_url, headers=headers, params=params)
+        with httpx.Client(timeout=10.0, headers=headers) as client:
+            while (time.time() - start_time) < timeout:
+                try:
+                    response = client.get(twofa.api_url, params=params)
 
                     if response.status_code == 200:
-                        data = response.text
-
                         # Extract code using regex if provided
-                        if twofa.code_regex:
-                            match = re.search(twofa.code_regex, data)
+                        if code_re is not None:
+                            match = code_re.search(response.text)
                             if match:
                                 code = match.group(1) if match.groups() else match.group(0)
                                 logger.info(f"[{self.bookmaker}] Got {method_name} code")
@@ -242,13 +381,11 @@ class GenericSportsbookAdapter(BaseFeedAdapter):
                         else:
                             # Try to parse as JSON and look for common fields
                             try:
-                                json_data = response.json()
-                                code = (
-                                    json_data.get("code") or
-                                    json_data.get("otp") or
-                                    json_data.get("verification_code") or
-                                    json_data.get("message", {}).get("code")
-                                )
+                                json_data = orjson.loads(response.content)
+                                code = next((json_data[k] for k in _CODE_FIELDS if json_data.get(k)), None)
+                                message = json_data.get("message")
+                                if not code and isinstance(message, dict):
+                                    code = message.get("code")
                                 if code:
                                     logger.info(f"[{self.bookmaker}] Got {method_name} code")
                                     return str(code)
@@ -261,10 +398,10 @@ class GenericSportsbookAdapter(BaseFeedAdapter):
                     else:
                         logger.warning(f"[{self.bookmaker}] API returned {response.status_code}")
 
-            except Exception as e:
-                logger.warning(f"[{self.bookmaker}] API request failed: {e}")
+                except Exception as e:
+                    logger.warning(f"[{self.bookmaker}] API request failed: {e}")
 
-            time.sleep(interval)
+                time.sleep(interval)
 
         logger.error(f"[{self.bookmaker}] Timeout waiting for {method_name} code")
         return None
@@ -296,9 +433,9 @@ class GenericSportsbookAdapter(BaseFeedAdapter):
             start_time = time.time()
             timeout_seconds = 300
 
-            while time.time() - start_time < timeout_seconds:
-                try:
-                    with httpx.Client(timeout=10.0) as client:
+            with httpx.Client(timeout=10.0) as client:
+                while time.time() - start_time < timeout_seconds:
+                    try:
                         response = client.get(f"http://localhost:8000/2fa/check/{request_id}")
                         data = response.json()
 
@@ -310,10 +447,10 @@ class GenericSportsbookAdapter(BaseFeedAdapter):
                             logger.error(f"[{self.bookmaker}] 2FA request expired")
                             return None
 
-                except Exception as e:
-                    logger.warning(f"[{self.bookmaker}] Error checking 2FA status: {e}")
+                    except Exception as e:
+                        logger.warning(f"[{self.bookmaker}] Error checking 2FA status: {e}")
 
-                time.sleep(2)
+                    time.sleep(2)
 
             logger.error(f"[{self.bookmaker}] Timeout waiting for 2FA code from Slack")
             return None
@@ -327,89 +464,255 @@ class GenericSportsbookAdapter(BaseFeedAdapter):
         odds_list: List[MarketOdds] = []
         
         # Navigate to odds pages
-        odds_urls = self.config.odds_urls or [self._get_selector("odds_page_url")]
-        
-        for url in odds_urls:
-            if not url:
-                continue
-            
+        odds_urls = [url for url in self.config.odds_urls or [self._get_selector("odds_page_url")] if url]
+        workers = min(self._odds_page_workers, len(odds_urls))
+        http_client = self._new_static_client() if self._static_odds_pages and LXML_AVAILABLE else None
+
+        try:
+            if http_client is not None:
+                # httpx.Client is thread-safe; share its connection pool
+                with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+                    pages = executor.map(lambda url: self._scrape_static_url(http_client, url), odds_urls)
+                    for page_odds in pages:
+                        odds_list.extend(page_odds)
+            else:
+                # A WebDriver must not be shared between threads: each
+                # browser walks its own slice of the URLs
+                drivers = [self.driver] + self._get_page_drivers(workers - 1)
+                shares = [odds_urls[i::len(drivers)] for i in range(len(drivers))]
+                if len(drivers) == 1:
+                    odds_list.extend(self._scrape_driver_urls(self.driver, odds_urls))
+                else:
+                    with ThreadPoolExecutor(max_workers=len(drivers)) as executor:
+                        for page_odds in executor.map(self._scrape_driver_urls, drivers, shares):
+                            odds_list.extend(page_odds)
+        finally:
+            if http_client is not None:
+                http_client.close()
+
+        return odds_list
+
+    def _scrape_static_url(self, client: httpx.Client, url: str) -> List[MarketOdds]:
+        """Fetch and parse one odds page over plain HTTP."""
+        try:
+            response = client.get(url)
+            response.raise_for_status()
+            return self._extract_odds_from_html(response.text)
+        except Exception as e:
+            logger.error(f"[{self.bookmaker}] Error scraping {url}: {e}")
+            return []
+
+    def _scrape_driver_urls(self, driver, urls: List[str]) -> List[MarketOdds]:
+        """Load each URL in the given browser and extract its odds."""
+        odds_list: List[MarketOdds] = []
+        for url in urls:
             try:
-                self.driver.get(url)
-                jittered_delay(2, 4)
-                
-                page_odds = self._extract_odds_from_page()
-                odds_list.extend(page_odds)
-                
+                driver.get(url)
+                event_sel = self._get_selector("event_container_selector")
+                if not event_sel:
+                    jittered_delay(2, 4)
+                elif not self._wait_for_any(driver, (event_sel,), 10):
+                    logger.debug(f"[{self.bookmaker}] No events appeared on {url}")
+                odds_list.extend(self._extract_odds_from_page(driver))
             except Exception as e:
                 logger.error(f"[{self.bookmaker}] Error scraping {url}: {e}")
-        
         return odds_list
 
-    def _extract_odds_from_page(self) -> List[MarketOdds]:
-        """Extract odds from a single event container."""
-        odds_list: List[MarketOdds] = []
+    def _get_page_drivers(self, count: int) -> List[Any]:
+        """Return up to count helper browsers carrying the main session's cookies."""
+        if count <= 0:
+            return []
 
-        # Get event ID
-        event_id_sel = self._get_selector("event_id_selector")
-        event_id = self._safe_get_text(event, event_id_sel) or f"event_{id(event)}"
+        user_agent = self.driver.execute_script("return navigator.userAgent")
+        cookies = self.driver.get_cookies()
+        drivers: List[Any] = []
 
-        # Get sport
-        sport_sel = self._get_selector("sport_selector")
-        sport = self._safe_get_text(event, sport_sel) or "unknown"
-        if self.config.sports:
-            sport = self.config.sports[0]  # Use configured sport if available
+        for i in range(count):
+            if i < len(self._page_drivers):
+                driver = self._page_drivers[i]
+            else:
+                try:
+                    driver = create_stealth_driver(
+                        headless=self.config.headless,
+                        proxy=self.config.proxy,
+                        user_agent=user_agent,
+                    )
+                except Exception as e:
+                    logger.warning(f"[{self.bookmaker}] Could not start helper browser: {e}")
+                    break
+                self._page_drivers.append(driver)
+                # Cookies can only be set for the domain currently loaded
+                parts = urlsplit(self.driver.current_url)
+                driver.get(f"{parts.scheme}://{parts.netloc}/")
+
+            # Re-sync every scrape so a relogin on the main browser carries over
+            for cookie in cookies:
+                try:
+                    driver.add_cookie(cookie)
+                except Exception:
+                    continue
+            drivers.append(driver)
 
-        # Get market
-        market_sel = self._get_selector("market_selector")
-        market = self._safe_get_text(event, market_sel) or "match_winner"
-        if self.config.markets:
-            market = self.config.markets[0]
+        return drivers
 
-        # Get selections and odds
-        selection_sel = self._get_selector("selection_selector")
-        odds_sel = self._get_selector("odds_selector")
+    def close(self) -> None:
+        """Close helper browsers, then the main driver."""
+        for driver in self._page_drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.warning(f"[{self.bookmaker}] Error closing helper browser: {e}")
+        self._page_drivers = []
+        super().close()
+
+    def _new_static_client(self) -> httpx.Client:
+        """HTTP client carrying the browser's user agent and session cookies."""
+        cookies = httpx.Cookies()
+        for cookie in self.driver.get_cookies():
+            cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain", ""))
+        user_agent = self.driver.execute_script("return navigator.userAgent")
+        return httpx.Client(
+            headers={"User-Agent": user_agent},
+            cookies=cookies,
+            timeout=15.0,
+            follow_redirects=True,
+        )
+
+    def _extract_odds_from_page(self, driver=None) -> List[MarketOdds]:
+        """Extract odds from the current page (of self.driver unless given)."""
+        driver = driver or self.driver
+        if LXML_AVAILABLE and "event_container_selector" in self._compiled_selectors:
+            # One page_source round trip; everything else is walked locally
+            return self._extract_odds_from_html(driver.page_source)
 
-        if selection_sel:
-            selections = event.find_elements(By.CSS_SELECTOR, selection_sel)
+        odds_list: List[MarketOdds] = []
+        
+        event_sel = self._get_selector("event_container_selector")
+        if not event_sel:
+            logger.warning(f"[{self.bookmaker}] No event container selector configured")
+            return odds_list
+        
+        try:
+            events = driver.execute_script(_EXTRACT_EVENTS_JS, event_sel, self._extract_cfg)
+            logger.info(f"[{self.bookmaker}] Found {len(events)} events")
 
-            for sel_elem in selections:
+            for event in events:
                 try:
-                    selection_name = sel_elem.text.strip() or "unknown"
+                    event_id = event["eventId"] or f"event_{hash(event['eventText'])}"
+                    odds_list.extend(self._build_event_odds(
+                        event_id, event["sport"], event["market"], event["selections"],
+                    ))
+                except Exception as e:
+                    logger.debug(f"[{self.bookmaker}] Error extracting event: {e}")
+                    
+        except Exception as e:
+            logger.error(f"[{self.bookmaker}] Error finding events: {e}")
+        
+        return odds_list
 
-                    # Get odds value
-                    if odds_sel:
-                        odds_elem = sel_elem.find_element(By.CSS_SELECTOR, odds_sel)
-                        odds_text = odds_elem.text.strip()
-                    else:
-                        odds_text = sel_elem.text.strip()
+    def _extract_odds_from_html(self, html: str) -> List[MarketOdds]:
+        """Extract odds from an HTML snapshot with the compiled selectors."""
+        odds_list: List[MarketOdds] = []
 
-                    odds_decimal = self._parse_odds(odds_text)
+        event_css = self._compiled_selectors.get("event_container_selector")
+        if event_css is None:
+            logger.warning(f"[{self.bookmaker}] No event container selector configured")
+            return odds_list
 
-                    if odds_decimal and odds_decimal > 1.0:
-                        odds_list.append(MarketOdds(
-                            event_id=event_id,
-                            sport=sport,
-                            market=market,
-                            bookmaker=self.bookmaker,
-                            selection=selection_name,
-                            odds_decimal=odds_decimal,
-                            captured_at=datetime.utcnow(),
-                        ))
+        try:
+            events = event_css(lxml.html.fromstring(html))
+            logger.info(f"[{self.bookmaker}] Found {len(events)} events")
 
+            for event in events:
+                try:
+                    odds_list.extend(self._extract_tree_event_odds(event))
                 except Exception as e:
-                    logger.debug(f"[{self.bookmaker}] Error extracting selection: {e}")
+                    logger.debug(f"[{self.bookmaker}] Error extracting event: {e}")
+
+        except Exception as e:
+            logger.error(f"[{self.bookmaker}] Error parsing odds page: {e}")
 
         return odds_list
 
-    def _safe_get_text(self, parent, selector: Optional[str]) -> Optional[str]:
-        """Safely get text from an element using a selector."""
-        if not selector:
+    def _extract_tree_event_odds(self, event) -> List[MarketOdds]:
+        """Extract odds from a single lxml event container."""
+        compiled = self._compiled_selectors
+        selection_css = compiled.get("selection_selector")
+        odds_css = compiled.get("odds_selector")
+
+        selections = []
+        if selection_css is not None:
+            for sel_elem in selection_css(event):
+                full_text = self._normalized_text(sel_elem)
+                if odds_css is not None:
+                    # The name is the selection's own text, not its odds child's
+                    name = self._own_text(sel_elem) or full_text
+                    odds_text = self._tree_text(sel_elem, odds_css)
+                else:
+                    name = odds_text = full_text
+                selections.append((name, odds_text))
+
+        return self._build_event_odds(
+            self._tree_text(event, compiled.get("event_id_selector")) or f"event_{id(event)}",
+            self._tree_text(event, compiled.get("sport_selector")),
+            self._tree_text(event, compiled.get("market_selector")),
+            selections,
+        )
+
+    @classmethod
+    def _tree_text(cls, parent, css) -> Optional[str]:
+        """Text of parent's first css match, or None if unmatched or unconfigured."""
+        if css is None:
             return None
-        try:
-            elem = parent.find_element(By.CSS_SELECTOR, selector)
-            return elem.text.strip()
-        except NoSuchElementException:
+        matches = css(parent)
+        if not matches:
             return None
+        return cls._normalized_text(matches[0])
+
+    @staticmethod
+    def _normalized_text(elem) -> str:
+        """Whitespace-normalized text of elem and its descendants, like WebElement.text."""
+        return " ".join(elem.text_content().split())
+
+    @staticmethod
+    def _own_text(elem) -> str:
+        """Whitespace-normalized text directly inside elem, skipping child elements."""
+        return " ".join("".join(elem.xpath("text()")).split())
+
+    def _build_event_odds(
+        self,
+        event_id: str,
+        sport: Optional[str],
+        market: Optional[str],
+        selections: List[Any],
+    ) -> List[MarketOdds]:
+        """Build MarketOdds for one event from its extracted text."""
+        odds_list: List[MarketOdds] = []
+
+        # Use configured sport/market if available
+        sport = self._forced_sport or sport or "unknown"
+        market = self._forced_market or market or "match_winner"
+
+        captured_at = datetime.utcnow()
+        for selection_name, odds_text in selections:
+            try:
+                odds_decimal = self._parse_odds(odds_text)
+
+                if odds_decimal and odds_decimal > 1.0:
+                    odds_list.append(MarketOdds(
+                        event_id=event_id,
+                        sport=sport,
+                        market=market,
+                        bookmaker=self.bookmaker,
+                        selection=selection_name or "unknown",
+                        odds_decimal=odds_decimal,
+                        captured_at=captured_at,
+                    ))
+
+            except Exception as e:
+                logger.debug(f"[{self.bookmaker}] Error extracting selection: {e}")
+
+        return odds_list
 
     def _parse_odds(self, odds_text: str) -> Optional[float]:
         """Parse odds text into decimal format."""
@@ -420,7 +723,7 @@ class GenericSportsbookAdapter(BaseFeedAdapter):
         odds_text = odds_text.strip()
 
         # Try to extract decimal odds directly
-        decimal_match = re.search(r'(\d+\.?\d*)', odds_text)
+        decimal_match = _DECIMAL_RE.search(odds_text)
         if decimal_match:
             try:
                 value = float(decimal_match.group(1))
@@ -430,7 +733,7 @@ class GenericSportsbookAdapter(BaseFeedAdapter):
                 pass
 
         # Try American odds format (+150, -200)
-        american_match = re.search(r'([+-])(\d+)', odds_text)
+        american_match = _AMERICAN_RE.search(odds_text)
         if american_match:
             sign, num = american_match.groups()
             num = int(num)
@@ -440,7 +743,7 @@ class GenericSportsbookAdapter(BaseFeedAdapter):
                 return 1 + (100 / num)
 
         # Try fractional odds (3/1, 1/2)
-        frac_match = re.search(r'(\d+)/(\d+)', odds_text)
+        frac_match = _FRACTIONAL_RE.search(odds_text)
         if frac_match:
             num, denom = map(int, frac_match.groups())
             if denom > 0:
@@ -448,6 +751,19 @@ class GenericSportsbookAdapter(BaseFeedAdapter):
 
         return None
 
+    def _verify_session(self) -> bool:
+        """A restored session is valid when the login success element shows."""
+        success_sel = self._get_selector("login_success_selector")
+        if not success_sel:
+            return super()._verify_session()
+        try:
+            WebDriverWait(self.driver, 5).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, success_sel))
+            )
+            return True
+        except TimeoutException:
+            return False
+
     def _is_session_expired(self) -> bool:
         """Check if session has expired by looking for login elements."""
         login_indicator = self._get_selector("login_required_selector")
@@ -458,27 +774,3 @@ class GenericSportsbookAdapter(BaseFeedAdapter):
             except NoSuchElementException:
                 return False
         return False
-        """Extract odds from the current page."""
-        odds_list: List[MarketOdds] = []
-        
-        event_sel = self._get_selector("event_container_selector")
-        if not event_sel:
-            logger.warning(f"[{self.bookmaker}] No event container selector configured")
-            return odds_list
-        
-        try:
-            events = self.driver.find_elements(By.CSS_SELECTOR, event_sel)
-            logger.info(f"[{self.bookmaker}] Found {len(events)} events")
-            
-            for event in events:
-                try:
-                    event_odds = self._extract_event_odds(event)
-                    odds_list.extend(event_odds)
-                except Exception as e:
-                    logger.debug(f"[{self.bookmaker}] Error extracting event: {e}")
-                    
-        except Exception as e:
-            logger.error(f"[{self.bookmaker}] Error finding events: {e}")
-        
-        return odds_list
-
@@ -24,6 +24,27 @@ from ..stealth_playwright import async_jittered_delay
 
 logger = logging.getLogger(__name__)
 
+# Runs every configured selector inside the page in one round trip and hands
+# back plain data; per-element query_selector/inner_text calls each cost a
+# CDP message, i.e. O(events x selections) round trips per page
+_EXTRACT_EVENTS_JS = """
+(events, cfg) => events.map(event => {
+    const text = el => el ? el.innerText.trim() : null;
+    const eventId = (cfg.eventId ? text(event.querySelector(cfg.eventId)) : null)
+        || event.getAttribute(cfg.eventIdAttr);
+    return {
+        eventId: eventId,
+        eventText: eventId ? null : event.innerText,
+        sport: cfg.sport ? text(event.querySelector(cfg.sport)) : null,
+        market: cfg.market ? text(event.querySelector(cfg.market)) : null,
+        selections: Array.from(event.querySelectorAll(cfg.selection), sel => [
+            cfg.nameAttr ? sel.getAttribute(cfg.nameAttr) : sel.innerText.trim(),
+            (sel.querySelector(cfg.odds) || sel).innerText.trim(),
+        ]),
+    };
+})
+"""
+
 
 class PlaywrightGenericAdapter(PlaywrightFeedAdapter):
     """
@@ -41,10 +62,17 @@ class PlaywrightGenericAdapter(PlaywrightFeedAdapter):
     Optional extra_config fields:
     - totp_selector: CSS selector for TOTP input (if 2FA enabled)
     - totp_submit_selector: CSS selector for TOTP submit button
-    - event_id_selector: CSS selector for event ID
+    - event_id_selector: CSS selector for event ID (else the
+      event_id_attr attribute, default data-event-id)
     - sport_selector: CSS selector for sport name
     - market_selector: CSS selector for market type
     - selection_name_selector: CSS selector for selection name
+    - login_required_selector: CSS selector that only shows when logged out
+
+    The keys GenericSportsbookAdapter (Selenium) reads work here too
+    (login_url, odds_page_url, twofa_selector, twofa_submit_selector, and
+    login selectors left out), so a selector config can switch engines via
+    FEED_BROWSER_ENGINE unchanged.
     """
     
     async def _perform_login(self) -> bool:
@@ -54,52 +82,58 @@ class PlaywrightGenericAdapter(PlaywrightFeedAdapter):
             
             # Navigate to login page
             logger.info(f"[{self.bookmaker}] Navigating to login page...")
-            await self.browser.page.goto(self.config.login_url, wait_until="networkidle")
+            login_url = config.get("login_url") or self.config.login_url
+            await self.browser.page.goto(login_url, wait_until="networkidle")
             
             # Random scroll to simulate reading
             await self.browser.human_scroll(300)
             await async_jittered_delay(1, 3)
             
             # Type username with human-like behavior
-            logger.info(f"[{self.bookmaker}] Entering username...")
-            await self.browser.human_type(
-                config["username_selector"],
-                self.credentials.username,
-                delay_range=(80, 200)
-            )
-            
-            await async_jittered_delay(0.5, 1.5)
+            if config.get("username_selector"):
+                logger.info(f"[{self.bookmaker}] Entering username...")
+                await self.browser.human_type(
+                    config["username_selector"],
+                    self.credentials.username,
+                    delay_range=(80, 200)
+                )
+                
+                await async_jittered_delay(0.5, 1.5)
             
             # Type password
-            logger.info(f"[{self.bookmaker}] Entering password...")
-            await self.browser.human_type(
-                config["password_selector"],
-                self.credentials.password,
-                delay_range=(80, 200)
-            )
-            
-            await async_jittered_delay(1, 2)
-            
-            # Click submit with mouse movement
-            submit_element = await self.browser.page.wait_for_selector(config["submit_selector"])
-            box = await submit_element.bounding_box()
-            if box:
-                await self.browser.human_mouse_move(
-                    int(box["x"] + box["width"] / 2),
-                    int(box["y"] + box["height"] / 2)
+            if config.get("password_selector"):
+                logger.info(f"[{self.bookmaker}] Entering password...")
+                await self.browser.human_type(
+                    config["password_selector"],
+                    self.credentials.password,
+                    delay_range=(80, 200)
                 )
+                
+                await async_jittered_delay(1, 2)
             
-            await submit_element.click()
-            logger.info(f"[{self.bookmaker}] Submitted login form")
-            
-            # Wait for navigation
-            await async_jittered_delay(2, 4)
+            # Click submit with mouse movement
+            if config.get("submit_selector"):
+                submit_element = await self.browser.page.wait_for_selector(config["submit_selector"])
+                box = await submit_element.bounding_box()
+                if box:
+                    await self.browser.human_mouse_move(
+                        int(box["x"] + box["width"] / 2),
+                        int(box["y"] + box["height"] / 2)
+                    )
+                
+                await submit_element.click()
+                logger.info(f"[{self.bookmaker}] Submitted login form")
+                
+                # Wait for navigation
+                await async_jittered_delay(2, 4)
             
             # Handle 2FA if configured
             if await self._handle_2fa():
                 logger.info(f"[{self.bookmaker}] 2FA completed")
             
-            # Check for login success
+            # Check for login success (none configured: assume it worked)
+            if not config.get("login_success_selector"):
+                return True
             try:
                 await self.browser.page.wait_for_selector(
                     config["login_success_selector"],
@@ -119,14 +153,17 @@ class PlaywrightGenericAdapter(PlaywrightFeedAdapter):
         """Handle 2FA if configured."""
         config = self.config.extra_config
         
+        totp_selector = config.get("totp_selector") or config.get("twofa_selector")
+        totp_submit_selector = config.get("totp_submit_selector") or config.get("twofa_submit_selector")
+        
         # Check if TOTP selector exists on page
-        if "totp_selector" not in config:
+        if not totp_selector:
             return True  # No 2FA configured
         
         try:
             # Wait for TOTP input to appear
             totp_input = await self.browser.page.wait_for_selector(
-                config["totp_selector"],
+                totp_selector,
                 timeout=5000
             )
         except Exception:
@@ -162,13 +199,13 @@ class PlaywrightGenericAdapter(PlaywrightFeedAdapter):
         
         # Enter 2FA code
         logger.info(f"[{self.bookmaker}] Entering 2FA code...")
-        await self.browser.human_type(config["totp_selector"], code, delay_range=(100, 250))
+        await self.browser.human_type(totp_selector, code, delay_range=(100, 250))
         
         await async_jittered_delay(0.5, 1.5)
         
         # Submit 2FA
-        if "totp_submit_selector" in config:
-            submit_element = await self.browser.page.wait_for_selector(config["totp_submit_selector"])
+        if totp_submit_selector:
+            submit_element = await self.browser.page.wait_for_selector(totp_submit_selector)
             await submit_element.click()
         
         await async_jittered_delay(2, 4)
@@ -286,7 +323,8 @@ class PlaywrightGenericAdapter(PlaywrightFeedAdapter):
         config = self.config.extra_config
         all_odds = []
 
-        for url in self.config.odds_urls:
+        odds_urls = self.config.odds_urls or [config.get("odds_page_url")]
+        for url in filter(None, odds_urls):
             logger.info(f"[{self.bookmaker}] Scraping odds from {url}")
 
             await self.browser.page.goto(url, wait_until="networkidle")
@@ -308,70 +346,57 @@ class PlaywrightGenericAdapter(PlaywrightFeedAdapter):
         odds_list = []
 
         try:
-            events = await self.browser.page.query_selector_all(
-                config["event_container_selector"]
+            events = await self.browser.page.eval_on_selector_all(
+                config["event_container_selector"],
+                _EXTRACT_EVENTS_JS,
+                {
+                    "eventId": config.get("event_id_selector"),
+                    "eventIdAttr": config.get("event_id_attr", "data-event-id"),
+                    "sport": config.get("sport_selector"),
+                    "market": config.get("market_selector"),
+                    "selection": config["selection_selector"],
+                    "nameAttr": config.get("selection_name_attr"),
+                    "odds": config["odds_selector"],
+                },
             )
 
             for event in events:
-                try:
-                    # Get event ID
-                    event_id_attr = config.get("event_id_attr", "data-event-id")
-                    event_id = await event.get_attribute(event_id_attr)
-                    if not event_id:
-                        event_id = f"event_{hash(await event.inner_text())}"
-
-                    # Get sport
-                    sport = "unknown"
-                    if "sport_selector" in config:
-                        sport_el = await event.query_selector(config["sport_selector"])
-                        if sport_el:
-                            sport = (await sport_el.inner_text()).strip().lower()
-
-                    # Get market type
-                    market = "match_winner"
-                    if "market_selector" in config:
-                        market_el = await event.query_selector(config["market_selector"])
-                        if market_el:
-                            market = (await market_el.inner_text()).strip().lower()
-
-                    # Find selections
-                    selections = await event.query_selector_all(config["selection_selector"])
-
-                    for selection in selections:
-                        try:
-                            name_attr = config.get("selection_name_attr")
-                            if name_attr:
-                                selection_name = await selection.get_attribute(name_attr)
-                            else:
-                                selection_name = (await selection.inner_text()).strip()
-
-                            odds_el = await selection.query_selector(config["odds_selector"])
-                            if not odds_el:
-                                odds_el = selection
-
-                            odds_text = (await odds_el.inner_text()).strip()
-                            odds_decimal = self._parse_odds(odds_text)
-
-                            if odds_decimal and odds_decimal > 1.0:
-                                odds_list.append(MarketOdds(
-                                    event_id=event_id,
-                                    sport=sport,
-                                    market=market,
-                                    selection=selection_name,
-                                    odds_decimal=odds_decimal,
-                                    bookmaker=self.bookmaker,
-                                ))
-                        except Exception as e:
-                            logger.debug(f"[{self.bookmaker}] Error parsing selection: {e}")
-
-                except Exception as e:
-                    logger.debug(f"[{self.bookmaker}] Error parsing event: {e}")
+                event_id = event["eventId"] or f"event_{hash(event['eventText'])}"
+                sport = event["sport"].strip().lower() if event["sport"] else "unknown"
+                if self.config.sports:
+                    sport = self.config.sports[0]  # Use configured sport if available
+                market = event["market"].strip().lower() if event["market"] else "match_winner"
+                if self.config.markets:
+                    market = self.config.markets[0]
+
+                for selection_name, odds_text in event["selections"]:
+                    try:
+                        odds_decimal = self._parse_odds(odds_text)
+
+                        if odds_decimal and odds_decimal > 1.0:
+                            odds_list.append(MarketOdds(
+                                event_id=event_id,
+                                sport=sport,
+                                market=market,
+                                selection=selection_name,
+                                odds_decimal=odds_decimal,
+                                bookmaker=self.bookmaker,
+                            ))
+                    except Exception as e:
+                        logger.debug(f"[{self.bookmaker}] Error parsing selection: {e}")
 
         except Exception as e:
             logger.error(f"[{self.bookmaker}] Error extracting odds: {e}")
 
         return odds_list
 
+    async def _is_session_expired(self) -> bool:
+        """Session has expired when the logged-out indicator is on the page."""
+        login_indicator = self.config.extra_config.get("login_required_selector")
+        if not login_indicator or not self.browser or not self.browser.page:
+            return False
+        return await self.browser.page.query_selector(login_indicator) is not None
+
     def _parse_odds(self, odds_text: str) -> Optional[float]:
         """Parse odds text to decimal format."""
         try:
@@ -0,0 +1,121 @@
+"""
+Shared Chromium pool for the Playwright adapters.
+
+Every StealthBrowser used to start its own Playwright driver and Chromium
+process. Adapters now lease a browser from this pool and open their own
+context in it (cookies, fingerprint and storage stay per adapter), so books
+scraped with the same launch settings share one Chromium.
+
+Browsers are keyed by launch settings (headless, proxy). A browser with no
+leases is kept for BROWSER_POOL_IDLE_SECONDS so an adapter re-initializing
+after a ban or relogin reuses it; disconnected (crashed) browsers are dropped
+and relaunched on the next acquire.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from playwright.async_api import Browser, Playwright, async_playwright
+
+logger = logging.getLogger(__name__)
+
+IDLE_TIMEOUT_SECONDS = float(os.getenv("BROWSER_POOL_IDLE_SECONDS", "60"))
+
+# Launch args for maximum stealth
+LAUNCH_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-web-security",
+    "--disable-features=IsolateOrigins,site-per-process",
+    "--disable-site-isolation-trials",
+]
+
+
+@dataclass
+class _PooledBrowser:
+    browser: Browser
+    leases: int = 0
+    idle_since: float = 0.0
+
+
+class BrowserPool:
+    """Lease shared Chromium instances keyed by launch settings."""
+
+    def __init__(self, idle_timeout: float = IDLE_TIMEOUT_SECONDS):
+        self.idle_timeout = idle_timeout
+        self._playwright: Optional[Playwright] = None
+        self._entries: Dict[Tuple[Any, ...], _PooledBrowser] = {}
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _key(headless: bool, proxy: Optional[Dict[str, str]]) -> Tuple[Any, ...]:
+        if not proxy:
+            return (headless,)
+        return (headless, proxy["server"], proxy.get("username"), proxy.get("password"))
+
+    async def acquire(self, headless: bool = True, proxy: Optional[Dict[str, str]] = None) -> Browser:
+        """Return a connected browser for these launch settings, launching if needed."""
+        key = self._key(headless, proxy)
+        async with self._lock:
+            await self._reap_idle()
+            entry = self._entries.get(key)
+            if entry is None or not entry.browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                logger.info(f"Launching pooled Chromium (headless={headless}, proxy={bool(proxy)})")
+                browser = await self._playwright.chromium.launch(
+                    headless=headless,
+                    args=LAUNCH_ARGS,
+                    proxy=proxy,
+                )
+                entry = self._entries[key] = _PooledBrowser(browser)
+            entry.leases += 1
+            return entry.browser
+
+    async def release(self, browser: Browser) -> None:
+        """Return a leased browser; it is closed once idle past the timeout."""
+        async with self._lock:
+            for entry in self._entries.values():
+                if entry.browser is browser:
+                    entry.leases = max(0, entry.leases - 1)
+                    if entry.leases == 0:
+                        entry.idle_since = time.monotonic()
+                    break
+            await self._reap_idle()
+
+    async def _reap_idle(self) -> None:
+        now = time.monotonic()
+        for key, entry in list(self._entries.items()):
+            connected = entry.browser.is_connected()
+            if connected and (entry.leases or now - entry.idle_since < self.idle_timeout):
+                continue
+            del self._entries[key]
+            if connected:
+                try:
+                    await entry.browser.close()
+                except Exception as e:
+                    logger.warning(f"Error closing pooled browser: {e}")
+
+    async def close(self) -> None:
+        """Close every pooled browser and the Playwright driver."""
+        async with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+            for entry in entries:
+                try:
+                    await entry.browser.close()
+                except Exception as e:
+                    logger.warning(f"Error closing pooled browser: {e}")
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+
+browser_pool = BrowserPool()
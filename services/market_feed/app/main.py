@@ -7,6 +7,7 @@ using stealth browser automation. It pushes normalized odds to odds_ingest.
 from __future__ import annotations
 
 import asyncio
+import inspect
 import json
 import logging
 import os
@@ -18,6 +19,7 @@ from typing import Any, Dict, List, Optional
 
 import httpx
 from fastapi import FastAPI, HTTPException, BackgroundTasks
+from pydantic import TypeAdapter
 
 from shared.schemas import (
     BetRequest,
@@ -36,6 +38,7 @@ from shared.schemas import (
     TwoFASubmission,
 )
 from shared.logging_config import setup_logging
+from .browser_pool import browser_pool
 from .session_manager import session_manager
 from .bet_executor import BetExecutor
 from .adapters.prediction_markets import (
@@ -55,6 +58,29 @@ SERVICE_NAME = os.getenv("SERVICE_NAME", "market_feed")
 ODDS_INGEST_URL = os.getenv("ODDS_INGEST_URL", "http://odds_ingest:8000")
 SLACK_NOTIFIER_URL = os.getenv("SLACK_NOTIFIER_URL", "http://slack_notifier:8000")
 
+# Odds batches pushed to odds_ingest are serialized in one pydantic-core call
+# rather than model_dump()-ing every MarketOdds and re-encoding the dicts
+_MARKET_ODDS_LIST = TypeAdapter(List[MarketOdds])
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _odds_json(odds: List[MarketOdds]) -> bytes:
+    return _MARKET_ODDS_LIST.dump_json(odds)
+
+
+async def _scrape_adapter(adapter: Any) -> ScrapeResult:
+    """Run one scrape on whatever flavour of adapter this is, without blocking the loop."""
+    # Async-capable adapters must be awaited: their blocking scrape()
+    # wrapper cannot run inside this event loop
+    scrape_async = getattr(adapter, "scrape_async", None)
+    if scrape_async is not None:
+        return await scrape_async()
+    # Playwright adapters' scrape() is itself a coroutine
+    if inspect.iscoroutinefunction(adapter.scrape):
+        return await adapter.scrape()
+    # Blocking (Selenium/HTTP) scrapes run in a worker thread
+    return await asyncio.to_thread(adapter.scrape)
+
 # Feed configurations from environment
 FEED_CONFIGS_JSON = os.getenv("FEED_CONFIGS", "[]")
 BOOKMAKER_CREDENTIALS_JSON = os.getenv("BOOKMAKER_CREDENTIALS", "{}")
@@ -273,7 +299,7 @@ async def _auto_poll_loop(bookmaker: str) -> None:
 
         try:
             # Ensure logged in first
-            logged_in = session_manager.ensure_logged_in(bookmaker)
+            logged_in = await session_manager.ensure_logged_in(bookmaker)
             if not logged_in:
                 logger.warning(f"[{bookmaker}] Not logged in — skipping poll cycle")
                 _poller_stats[bookmaker]["error_count"] += 1
@@ -285,7 +311,7 @@ async def _auto_poll_loop(bookmaker: str) -> None:
                 if adapter is None:
                     raise RuntimeError("Adapter not available")
 
-                result: ScrapeResult = adapter.scrape()
+                result = await _scrape_adapter(adapter)
 
                 if not result.success:
                     raise RuntimeError(result.error or "scrape failed")
@@ -295,7 +321,8 @@ async def _auto_poll_loop(bookmaker: str) -> None:
                     async with httpx.AsyncClient(timeout=30.0) as client:
                         resp = await client.post(
                             f"{ODDS_INGEST_URL}/process",
-                            json=[o.model_dump(mode="json") for o in result.odds],
+                            content=_odds_json(result.odds),
+                            headers=_JSON_HEADERS,
                         )
                         resp.raise_for_status()
                     logger.info(
@@ -746,7 +773,8 @@ async def shutdown_event():
             logger.info(f"[{bookmaker}] Auto-poller cancelled")
     _poller_tasks.clear()
 
-    session_manager.close_all()
+    await session_manager.close_all()
+    await browser_pool.close()
 
     # Close prediction market adapters (HTTP clients)
     for adapter in list(_prediction_market_adapters):
@@ -787,7 +815,7 @@ def get_feed_status(bookmaker: str) -> FeedStatus:
 
 
 @app.post("/feeds/control", response_model=FeedControlResponse)
-def control_feed(request: FeedControlRequest) -> FeedControlResponse:
+async def control_feed(request: FeedControlRequest) -> FeedControlResponse:
     """Control a feed (start, stop, restart)."""
     bookmaker = request.bookmaker
     action = request.action.lower()
@@ -797,19 +825,19 @@ def control_feed(request: FeedControlRequest) -> FeedControlResponse:
     
     try:
         if action == "start":
-            success = session_manager.ensure_logged_in(bookmaker)
+            success = await session_manager.ensure_logged_in(bookmaker)
             message = "Feed started" if success else "Failed to start feed"
         elif action == "stop":
             adapter = session_manager._adapters.get(bookmaker)
             if adapter:
-                adapter.close()
+                await session_manager.close_adapter(adapter)
             success = True
             message = "Feed stopped"
         elif action == "restart":
             adapter = session_manager._adapters.get(bookmaker)
             if adapter:
-                adapter.close()
-            success = session_manager.ensure_logged_in(bookmaker)
+                await session_manager.close_adapter(adapter)
+            success = await session_manager.ensure_logged_in(bookmaker)
             message = "Feed restarted" if success else "Failed to restart feed"
         else:
             raise HTTPException(status_code=400, detail=f"Unknown action: {action}")
@@ -1024,16 +1052,16 @@ async def diagnostics_overlap(
 
 
 @app.post("/scrape/{bookmaker}", response_model=ScrapeResult)
-def scrape_bookmaker(bookmaker: str) -> ScrapeResult:
+async def scrape_bookmaker(bookmaker: str) -> ScrapeResult:
     """
     Manually trigger a scrape for a specific bookmaker.
-    This is a synchronous operation that returns the scraped odds.
+    The request waits for the scrape and returns the scraped odds.
     """
     if bookmaker not in session_manager._configs:
         raise HTTPException(status_code=404, detail=f"Feed not found: {bookmaker}")
 
     # Ensure logged in
-    if not session_manager.ensure_logged_in(bookmaker):
+    if not await session_manager.ensure_logged_in(bookmaker):
         return ScrapeResult(
             bookmaker=bookmaker,
             success=False,
@@ -1049,7 +1077,7 @@ def scrape_bookmaker(bookmaker: str) -> ScrapeResult:
             error="Adapter not available",
         )
 
-    return adapter.scrape()
+    return await _scrape_adapter(adapter)
 
 
 @app.post("/scrape-and-push/{bookmaker}", response_model=ScrapeResult)
@@ -1059,7 +1087,7 @@ async def scrape_and_push(bookmaker: str) -> ScrapeResult:
     This is the main endpoint for live data ingestion.
     """
     # First scrape
-    result = scrape_bookmaker(bookmaker)
+    result = await scrape_bookmaker(bookmaker)
 
     if not result.success or not result.odds:
         return result
@@ -1069,7 +1097,8 @@ async def scrape_and_push(bookmaker: str) -> ScrapeResult:
         async with httpx.AsyncClient(timeout=30.0) as client:
             response = await client.post(
                 f"{ODDS_INGEST_URL}/process",
-                json=[odds.model_dump(mode="json") for odds in result.odds],
+                content=_odds_json(result.odds),
+                headers=_JSON_HEADERS,
             )
             response.raise_for_status()
             logger.info(f"[{bookmaker}] Pushed {len(result.odds)} odds to odds_ingest")
@@ -1094,7 +1123,7 @@ async def scrape_all_feeds() -> Dict[str, ScrapeResult]:
             continue
 
         try:
-            result = scrape_bookmaker(bookmaker)
+            result = await scrape_bookmaker(bookmaker)
             results[bookmaker] = result
 
             if result.success and result.odds:
@@ -1114,7 +1143,8 @@ async def scrape_all_feeds() -> Dict[str, ScrapeResult]:
             async with httpx.AsyncClient(timeout=30.0) as client:
                 response = await client.post(
                     f"{ODDS_INGEST_URL}/process",
-                    json=[odds.model_dump(mode="json") for odds in all_odds],
+                    content=_odds_json(all_odds),
+                    headers=_JSON_HEADERS,
                 )
                 response.raise_for_status()
                 logger.info(f"Pushed {len(all_odds)} total odds to odds_ingest")
@@ -1254,7 +1284,8 @@ async def odds_api_fetch_and_push(
         async with httpx.AsyncClient(timeout=30.0) as client:
             response = await client.post(
                 f"{ODDS_INGEST_URL}/process",
-                json=[odds.model_dump(mode="json") for odds in result.odds],
+                content=_odds_json(result.odds),
+                headers=_JSON_HEADERS,
             )
             response.raise_for_status()
 
@@ -1341,7 +1372,7 @@ async def scrape_live_odds(bookmaker: str) -> ScrapeResult:
         )
 
     # Ensure logged in (may trigger 2FA flow)
-    if not session_manager.ensure_logged_in(bookmaker):
+    if not await session_manager.ensure_logged_in(bookmaker):
         return ScrapeResult(
             bookmaker=bookmaker,
             success=False,
@@ -1357,7 +1388,7 @@ async def scrape_live_odds(bookmaker: str) -> ScrapeResult:
             error="Adapter not available",
         )
 
-    return adapter.scrape()
+    return await _scrape_adapter(adapter)
 
 
 @app.post("/live/scrape-and-push/{bookmaker}")
@@ -1381,7 +1412,8 @@ async def scrape_live_and_push(bookmaker: str) -> Dict:
         async with httpx.AsyncClient(timeout=30.0) as client:
             response = await client.post(
                 f"{ODDS_INGEST_URL}/process",
-                json=[odds.model_dump(mode="json") for odds in result.odds],
+                content=_odds_json(result.odds),
+                headers=_JSON_HEADERS,
             )
             response.raise_for_status()
 
@@ -1474,7 +1506,7 @@ async def visual_login(bookmaker: str, timeout_seconds: int = 300) -> Dict:
             if bookmaker_lower in session_manager._adapters:
                 old_adapter = session_manager._adapters.pop(bookmaker_lower)
                 try:
-                    old_adapter.close()
+                    await session_manager.close_adapter(old_adapter)
                 except Exception:
                     pass
 
@@ -1594,7 +1626,7 @@ async def place_bet(request: BetRequest) -> BetResponse:
         )
 
     # Ensure logged in
-    if not session_manager.ensure_logged_in(bookmaker):
+    if not await session_manager.ensure_logged_in(bookmaker):
         return BetResponse(
             bet_id=request.bet_id,
             bookmaker=bookmaker,
@@ -8,6 +8,8 @@ Supports two modes:
 """
 from __future__ import annotations
 
+import asyncio
+import inspect
 import json
 import logging
 import os
@@ -15,13 +17,14 @@ import threading
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from shared.schemas import BookmakerCredentials, FeedConfig, FeedStatus, SessionStatus
 from .adapters.base import BaseFeedAdapter
 from .adapters.generic import GenericSportsbookAdapter
 from .adapters.http_adapter import HTTPFeedAdapter
 from .adapters.intercepting_adapter import InterceptingAdapter
+from .adapters.playwright_generic import PlaywrightGenericAdapter
 from .adapters.draftkings_public_api import DraftKingsPublicAPIAdapter
 from .adapters.odds_api_adapter import OddsAPIAdapter
 
@@ -40,6 +43,10 @@ DK_USE_AUTH_API = os.getenv("DK_USE_AUTH_API", "true").lower() == "true"
 USE_ODDS_API = os.getenv("USE_ODDS_API", "true").lower() == "true"
 ODDS_API_KEY = os.getenv("ODDS_API_KEY")
 
+# Browser engine for books without a dedicated adapter: "playwright" (one
+# persistent CDP connection) or "selenium" (legacy WebDriver path)
+FEED_BROWSER_ENGINE = os.getenv("FEED_BROWSER_ENGINE", "playwright").lower()
+
 # Log the environment variable values at startup
 logger.info(f"DK_USE_PUBLIC_API={DK_USE_PUBLIC_API}, DK_USE_AUTH_API={DK_USE_AUTH_API}")
 logger.info(f"USE_ODDS_API={USE_ODDS_API}, ODDS_API_KEY={'***' if ODDS_API_KEY else 'NOT_SET'}")
@@ -81,16 +88,24 @@ class SessionManager:
             self._credentials[bookmaker] = credentials
             logger.info(f"Registered feed for {bookmaker}")
     
-    def unregister_feed(self, bookmaker: str) -> None:
+    async def unregister_feed(self, bookmaker: str) -> None:
         """Unregister and close a feed."""
         with self._lock:
-            if bookmaker in self._adapters:
-                self._adapters[bookmaker].close()
-                del self._adapters[bookmaker]
+            adapter = self._adapters.pop(bookmaker, None)
             self._configs.pop(bookmaker, None)
             self._credentials.pop(bookmaker, None)
             self._last_login_attempt.pop(bookmaker, None)
-            logger.info(f"Unregistered feed for {bookmaker}")
+        if adapter is not None:
+            await self.close_adapter(adapter)
+        logger.info(f"Unregistered feed for {bookmaker}")
+
+    @staticmethod
+    async def close_adapter(adapter: Any) -> None:
+        """Close an adapter, awaiting async (Playwright) ones."""
+        if inspect.iscoroutinefunction(adapter.close):
+            await adapter.close()
+        else:
+            adapter.close()
     
     def get_adapter(self, bookmaker: str) -> Optional[BaseFeedAdapter]:
         """Get or create an adapter for a bookmaker."""
@@ -115,7 +130,8 @@ class SessionManager:
         Priority for other bookmakers:
         1. HTTPFeedAdapter when cookies are available (fastest, most reliable)
         2. InterceptingAdapter for CT sportsbooks (Playwright + API interception)
-        3. GenericSportsbookAdapter fallback (Selenium, legacy)
+        3. PlaywrightGenericAdapter fallback (GenericSportsbookAdapter, i.e.
+           Selenium, when FEED_BROWSER_ENGINE=selenium)
         """
         config = self._configs[bookmaker]
         credentials = self._credentials[bookmaker]
@@ -170,7 +186,12 @@ class SessionManager:
             # The actual browser initialization happens when login() is called
             return InterceptingAdapter(config, credentials)
 
-        # Fall back to Selenium adapter (may not work in Docker)
+        if FEED_BROWSER_ENGINE != "selenium":
+            logger.info(f"[{bookmaker}] Using PlaywrightGenericAdapter (no cookies)")
+            # Async like InterceptingAdapter: the browser starts on first login()
+            return PlaywrightGenericAdapter(config, credentials)
+
+        # Legacy Selenium adapter (may not work in Docker)
         logger.info(f"[{bookmaker}] Using GenericSportsbookAdapter (no cookies)")
         return GenericSportsbookAdapter(config, credentials)
     
@@ -191,7 +212,7 @@ class SessionManager:
             logger.warning(f"[{bookmaker}] Failed to load cookies: {e}")
             return None
 
-    def ensure_logged_in(self, bookmaker: str) -> bool:
+    async def ensure_logged_in(self, bookmaker: str) -> bool:
         """
         Ensure the adapter is logged in, attempting login if needed.
         Returns True if logged in, False otherwise.
@@ -221,12 +242,13 @@ class SessionManager:
                         extra={"event_type": "adapter_switch", "bookmaker": bookmaker}
                     )
                     with self._lock:
-                        # Close old adapter
-                        if bookmaker in self._adapters:
-                            self._adapters[bookmaker].close()
+                        old_adapter = self._adapters.pop(bookmaker, None)
                         # Create new HTTP adapter
                         self._adapters[bookmaker] = self._create_adapter(bookmaker)
                         adapter = self._adapters[bookmaker]
+                    # Close old adapter
+                    if old_adapter is not None:
+                        await self.close_adapter(old_adapter)
                 elif not adapter.session_status.session_valid:
                     browser_logger.info(
                         f"Using imported cookies for {bookmaker} ({len(cookies)} cookies)",
@@ -276,7 +298,12 @@ class SessionManager:
         self._last_login_attempt[bookmaker] = datetime.utcnow()
 
         start_time = time.time()
-        success = adapter.login()
+        if inspect.iscoroutinefunction(adapter.login):
+            # Playwright adapters log in on this loop, which owns their browser
+            success = await adapter.login()
+        else:
+            # Blocking (Selenium) logins run off the event loop
+            success = await asyncio.to_thread(adapter.login)
         duration_ms = int((time.time() - start_time) * 1000)
 
         if success:
@@ -345,13 +372,17 @@ class SessionManager:
         from .adapters.odds_api_wrapper import OddsAPIWrapperAdapter
         return OddsAPIWrapperAdapter(odds_api_adapter, config, credentials)
 
-    def close_all(self) -> None:
+    async def close_all(self) -> None:
         """Close all adapter sessions."""
         with self._lock:
-            for adapter in self._adapters.values():
-                adapter.close()
+            adapters = list(self._adapters.values())
             self._adapters.clear()
-            logger.info("Closed all adapter sessions")
+        for adapter in adapters:
+            try:
+                await self.close_adapter(adapter)
+            except Exception as e:
+                logger.warning(f"[{adapter.bookmaker}] Error closing adapter: {e}")
+        logger.info("Closed all adapter sessions")
 
 
 # Global session manager instance
@@ -29,11 +29,10 @@ from playwright.async_api import (
     Browser,
     BrowserContext,
     Page,
-    Playwright,
-    async_playwright,
 )
 
 from shared.schemas import ProxyConfig
+from .browser_pool import browser_pool
 
 logger = logging.getLogger(__name__)
 browser_logger = logging.getLogger("market_feed.browser.stealth")
@@ -183,7 +182,6 @@ class StealthBrowser:
         self.session_dir.mkdir(parents=True, exist_ok=True)
 
         self.fingerprint = generate_fingerprint(geo)
-        self.playwright: Optional[Playwright] = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
@@ -203,19 +201,6 @@ class StealthBrowser:
         """Initialize Playwright browser with stealth settings."""
         logger.info(f"[{self.bookmaker}] Initializing stealth browser (geo={self.geo})")
 
-        self.playwright = await async_playwright().start()
-
-        # Launch args for maximum stealth
-        launch_args = [
-            "--disable-blink-features=AutomationControlled",
-            "--disable-dev-shm-usage",
-            "--no-sandbox",
-            "--disable-setuid-sandbox",
-            "--disable-web-security",
-            "--disable-features=IsolateOrigins,site-per-process",
-            "--disable-site-isolation-trials",
-        ]
-
         # Proxy configuration
         proxy_config = None
         if self.proxy:
@@ -226,12 +211,8 @@ class StealthBrowser:
                 proxy_config["username"] = self.proxy.username
                 proxy_config["password"] = self.proxy.password
 
-        # Launch browser
-        self.browser = await self.playwright.chromium.launch(
-            headless=self.headless,
-            args=launch_args,
-            proxy=proxy_config,
-        )
+        # Lease a shared Chromium; the context below is ours alone
+        self.browser = await browser_pool.acquire(headless=self.headless, proxy=proxy_config)
 
         # Create context with fingerprint
         self.context = await self.browser.new_context(
@@ -601,10 +582,10 @@ class StealthBrowser:
             await self.page.close()
         if self.context:
             await self.context.close()
+            self.context = None
         if self.browser:
-            await self.browser.close()
-        if self.playwright:
-            await self.playwright.stop()
+            await browser_pool.release(self.browser)
+            self.browser = None
 
         logger.info(f"[{self.bookmaker}] Browser closed")
 
@@ -0,0 +1,41 @@
+"""
+Tests for the generic sportsbook adapter's lxml odds extraction.
+"""
+import pytest
+
+from shared.schemas import BookmakerCredentials, FeedConfig
+
+pytest.importorskip("lxml")
+pytest.importorskip("cssselect")
+generic = pytest.importorskip("services.market_feed.app.adapters.generic")
+
+PAGE = """
+<html><body>
+  <div class="event">
+    <div class="selection">Lakers <b class="odds">2.50</b></div>
+    <div class="selection">Celtics <b class="odds">1.65</b></div>
+  </div>
+</body></html>
+"""
+
+
+def _adapter(**selectors):
+    config = FeedConfig(bookmaker="examplebook", extra_config=selectors)
+    credentials = BookmakerCredentials(bookmaker="examplebook", username="user", password="pass")
+    return generic.GenericSportsbookAdapter(config, credentials)
+
+
+def test_unconfigured_selectors_do_not_take_container_text():
+    """Without id/sport/market selectors the defaults apply, not the event's whole text."""
+    adapter = _adapter(
+        event_container_selector=".event",
+        selection_selector=".selection",
+        odds_selector=".odds",
+    )
+
+    odds = adapter._extract_odds_from_html(PAGE)
+
+    assert [(o.selection, o.odds_decimal) for o in odds] == [("Lakers", 2.5), ("Celtics", 1.65)]
+    assert {o.sport for o in odds} == {"unknown"}
+    assert {o.market for o in odds} == {"match_winner"}
+    assert all(o.event_id.startswith("event_") for o in odds)
@@ -0,0 +1,158 @@
+"""
+Tests for the manual market_feed scrape endpoints.
+"""
+import httpx
+import pytest
+
+from shared.schemas import (
+    BookmakerCredentials,
+    FeedConfig,
+    MarketOdds,
+    ScrapeResult,
+    SessionStatus,
+)
+
+main = pytest.importorskip("services.market_feed.app.main")
+from fastapi.testclient import TestClient  # noqa: E402
+
+from services.market_feed.app.adapters.draftkings_public_api import (  # noqa: E402
+    DraftKingsPublicAPIAdapter,
+)
+
+NAVIGATION = {
+    "navigation": [
+        {"sports": [{"name": "Basketball", "eventGroups": [{"eventGroupId": 42648}]}]}
+    ]
+}
+EVENT_GROUP = {
+    "eventGroup": {
+        "events": [
+            {
+                "eventId": 1001,
+                "name": "Lakers vs Celtics",
+                "eventGroupName": "NBA",
+                "displayGroups": [
+                    {
+                        "markets": [
+                            {
+                                "description": "Moneyline",
+                                "outcomes": [
+                                    {"description": "Lakers", "oddsAmerican": "+110"},
+                                    {"description": "Celtics", "oddsAmerican": "-130"},
+                                ],
+                            }
+                        ]
+                    }
+                ],
+            }
+        ]
+    }
+}
+
+
+def _draftkings_api(request: httpx.Request) -> httpx.Response:
+    if "navigation" in request.url.path:
+        return httpx.Response(200, json=NAVIGATION)
+    return httpx.Response(200, json=EVENT_GROUP)
+
+
+class _AsyncAdapter:
+    """Stand-in for a Playwright adapter: login, scrape and close are coroutines."""
+
+    def __init__(self, bookmaker):
+        self.bookmaker = bookmaker
+        self.session_status = SessionStatus(bookmaker=bookmaker)
+        self._scrape_count = 0
+        self._error_count = 0
+        self.logins = 0
+        self.closes = 0
+
+    async def login(self):
+        self.logins += 1
+        self.session_status.logged_in = True
+        self.session_status.session_valid = True
+        return True
+
+    async def scrape(self):
+        self._scrape_count += 1
+        return ScrapeResult(bookmaker=self.bookmaker, success=True, odds=[
+            MarketOdds(event_id="e1", sport="nba", market="moneyline",
+                       bookmaker=self.bookmaker, selection="Lakers", odds_decimal=2.1),
+        ])
+
+    async def close(self):
+        self.closes += 1
+        self.session_status.logged_in = False
+        self.session_status.session_valid = False
+
+
+@pytest.fixture
+def feed(monkeypatch):
+    """Register a feed with the session manager and hand back a setter for its adapter."""
+    manager = main.session_manager
+    # Nothing listens on odds_ingest here; the push fails and is only logged
+    monkeypatch.setattr(main, "ODDS_INGEST_URL", "http://127.0.0.1:9")
+    # Fresh login history so one test's attempt doesn't rate-limit the next
+    monkeypatch.setattr(manager, "_last_login_attempt", {})
+
+    def install(bookmaker, adapter):
+        monkeypatch.setitem(manager._configs, bookmaker, FeedConfig(bookmaker=bookmaker))
+        monkeypatch.setitem(
+            manager._credentials,
+            bookmaker,
+            BookmakerCredentials(bookmaker=bookmaker, username="user", password="pass"),
+        )
+        monkeypatch.setitem(manager._adapters, bookmaker, adapter)
+        return adapter
+
+    return install
+
+
+def test_scrape_and_push_draftkings_public_api(feed, monkeypatch):
+    """The public DK adapter is awaited, not asyncio.run() inside the endpoint's loop."""
+    monkeypatch.setattr(DraftKingsPublicAPIAdapter, "_nav_cache", None)
+    adapter = feed("draftkings", DraftKingsPublicAPIAdapter(
+        FeedConfig(bookmaker="draftkings"),
+        BookmakerCredentials(bookmaker="draftkings", username="user", password="pass"),
+    ))
+    adapter._min_request_interval_s = 0
+    monkeypatch.setattr(adapter, "_new_client", lambda: httpx.AsyncClient(
+        transport=httpx.MockTransport(_draftkings_api),
+    ))
+
+    # No context manager: startup would register env feeds and start pollers
+    response = TestClient(main.app).post("/scrape-and-push/draftkings")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["success"] is True
+    assert sorted(o["selection"] for o in body["odds"]) == ["Celtics", "Lakers"]
+    assert {o["sport"] for o in body["odds"]} == {"nba"}
+
+
+def test_scrape_and_push_async_adapter(feed):
+    """Async adapters are logged in and scraped on the endpoint's loop."""
+    adapter = feed("caesars", _AsyncAdapter("caesars"))
+
+    response = TestClient(main.app).post("/scrape-and-push/caesars")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["success"] is True
+    assert [o["selection"] for o in body["odds"]] == ["Lakers"]
+    assert adapter.logins == 1
+
+
+def test_feed_control_awaits_async_adapter(feed):
+    """Stop really closes an async adapter and start really logs it back in."""
+    adapter = feed("caesars", _AsyncAdapter("caesars"))
+    client = TestClient(main.app)
+
+    stopped = client.post("/feeds/control", json={"bookmaker": "caesars", "action": "stop"})
+    assert stopped.json()["success"] is True
+    assert adapter.closes == 1
+
+    started = client.post("/feeds/control", json={"bookmaker": "caesars", "action": "start"})
+    assert started.json()["success"] is True
+    assert started.json()["status"]["running"] is True
+    assert adapter.logins == 1